@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Throughput benchmark of the validate.py pipeline on synthetic SDRF files.
+
+For every combination of --rows and --organisms a synthetic SDRF is generated and validated in a fresh
+process, with the organisms and ontology terms looked up in a local OLS stand-in, recording rows/sec,
+files/sec, the wall time per validation phase, the peak RSS and whether the cells were validated on the
+distinct values of each column, so that a fallback to validating every row shows up. Results are
+appended as JSON lines so that runs can be compared:
+
+    python benchmarks/bench_validate.py --output bench.jsonl
+    python benchmarks/bench_validate.py --output new.jsonl --compare bench.jsonl --threshold 0.2
+
+The exit code is 1 if the validation of any configuration crashed, or with --compare if the rows/sec
+of any configuration dropped by more than the threshold; crashed runs are never compared.
+"""
+
+import argparse
+import datetime
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ols_standin import start_server
+from synthetic_sdrf import generate_sdrf, taxa_for, organism_names
+
+DEFAULT_ROWS = [10, 100, 1000, 10000, 100000]
+DEFAULT_ORGANISMS = [1, 5, 50]
+
+
+def run_validation(sdrf_file, ols_url, unique_values, repeat):
+    """Validate sdrf_file `repeat` times; run in a fresh process so that the peak RSS is its own."""
+    import validate
+    from validation_report import timed, peak_rss_kb
+    from sdrf_pipelines.sdrf import sdrf_schema
+    from sdrf_pipelines.zooma import ols
+
+    # the ontology term validations of sdrf-pipelines go to the stand-in too
+    sdrf_schema.client = ols.OlsClient(ols_base=ols_url)
+    prepass = {}
+    with timed(prepass, 'organism resolution'):
+        validate.organism_templates.update(
+            validate.resolve_organisms(validate.collect_organisms([sdrf_file]), ols_url=ols_url))
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = validate.validate_sdrf(sdrf_file, unique_values=unique_values)
+        runs.append((time.perf_counter() - start, res))
+    wall_time, res = min(runs, key=lambda r: r[0])
+    return {'wall_time': wall_time, 'status': res['status'], 'crashed': res['crashed'],
+            'compressed': res['compressed'], 'phases': res['timings'], 'prepass': prepass['organism resolution'], 'peak_rss_kb': peak_rss_kb()}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def sdrf_pipelines_version():
+    try:
+        return importlib.metadata.version('sdrf-pipelines')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def config_key(record):
+    return (record['rows'], record['organisms'], record['cardinality'], record['tmt'], record['unique_values'])
+
+
+def compare(records, baseline_file, threshold):
+    """Print the change of rows/sec against the last baseline record of each configuration and return the regressions."""
+    baseline = {}
+    with open(baseline_file) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                baseline[config_key(record)] = record
+    regressions = []
+    for record in records:
+        old = baseline.get(config_key(record))
+        if old is None:
+            continue
+        if record['crashed'] or old.get('crashed'):
+            print('{:>7} rows {:>3} organisms: not compared, the {} run crashed'.format(
+                record['rows'], record['organisms'], 'new' if record['crashed'] else 'baseline'))
+            continue
+        if not old['rows_per_second']:
+            continue
+        change = record['rows_per_second'] / old['rows_per_second'] - 1
+        print('{:>7} rows {:>3} organisms: {:>12.1f} -> {:>12.1f} rows/sec ({:+.1%}){}'.format(
+            record['rows'], record['organisms'], old['rows_per_second'], record['rows_per_second'], change,
+            '' if record['compressed'] == old.get('compressed') else ' (compressed {} -> {})'.format(
+                old.get('compressed'), record['compressed'])))
+        if change < -threshold:
+            regressions.append(record)
+    return regressions
+
+
+def main(args):
+    taxa = taxa_for(organism_names(max(args.organisms)))
+    server, ols_url = start_server(taxa=taxa, latency=args.ols_latency)
+    meta = {'created': datetime.datetime.now().isoformat(timespec='seconds'), 'commit': git_commit(),
+            'python': platform.python_version(), 'sdrf-pipelines': sdrf_pipelines_version()}
+    records = []
+    context = multiprocessing.get_context('spawn')
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for rows in args.rows:
+                for organisms in args.organisms:
+                    if organisms > rows:
+                        continue
+                    sdrf_file = os.path.join(tmp, 'synthetic-{}-{}.sdrf.tsv'.format(rows, organisms))
+                    generate_sdrf(sdrf_file, rows, organisms, args.cardinality, args.tmt, args.seed)
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                        result = executor.submit(run_validation, sdrf_file, ols_url, not args.all_rows,
+                                                 args.repeat).result()
+                    wall_time = result['wall_time']
+                    # the time of a crashed validation says nothing about throughput
+                    measured = wall_time > 0 and not result['crashed']
+                    record = dict(meta, rows=rows, organisms=organisms, cardinality=args.cardinality,
+                                  tmt=args.tmt, unique_values=not args.all_rows, size=os.path.getsize(sdrf_file),
+                                  rows_per_second=rows / wall_time if measured else None,
+                                  files_per_second=1 / wall_time if measured else None, **result)
+                    records.append(record)
+                    print('{:>7} rows {:>3} organisms: {:8.3f} s, {:>12.1f} rows/sec, peak RSS {} KB{}{}'.format(
+                        rows, organisms, wall_time, record['rows_per_second'] or 0, result['peak_rss_kb'],
+                        ' (crashed)' if result['crashed'] else '',
+                        # a silent fallback to validating every row would make the numbers meaningless
+                        ' (all rows)' if not args.all_rows and not result['compressed'] else ''))
+    finally:
+        server.shutdown()
+
+    if args.output:
+        with open(args.output, 'a') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+    status = 0
+    crashed = [record for record in records if record['crashed']]
+    if crashed:
+        print('{} configurations crashed'.format(len(crashed)))
+        status = 1
+    if args.compare:
+        regressions = compare(records, args.compare, args.threshold)
+        if regressions:
+            print('{} configurations are more than {:.0%} slower than the baseline'.format(
+                len(regressions), args.threshold))
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark validate.py on synthetic SDRF files')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--organisms', type=int, nargs='+', default=DEFAULT_ORGANISMS)
+    parser.add_argument('--cardinality', type=float, default=0.01,
+                        help='Fraction of distinct values in the sample annotation columns (default: %(default)s)')
+    parser.add_argument('--tmt', action='store_true', help='Generate TMT instead of label free files')
+    parser.add_argument('--all-rows', action='store_true', help='Validate every row (see validate.py --all-rows)')
+    parser.add_argument('--repeat', type=int, default=1, help='Validations per file; the fastest is kept')
+    parser.add_argument('--ols-latency', type=float, default=0.0, help='Latency of the OLS stand-in in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help='Append the results to this JSON lines file')
+    parser.add_argument('--compare', help='JSON lines file with baseline results')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative drop in rows/sec reported as a regression (default: %(default)s)')
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Generator of synthetic SDRF files for benchmarking validate.py.
+
+The number of rows, the number of organisms and the cardinality of the sample annotation columns are
+controlled, so that validation cost can be measured against each of them:
+
+    python benchmarks/synthetic_sdrf.py -o synthetic.sdrf.tsv --rows 10000 --organisms 5 --cardinality 0.01
+
+As in real SDRFs, the data file differs on every row while the other columns repeat: every run is
+split into 12 fractions, every sample is measured in 2 technical replicate runs and the label channels
+of TMT share their raw files.
+
+Organisms are taken from the taxa known to ols_standin.py; beyond those, synthetic species are added
+together with matching stand-in taxa (see taxa_for()).
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ols_standin import TAXA, VERTEBRATES, INVERTEBRATES, PLANTS
+
+SYNTHETIC_TAXON_ID = 900000
+
+COLUMNS = ['source name', 'characteristics[organism]', 'characteristics[organism part]',
+           'characteristics[disease]', 'characteristics[cell type]', 'characteristics[individual]',
+           'characteristics[biological replicate]', 'assay name', 'technology type', 'comment[data file]',
+           'comment[technical replicate]', 'comment[fraction identifier]', 'comment[label]',
+           'comment[instrument]', 'comment[modification parameters]', 'comment[modification parameters]',
+           'comment[cleavage agent details]', 'comment[precursor mass tolerance]',
+           'comment[fragment mass tolerance]', 'factor value[disease]']
+
+ORGANISM_PARTS = ['liver', 'brain', 'kidney', 'heart', 'lung', 'blood plasma', 'colon', 'skin', 'spleen', 'muscle']
+DISEASES = ['normal', 'breast carcinoma', 'hepatocellular carcinoma', 'glioblastoma', 'colorectal cancer',
+            'type 2 diabetes mellitus', 'alzheimer disease', 'melanoma']
+LABELS = ['AC=MS:1002038;NT=label free sample']
+TMT_LABELS = ['TMT126', 'TMT127N', 'TMT127C', 'TMT128N', 'TMT128C', 'TMT129N', 'TMT129C', 'TMT130N',
+              'TMT130C', 'TMT131']
+
+
+def organism_names(n):
+    """n organism names: the known non-human stand-in taxa first, then synthetic species."""
+    known = [name for name in TAXA if name != 'homo sapiens']
+    names = ['homo sapiens'] + known
+    return names[:n] + ['synthetic species {}'.format(i) for i in range(max(0, n - len(names)))]
+
+
+def taxa_for(names):
+    """Stand-in taxa table covering the organism names, for ols_standin.start_server(taxa=...)."""
+    taxa = dict(TAXA)
+    lineages = [VERTEBRATES, INVERTEBRATES, PLANTS]
+    for i, name in enumerate(names):
+        if name not in taxa:
+            taxa[name] = (SYNTHETIC_TAXON_ID + i, lineages[i % len(lineages)])
+    return taxa
+
+
+def value_pool(values, rows, cardinality):
+    """Distinct values for a column of `rows` rows: `cardinality` is the fraction of distinct values."""
+    n = max(1, int(rows * cardinality))
+    return [values[i % len(values)] + ('' if i < len(values) else ' {}'.format(i)) for i in range(n)]
+
+
+def generate_sdrf(path, rows, organisms=1, cardinality=0.01, tmt=False, seed=0):
+    """Write a synthetic SDRF with the given number of rows and organisms and return the organism names."""
+    rng = random.Random(seed)
+    names = organism_names(organisms)
+    parts = value_pool(ORGANISM_PARTS, rows, cardinality)
+    diseases = value_pool(DISEASES, rows, cardinality)
+    individuals = ['individual {}'.format(i) for i in range(max(1, int(rows * cardinality)))]
+    labels = TMT_LABELS if tmt else LABELS
+    fractions = 12
+    technical_replicates = 2
+    biological_replicates = 3
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerow(COLUMNS)
+        for i in range(rows):
+            # every raw file holds all label channels, every run is split into `fractions` files
+            fraction = (i // len(labels)) % fractions + 1
+            run = i // (len(labels) * fractions)
+            # every sample is measured in technical_replicates runs; biological replicates cycle over samples
+            sample = (run // technical_replicates) * len(labels) + i % len(labels)
+            disease = rng.choice(diseases)
+            writer.writerow([
+                'sample {}'.format(sample),
+                names[sample % len(names)],
+                rng.choice(parts),
+                disease,
+                'not available',
+                rng.choice(individuals),
+                str(sample % biological_replicates + 1),
+                'run {}'.format(run),
+                'proteomic profiling by mass spectrometry',
+                'file_{}_fr{:02d}.raw'.format(run, fraction),
+                str(run % technical_replicates + 1),
+                str(fraction),
+                labels[i % len(labels)],
+                'NT=Q Exactive HF;AC=MS:1002523',
+                'NT=Oxidation;MT=Variable;TA=M;AC=UNIMOD:35',
+                'NT=Carbamidomethyl;TA=C;MT=fixed;AC=UNIMOD:4',
+                'AC=MS:1001251;NT=Trypsin',
+                '10 ppm',
+                '0.02 Da',
+                disease,
+            ])
+    return names
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic SDRF file')
+    parser.add_argument('-o', '--output', required=True)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--organisms', type=int, default=1)
+    parser.add_argument('--cardinality', type=float, default=0.01,
+                        help='Fraction of distinct values in the sample annotation columns (default: %(default)s)')
+    parser.add_argument('--tmt', action='store_true', help='Use TMT labels instead of label free')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    generate_sdrf(args.output, args.rows, args.organisms, args.cardinality, args.tmt, args.seed)
@@ -1,44 +1,227 @@
-import requests
 """
 This script reads a FASTA file containing contaminants and fetches the description line from UniProt API.
+
+Accessions are resolved in batches, with several batches in flight over a pooled HTTP session, and the
+fetched header lines are kept in a local cache, so that reruns and new contaminant releases only fetch
+accessions that were not seen before; accessions UniProt has no entry for are cached as not found. The
+cache is extended as soon as a batch is fetched. A batch that still fails after the retries is split in
+halves that are fetched again, down to single accessions, so that one bad accession only fails itself;
+failed accessions are reported and left for the next run. Secondary (merged) accessions are answered by
+UniProt with the entry of their primary accession, and isoforms may be answered with their canonical
+entry; both are mapped back to the accession requested.
 """
 
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Base URL for UniProt API
-base_url = 'https://www.uniprot.org/uniprot/'
-
-# Function to fetch and parse the description line from FASTA
-def fetch_description(accession):
-    url = f'{base_url}{accession}.fasta'
-    response = requests.get(url)
-    if response.status_code == 200:
-        fasta_data = response.text
-        description_line = fasta_data.split('\n')[0]
-        return description_line
-    else:
-        return f'Error: {response.status_code} for accession {accession}'
-
-# Read fasta file and get the accessions for every protein, get the description line and write back
-# to a new fasta file.
-
-with open('contaminants-202105-uniprot.fasta', 'r') as file:
-    f = open('contaminants-202105-uniprot-description.fasta', 'w')
-    # Read the contaminants file
-    for line in file:
-        line = line.strip()
-        if line.startswith('>'):
-            id_arr = line.split('|')[1]
-            accession = id_arr.replace("CONTAM_", "")
-            # Fetch the description line
-            description = fetch_description(accession)
-            add_unknown = None
-            if "GN=" not in description:
-                add_unknown = " GN=unknown"
-            description = description.split(' ')[1:]
-            if add_unknown:
-                description.append(add_unknown)
-            accession = line + ' ' + ' '.join(description)
-            f.write(f'{accession}\n')
-        else:
-            f.write(f'{line}\n')
-
-f.close()
\ No newline at end of file
+base_url = 'https://rest.uniprot.org'
+
+BATCH_SIZE = 100
+# kept with the other caches of this repository, not in the working directory
+CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'multiomics-configs',
+                          'uniprot-headers-cache.tsv')
+# cached header of the accessions UniProt has no entry for
+NOT_FOUND = ''
+
+
+def make_session(concurrency, retries=5):
+    """HTTP session with a connection pool per host and retries with backoff on rate limits and server errors."""
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=('GET',))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_pages(session, url, params):
+    """Text of every page of a UniProt REST response, following the Link: rel="next" headers."""
+    pages = []
+    while url:
+        response = session.get(url, params=params, timeout=60)
+        response.raise_for_status()
+        pages.append(response.text)
+        # the next link carries the query
+        url = response.links.get('next', {}).get('url')
+        params = None
+    return pages
+
+
+def primary_accessions(session, accessions, url=base_url):
+    """{secondary accession: primary accession} of the accessions that are secondary accessions of an entry."""
+    query = ' OR '.join(f'sec_acc:{accession}' for accession in accessions)
+    requested = set(accessions)
+    primaries = {}
+    for text in get_pages(session, f'{url}/uniprotkb/search',
+                          {'query': query, 'fields': 'accession,sec_acc', 'format': 'tsv', 'size': 500}):
+        for row in text.split('\n')[1:]:
+            primary, _, secondaries = row.partition('\t')
+            for secondary in secondaries.split(';'):
+                if secondary.strip() in requested:
+                    primaries[secondary.strip()] = primary
+    return primaries
+
+
+def fetch_batch(session, accessions, url=base_url):
+    """Fetch the FASTA header lines of a batch of accessions.
+
+    Returns {requested accession: header line}, with NOT_FOUND for the accessions without an entry.
+    """
+    headers = {}
+    for text in get_pages(session, f'{url}/uniprotkb/accessions',
+                          {'accessions': ','.join(accessions), 'format': 'fasta', 'size': len(accessions)}):
+        for line in text.split('\n'):
+            if line.startswith('>'):
+                fields = line.split('|')
+                if len(fields) > 1:
+                    headers[fields[1]] = line
+    found = {accession: headers[accession] for accession in accessions if accession in headers}
+    # isoforms (P01044-1) can be answered with their canonical entry
+    for accession in accessions:
+        if accession not in found and accession.split('-')[0] in headers:
+            found[accession] = headers[accession.split('-')[0]]
+    unmatched = [accession for accession in accessions if accession not in found]
+    # entries returned under another accession answer secondary accessions of the batch; the primary
+    # accession may be in the batch too, so the entries returned cannot tell whether there are any
+    if unmatched:
+        for secondary, primary in primary_accessions(session, unmatched, url).items():
+            if primary in headers:
+                found[secondary] = headers[primary]
+    return {accession: found.get(accession, NOT_FOUND) for accession in accessions}
+
+
+def fetch_descriptions(accessions, url=base_url, batch_size=BATCH_SIZE, concurrency=4, on_batch=None):
+    """Fetch the header lines of all accessions in batches, with up to `concurrency` requests at a time.
+
+    on_batch is called with the header lines of every batch as soon as it is fetched. A batch that fails
+    is fetched again in halves, down to single accessions. Returns the header lines and the accessions
+    that failed.
+    """
+    batches = [accessions[i:i + batch_size] for i in range(0, len(accessions), batch_size)]
+    session = make_session(concurrency)
+    headers = {}
+    failed = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {executor.submit(fetch_batch, session, batch, url): batch for batch in batches}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                try:
+                    result = future.result()
+                except requests.RequestException as e:
+                    if len(batch) > 1:
+                        half = len(batch) // 2
+                        for part in (batch[:half], batch[half:]):
+                            pending[executor.submit(fetch_batch, session, part, url)] = part
+                    else:
+                        print(f'Error: accession {batch[0]} could not be fetched: {e}', file=sys.stderr)
+                        failed.append(batch[0])
+                    continue
+                headers.update(result)
+                if on_batch:
+                    on_batch(result)
+    session.close()
+    return headers, failed
+
+
+def read_cache(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, newline='') as f:
+        return {row[0]: row[1] for row in csv.reader(f, delimiter='\t') if len(row) == 2}
+
+
+def write_cache(path, headers, mode='w'):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode, newline='') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        for accession in sorted(headers):
+            writer.writerow([accession, headers[accession]])
+
+
+def contaminant_accession(line):
+    id_arr = line.split('|')[1]
+    return id_arr.replace("CONTAM_", "")
+
+
+def describe(line, description):
+    """Append the description of the UniProt header line to the contaminant header line."""
+    add_unknown = None
+    if "GN=" not in description:
+        add_unknown = " GN=unknown"
+    description = description.split(' ')[1:]
+    if add_unknown:
+        description.append(add_unknown)
+    return line + ' ' + ' '.join(description)
+
+
+def add_descriptions(input_file, output_file, cache_file=CACHE_FILE, url=base_url, batch_size=BATCH_SIZE,
+                     concurrency=4, refetch_not_found=False):
+    # Read fasta file and get the accessions for every protein, get the description line and write back
+    # to a new fasta file.
+    with open(input_file, 'r') as file:
+        lines = [line.strip() for line in file]
+    accessions = sorted({contaminant_accession(line) for line in lines if line.startswith('>')})
+
+    cache = read_cache(cache_file) if cache_file else {}
+    if refetch_not_found:
+        cache = {accession: header for accession, header in cache.items() if header != NOT_FOUND}
+    missing = [accession for accession in accessions if accession not in cache]
+    failed = []
+    if missing:
+        on_batch = (lambda headers: write_cache(cache_file, headers, 'a')) if cache_file else None
+        fetched, failed = fetch_descriptions(missing, url, batch_size, concurrency, on_batch)
+        cache.update(fetched)
+        if cache_file:
+            # rewritten sorted, without the duplicates appended by earlier interrupted runs
+            write_cache(cache_file, cache)
+    not_found = sum(cache.get(accession) == NOT_FOUND for accession in accessions)
+    fetched = sum(cache.get(accession, NOT_FOUND) != NOT_FOUND for accession in missing)
+    print(f'{len(accessions)} accessions: {len(accessions) - len(missing)} from cache, {fetched} fetched, '
+          f'{not_found} not found, {len(failed)} failed', file=sys.stderr)
+    failed = set(failed)
+
+    with open(output_file, 'w') as f:
+        for line in lines:
+            if line.startswith('>'):
+                accession = contaminant_accession(line)
+                description = cache.get(accession)
+                if description is None and accession in failed:
+                    description = f'Error: could not be fetched for accession {accession}'
+                elif not description:
+                    print(f'Error: no UniProt entry for accession {accession}', file=sys.stderr)
+                    description = f'Error: not found for accession {accession}'
+                f.write(f'{describe(line, description)}\n')
+            else:
+                f.write(f'{line}\n')
+    return len(failed)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Add UniProt descriptions to the contaminants database.')
+    parser.add_argument('input_file', nargs='?', default='contaminants-202105-uniprot.fasta')
+    parser.add_argument('output_file', nargs='?', default='contaminants-202105-uniprot-description.fasta')
+    parser.add_argument('--cache', default=CACHE_FILE, help='Cache of fetched header lines (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true', help='Fetch all accessions and do not write a cache')
+    parser.add_argument('--refetch-not-found', action='store_true',
+                        help='Fetch again the accessions cached as not found in UniProt')
+    parser.add_argument('--url', default=base_url, help='UniProt REST API (default: %(default)s)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent requests (default: %(default)s)')
+    args = parser.parse_args()
+    failed = add_descriptions(args.input_file, args.output_file, None if args.no_cache else args.cache, args.url,
+                              args.batch_size, args.concurrency, args.refetch_not_found)
+    if failed:
+        print(f'{failed} accessions could not be fetched; run again to fetch them', file=sys.stderr)
+        sys.exit(1)
@@ -2,148 +2,271 @@
 cosmic_user_name=""
 cosmic_password=""
 cbio_study_id="ccle_broad_2019"
-output_dir="sample_specific_dbs"
-
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD002395-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD002395-Sample-14.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD002395-Sample-26.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005698-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005698-Sample-2.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005698-Sample-3.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005698-Sample-4.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005698-Sample-5.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name COLO-205 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values COLO205_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005940-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RXF393 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RXF393_KIDNEY --add_reference true --decoy true --final_database_protein PXD005940-Sample-2.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name PC-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values PC3_PROSTATE --add_reference true --decoy true --final_database_protein PXD005940-Sample-3.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H460 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH460_LUNG --add_reference true --decoy true --final_database_protein PXD005940-Sample-4.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name U251 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values U251MG_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005940-Sample-5.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-OV-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKOV3_OVARY --add_reference true --decoy true --final_database_protein PXD005940-Sample-6.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name M14 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values M14_SKIN --add_reference true --decoy true --final_database_protein PXD005940-Sample-7.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --add_reference true --decoy true --final_database_protein PXD005940-Sample-8.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CCRF-CEM --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005940-Sample-9.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name K-562 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005942-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name Hs-578-T --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HS578T_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-10.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name BT-549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values BT549_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-11.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-28 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL28_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-12.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MDA-MB-231 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MDAMB231_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-13.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SW620 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SW620_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-14.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-257 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC257_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-15.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name LOXIMVI --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values LOXIMVI_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-16.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UO31_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-17.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR5_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-18.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name 786-0 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values 786O_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-19.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name EKVX --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values EKVX_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-2.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC62_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-20.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H460 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH460_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-21.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SN12C --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SN12C_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-22.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name IGROV-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values IGROV1_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-23.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H23 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH23_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-24.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name PC-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values PC3_PROSTATE --add_reference true --decoy true --final_database_protein PXD005942-Sample-25.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF295 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF295_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-26.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SR  --add_reference true --decoy true --final_database_protein PXD005942-Sample-27.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-2 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL2_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-28.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NIHOVCAR3_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-29.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP62_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-3.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-116 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT116_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-30.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CCRF-CEM --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005942-Sample-31.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-OV-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKOV3_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-32.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MOLT-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005942-Sample-33.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name DU-145 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values DU145_PROSTATE --add_reference true --decoy true --final_database_protein PXD005942-Sample-34.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RPMI-8226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005942-Sample-35.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HT-29 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HT29_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-36.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name TK10 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values TK10_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-37.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H322M --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH322M_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-38.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH226_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-39.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-92 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP92_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-4.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RXF393 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RXF393_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-40.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MALME3M_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-41.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name KM12 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values KM12_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-42.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB19_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-43.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name COLO-205 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values COLO205_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-44.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CAKI-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CAKI1_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-45.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-46.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name ACHN --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values ACHN_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-47.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-15 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT15_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-48.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name U251 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values U251MG_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-49.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF268 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF268_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-5.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCC2998 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCC2998_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005942-Sample-50.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SNB75 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB75_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-51.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-8 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR8_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-52.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H522 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH522_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-53.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-54.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A498 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A498_KIDNEY --add_reference true --decoy true --final_database_protein PXD005942-Sample-55.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR4_OVARY --add_reference true --decoy true --final_database_protein PXD005942-Sample-56.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF539 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF539_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005942-Sample-57.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name M14 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values M14_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-58.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL5_SKIN --add_reference true --decoy true --final_database_protein PXD005942-Sample-59.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HL-60 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005942-Sample-6.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name T47D --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values T47D_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-7.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MDA-MB-453 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MDAMB453_BREAST --add_reference true --decoy true --final_database_protein PXD005942-Sample-8.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005942-Sample-9.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H522 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH522_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name T47D --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values T47D_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-10.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SR  --add_reference true --decoy true --final_database_protein PXD005946-Sample-12.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MDA-MB-231 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MDAMB231_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-13.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name LOXIMVI --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values LOXIMVI_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-14.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SNB75 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB75_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-15.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name M14 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values M14_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-16.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-17.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HT-29 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HT29_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-18.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH226_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-19.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCC2998 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCC2998_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-2.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RXF393 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RXF393_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-20.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name U251 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values U251MG_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-21.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL5_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-22.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-OV-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKOV3_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-23.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name DU-145 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values DU145_PROSTATE --add_reference true --decoy true --final_database_protein PXD005946-Sample-24.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NIHOVCAR3_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-25.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name IGROV-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values IGROV1_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-26.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-2 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL2_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-27.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SR  --add_reference true --decoy true --final_database_protein PXD005946-Sample-28.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR4_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-29.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SN12C --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SN12C_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-3.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC62_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-30.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name COLO-205 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values COLO205_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-31.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-257 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC257_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-32.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB19_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-33.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name 786-0 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values 786O_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-34.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HL-60 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005946-Sample-35.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SW620 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SW620_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-36.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-37.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A498 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A498_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-38.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CCRF-CEM --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005946-Sample-39.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name Hs-578-T --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HS578T_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-4.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H23 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH23_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-40.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MALME3M_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-41.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true  --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UO31_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-42.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name TK10 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values TK10_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-43.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-92 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP92_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-44.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-116 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT116_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-45.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H322M --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH322M_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-46.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name ACHN --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values ACHN_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-47.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-15 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT15_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-48.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CAKI-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CAKI1_KIDNEY --add_reference true --decoy true --final_database_protein PXD005946-Sample-49.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name K-562 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005946-Sample-5.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF539 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF539_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-50.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RPMI-8226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005946-Sample-51.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF295 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF295_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-52.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MOLT-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --add_reference true --decoy true --final_database_protein PXD005946-Sample-53.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-54.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR5_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-55.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-92 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP92_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-56.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF268 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF268_CENTRAL_NERVOUS_SYSTEM --add_reference true --decoy true --final_database_protein PXD005946-Sample-57.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H460 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH460_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-58.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-8 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR8_OVARY --add_reference true --decoy true --final_database_protein PXD005946-Sample-59.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name BT-549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values BT549_BREAST --add_reference true --decoy true --final_database_protein PXD005946-Sample-6.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name PC-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values PC3_PROSTATE --add_reference true --decoy true --final_database_protein PXD005946-Sample-60.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name KM12 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values KM12_LARGE_INTESTINE --add_reference true --decoy true --final_database_protein PXD005946-Sample-61.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name EKVX --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values EKVX_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-7.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP62_LUNG --add_reference true --decoy true --final_database_protein PXD005946-Sample-8.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-28 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL28_SKIN --add_reference true --decoy true --final_database_protein PXD005946-Sample-9.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --add_reference true --decoy true --final_database_protein PXD015270-Sample-1.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H1975 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH1975_LUNG --add_reference true --decoy true --final_database_protein PXD015270-Sample-2.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H446 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH446_LUNG --add_reference true --decoy true --final_database_protein PXD015270-Sample-3.fa --outdir $output_dir -resume
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H69 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH69_LUNG --add_reference true --decoy true --final_database_protein PXD015270-Sample-4.fa --outdir $output_dir -resume
-
-#Final database: refprot + ncrna
-nextflow main.nf -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --final_database_protein refprot_altorfs_ncrna_pesudogenes.fa.fa --outdir $output_dir -resume
+output_dir="$PWD/sample_specific_dbs"
+pipeline="$PWD/main.nf"
+
+mkdir -p runs/cbio-MALME3M_SKIN-576b4fbd && (cd runs/cbio-MALME3M_SKIN-576b4fbd && nextflow run $pipeline -profile lsf,conda --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MALME3M_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cbio-MALME3M_SKIN-576b4fbd.fa --outdir $output_dir/builds/cbio-MALME3M_SKIN-576b4fbd -resume)
+ln -sf builds/cbio-MALME3M_SKIN-576b4fbd/cbio-MALME3M_SKIN-576b4fbd.fa $output_dir/PXD005942-Sample-41.fa
+ln -sf builds/cbio-MALME3M_SKIN-576b4fbd/cbio-MALME3M_SKIN-576b4fbd.fa $output_dir/PXD005946-Sample-41.fa
+
+mkdir -p runs/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc && (cd runs/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc && nextflow run $pipeline -profile lsf,conda --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB19_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc.fa --outdir $output_dir/builds/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc -resume)
+ln -sf builds/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc.fa $output_dir/PXD005942-Sample-43.fa
+ln -sf builds/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc/cbio-SNB19_CENTRAL_NERVOUS_SYSTEM-6491f6cc.fa $output_dir/PXD005946-Sample-33.fa
+
+mkdir -p runs/cbio-UO31_KIDNEY-65d6c156 && (cd runs/cbio-UO31_KIDNEY-65d6c156 && nextflow run $pipeline -profile lsf,conda --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UO31_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cbio-UO31_KIDNEY-65d6c156.fa --outdir $output_dir/builds/cbio-UO31_KIDNEY-65d6c156 -resume)
+ln -sf builds/cbio-UO31_KIDNEY-65d6c156/cbio-UO31_KIDNEY-65d6c156.fa $output_dir/PXD005942-Sample-17.fa
+ln -sf builds/cbio-UO31_KIDNEY-65d6c156/cbio-UO31_KIDNEY-65d6c156.fa $output_dir/PXD005946-Sample-42.fa
+
+mkdir -p runs/cosmic-786-0_cbio-786O_KIDNEY-dca5d922 && (cd runs/cosmic-786-0_cbio-786O_KIDNEY-dca5d922 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name 786-0 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values 786O_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-786-0_cbio-786O_KIDNEY-dca5d922.fa --outdir $output_dir/builds/cosmic-786-0_cbio-786O_KIDNEY-dca5d922 -resume)
+ln -sf builds/cosmic-786-0_cbio-786O_KIDNEY-dca5d922/cosmic-786-0_cbio-786O_KIDNEY-dca5d922.fa $output_dir/PXD005942-Sample-19.fa
+ln -sf builds/cosmic-786-0_cbio-786O_KIDNEY-dca5d922/cosmic-786-0_cbio-786O_KIDNEY-dca5d922.fa $output_dir/PXD005946-Sample-34.fa
+
+mkdir -p runs/cosmic-A498_cbio-A498_KIDNEY-5f813afe && (cd runs/cosmic-A498_cbio-A498_KIDNEY-5f813afe && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A498 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A498_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-A498_cbio-A498_KIDNEY-5f813afe.fa --outdir $output_dir/builds/cosmic-A498_cbio-A498_KIDNEY-5f813afe -resume)
+ln -sf builds/cosmic-A498_cbio-A498_KIDNEY-5f813afe/cosmic-A498_cbio-A498_KIDNEY-5f813afe.fa $output_dir/PXD005942-Sample-55.fa
+ln -sf builds/cosmic-A498_cbio-A498_KIDNEY-5f813afe/cosmic-A498_cbio-A498_KIDNEY-5f813afe.fa $output_dir/PXD005946-Sample-38.fa
+
+mkdir -p runs/cosmic-A549_cbio-A549_LUNG-27e20a19 && (cd runs/cosmic-A549_cbio-A549_LUNG-27e20a19 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name A549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values A549_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-A549_cbio-A549_LUNG-27e20a19.fa --outdir $output_dir/builds/cosmic-A549_cbio-A549_LUNG-27e20a19 -resume)
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD002395-Sample-1.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD002395-Sample-14.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD002395-Sample-26.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005698-Sample-1.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005698-Sample-2.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005698-Sample-3.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005698-Sample-4.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005698-Sample-5.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005942-Sample-9.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD005946-Sample-37.fa
+ln -sf builds/cosmic-A549_cbio-A549_LUNG-27e20a19/cosmic-A549_cbio-A549_LUNG-27e20a19.fa $output_dir/PXD015270-Sample-1.fa
+
+mkdir -p runs/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28 && (cd runs/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name ACHN --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values ACHN_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28.fa --outdir $output_dir/builds/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28 -resume)
+ln -sf builds/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28.fa $output_dir/PXD005942-Sample-47.fa
+ln -sf builds/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28/cosmic-ACHN_cbio-ACHN_KIDNEY-50b67f28.fa $output_dir/PXD005946-Sample-47.fa
+
+mkdir -p runs/cosmic-BT-549_cbio-BT549_BREAST-13c0e633 && (cd runs/cosmic-BT-549_cbio-BT549_BREAST-13c0e633 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name BT-549 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values BT549_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-BT-549_cbio-BT549_BREAST-13c0e633.fa --outdir $output_dir/builds/cosmic-BT-549_cbio-BT549_BREAST-13c0e633 -resume)
+ln -sf builds/cosmic-BT-549_cbio-BT549_BREAST-13c0e633/cosmic-BT-549_cbio-BT549_BREAST-13c0e633.fa $output_dir/PXD005942-Sample-11.fa
+ln -sf builds/cosmic-BT-549_cbio-BT549_BREAST-13c0e633/cosmic-BT-549_cbio-BT549_BREAST-13c0e633.fa $output_dir/PXD005946-Sample-6.fa
+
+mkdir -p runs/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21 && (cd runs/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CAKI-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CAKI1_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21.fa --outdir $output_dir/builds/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21 -resume)
+ln -sf builds/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21.fa $output_dir/PXD005942-Sample-45.fa
+ln -sf builds/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21/cosmic-CAKI-1_cbio-CAKI1_KIDNEY-537c5d21.fa $output_dir/PXD005946-Sample-49.fa
+
+mkdir -p runs/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1 && (cd runs/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name CCRF-CEM --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1.fa --outdir $output_dir/builds/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1 -resume)
+ln -sf builds/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1.fa $output_dir/PXD005940-Sample-9.fa
+ln -sf builds/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1.fa $output_dir/PXD005942-Sample-31.fa
+ln -sf builds/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1/cosmic-CCRF-CEM_cbio-CCRFCEM_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-b9f32da1.fa $output_dir/PXD005946-Sample-39.fa
+
+mkdir -p runs/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42 && (cd runs/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name COLO-205 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values COLO205_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42.fa --outdir $output_dir/builds/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42 -resume)
+ln -sf builds/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42.fa $output_dir/PXD005940-Sample-1.fa
+ln -sf builds/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42.fa $output_dir/PXD005942-Sample-44.fa
+ln -sf builds/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42/cosmic-COLO-205_cbio-COLO205_LARGE_INTESTINE-79edce42.fa $output_dir/PXD005946-Sample-31.fa
+
+mkdir -p runs/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf && (cd runs/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name DU-145 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values DU145_PROSTATE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf.fa --outdir $output_dir/builds/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf -resume)
+ln -sf builds/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf.fa $output_dir/PXD005942-Sample-34.fa
+ln -sf builds/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf/cosmic-DU-145_cbio-DU145_PROSTATE-d43498bf.fa $output_dir/PXD005946-Sample-24.fa
+
+mkdir -p runs/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd && (cd runs/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name EKVX --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values EKVX_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd.fa --outdir $output_dir/builds/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd -resume)
+ln -sf builds/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd.fa $output_dir/PXD005942-Sample-2.fa
+ln -sf builds/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd/cosmic-EKVX_cbio-EKVX_LUNG-45de9cbd.fa $output_dir/PXD005946-Sample-7.fa
+
+mkdir -p runs/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974 && (cd runs/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCC2998 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCC2998_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974.fa --outdir $output_dir/builds/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974 -resume)
+ln -sf builds/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974.fa $output_dir/PXD005942-Sample-50.fa
+ln -sf builds/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974/cosmic-HCC2998_cbio-HCC2998_LARGE_INTESTINE-7d03e974.fa $output_dir/PXD005946-Sample-2.fa
+
+mkdir -p runs/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da && (cd runs/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-116 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT116_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da.fa --outdir $output_dir/builds/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da -resume)
+ln -sf builds/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da.fa $output_dir/PXD005942-Sample-30.fa
+ln -sf builds/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da/cosmic-HCT-116_cbio-HCT116_LARGE_INTESTINE-861a31da.fa $output_dir/PXD005946-Sample-45.fa
+
+mkdir -p runs/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31 && (cd runs/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HCT-15 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HCT15_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31.fa --outdir $output_dir/builds/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31 -resume)
+ln -sf builds/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31.fa $output_dir/PXD005942-Sample-48.fa
+ln -sf builds/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31/cosmic-HCT-15_cbio-HCT15_LARGE_INTESTINE-927abc31.fa $output_dir/PXD005946-Sample-48.fa
+
+mkdir -p runs/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29 && (cd runs/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HL-60 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29.fa --outdir $output_dir/builds/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29 -resume)
+ln -sf builds/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29.fa $output_dir/PXD005942-Sample-6.fa
+ln -sf builds/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29/cosmic-HL-60_cbio-HL60_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-1a441d29.fa $output_dir/PXD005946-Sample-35.fa
+
+mkdir -p runs/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a && (cd runs/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP62_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a.fa --outdir $output_dir/builds/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a -resume)
+ln -sf builds/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a.fa $output_dir/PXD005942-Sample-3.fa
+ln -sf builds/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a/cosmic-HOP-62_cbio-HOP62_LUNG-cb350e4a.fa $output_dir/PXD005946-Sample-8.fa
+
+mkdir -p runs/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55 && (cd runs/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HOP-92 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HOP92_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55.fa --outdir $output_dir/builds/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55 -resume)
+ln -sf builds/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55.fa $output_dir/PXD005942-Sample-4.fa
+ln -sf builds/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55.fa $output_dir/PXD005946-Sample-44.fa
+ln -sf builds/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55/cosmic-HOP-92_cbio-HOP92_LUNG-5b3d2a55.fa $output_dir/PXD005946-Sample-56.fa
+
+mkdir -p runs/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af && (cd runs/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name HT-29 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HT29_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af.fa --outdir $output_dir/builds/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af -resume)
+ln -sf builds/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af.fa $output_dir/PXD005942-Sample-36.fa
+ln -sf builds/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af/cosmic-HT-29_cbio-HT29_LARGE_INTESTINE-e11913af.fa $output_dir/PXD005946-Sample-18.fa
+
+mkdir -p runs/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170 && (cd runs/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name Hs-578-T --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values HS578T_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170.fa --outdir $output_dir/builds/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170 -resume)
+ln -sf builds/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170.fa $output_dir/PXD005942-Sample-10.fa
+ln -sf builds/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170/cosmic-Hs-578-T_cbio-HS578T_BREAST-c4abf170.fa $output_dir/PXD005946-Sample-4.fa
+
+mkdir -p runs/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2 && (cd runs/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name IGROV-1 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values IGROV1_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2.fa --outdir $output_dir/builds/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2 -resume)
+ln -sf builds/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2.fa $output_dir/PXD005942-Sample-23.fa
+ln -sf builds/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2/cosmic-IGROV-1_cbio-IGROV1_OVARY-9c5aa5c2.fa $output_dir/PXD005946-Sample-26.fa
+
+mkdir -p runs/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6 && (cd runs/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name K-562 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6.fa --outdir $output_dir/builds/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6 -resume)
+ln -sf builds/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6.fa $output_dir/PXD005942-Sample-1.fa
+ln -sf builds/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6/cosmic-K-562_cbio-K562_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-db6818e6.fa $output_dir/PXD005946-Sample-5.fa
+
+mkdir -p runs/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733 && (cd runs/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name KM12 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values KM12_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733.fa --outdir $output_dir/builds/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733 -resume)
+ln -sf builds/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733.fa $output_dir/PXD005942-Sample-42.fa
+ln -sf builds/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733/cosmic-KM12_cbio-KM12_LARGE_INTESTINE-17b0a733.fa $output_dir/PXD005946-Sample-61.fa
+
+mkdir -p runs/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438 && (cd runs/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name LOXIMVI --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values LOXIMVI_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438.fa --outdir $output_dir/builds/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438 -resume)
+ln -sf builds/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438.fa $output_dir/PXD005942-Sample-16.fa
+ln -sf builds/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438/cosmic-LOXIMVI_cbio-LOXIMVI_SKIN-e5b44438.fa $output_dir/PXD005946-Sample-14.fa
+
+mkdir -p runs/cosmic-M14_cbio-M14_SKIN-a430712d && (cd runs/cosmic-M14_cbio-M14_SKIN-a430712d && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name M14 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values M14_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-M14_cbio-M14_SKIN-a430712d.fa --outdir $output_dir/builds/cosmic-M14_cbio-M14_SKIN-a430712d -resume)
+ln -sf builds/cosmic-M14_cbio-M14_SKIN-a430712d/cosmic-M14_cbio-M14_SKIN-a430712d.fa $output_dir/PXD005940-Sample-7.fa
+ln -sf builds/cosmic-M14_cbio-M14_SKIN-a430712d/cosmic-M14_cbio-M14_SKIN-a430712d.fa $output_dir/PXD005942-Sample-58.fa
+ln -sf builds/cosmic-M14_cbio-M14_SKIN-a430712d/cosmic-M14_cbio-M14_SKIN-a430712d.fa $output_dir/PXD005946-Sample-16.fa
+
+mkdir -p runs/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed && (cd runs/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MCF7 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MCF7_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa --outdir $output_dir/builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed -resume)
+ln -sf builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa $output_dir/PXD005940-Sample-8.fa
+ln -sf builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa $output_dir/PXD005942-Sample-46.fa
+ln -sf builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa $output_dir/PXD005942-Sample-54.fa
+ln -sf builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa $output_dir/PXD005946-Sample-17.fa
+ln -sf builds/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed/cosmic-MCF7_cbio-MCF7_BREAST-444f78ed.fa $output_dir/PXD005946-Sample-54.fa
+
+mkdir -p runs/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336 && (cd runs/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MDA-MB-231 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MDAMB231_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336.fa --outdir $output_dir/builds/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336 -resume)
+ln -sf builds/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336.fa $output_dir/PXD005942-Sample-13.fa
+ln -sf builds/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336/cosmic-MDA-MB-231_cbio-MDAMB231_BREAST-f7f0a336.fa $output_dir/PXD005946-Sample-13.fa
+
+mkdir -p runs/cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c && (cd runs/cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MDA-MB-453 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MDAMB453_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c.fa --outdir $output_dir/builds/cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c -resume)
+ln -sf builds/cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c/cosmic-MDA-MB-453_cbio-MDAMB453_BREAST-fd21af7c.fa $output_dir/PXD005942-Sample-8.fa
+
+mkdir -p runs/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4 && (cd runs/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name MOLT-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4.fa --outdir $output_dir/builds/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4 -resume)
+ln -sf builds/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4.fa $output_dir/PXD005942-Sample-33.fa
+ln -sf builds/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4/cosmic-MOLT-4_cbio-MOLT4_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-74c133c4.fa $output_dir/PXD005946-Sample-53.fa
+
+mkdir -p runs/cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4 && (cd runs/cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H1975 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH1975_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4.fa --outdir $output_dir/builds/cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4 -resume)
+ln -sf builds/cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4/cosmic-NCI-H1975_cbio-NCIH1975_LUNG-d8b0b1e4.fa $output_dir/PXD015270-Sample-2.fa
+
+mkdir -p runs/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea && (cd runs/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH226_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea.fa --outdir $output_dir/builds/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea -resume)
+ln -sf builds/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea.fa $output_dir/PXD005942-Sample-39.fa
+ln -sf builds/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea/cosmic-NCI-H226_cbio-NCIH226_LUNG-8ca98bea.fa $output_dir/PXD005946-Sample-19.fa
+
+mkdir -p runs/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b && (cd runs/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H23 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH23_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b.fa --outdir $output_dir/builds/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b -resume)
+ln -sf builds/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b.fa $output_dir/PXD005942-Sample-24.fa
+ln -sf builds/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b/cosmic-NCI-H23_cbio-NCIH23_LUNG-b324ac5b.fa $output_dir/PXD005946-Sample-40.fa
+
+mkdir -p runs/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0 && (cd runs/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H322M --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH322M_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0.fa --outdir $output_dir/builds/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0 -resume)
+ln -sf builds/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0.fa $output_dir/PXD005942-Sample-38.fa
+ln -sf builds/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0/cosmic-NCI-H322M_cbio-NCIH322M_LUNG-b982c3c0.fa $output_dir/PXD005946-Sample-46.fa
+
+mkdir -p runs/cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8 && (cd runs/cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H446 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH446_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8.fa --outdir $output_dir/builds/cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8 -resume)
+ln -sf builds/cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8/cosmic-NCI-H446_cbio-NCIH446_LUNG-ea4538f8.fa $output_dir/PXD015270-Sample-3.fa
+
+mkdir -p runs/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb && (cd runs/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H460 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH460_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb.fa --outdir $output_dir/builds/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb -resume)
+ln -sf builds/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb.fa $output_dir/PXD005940-Sample-4.fa
+ln -sf builds/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb.fa $output_dir/PXD005942-Sample-21.fa
+ln -sf builds/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb/cosmic-NCI-H460_cbio-NCIH460_LUNG-e2dfcccb.fa $output_dir/PXD005946-Sample-58.fa
+
+mkdir -p runs/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e && (cd runs/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H522 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH522_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e.fa --outdir $output_dir/builds/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e -resume)
+ln -sf builds/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e.fa $output_dir/PXD005942-Sample-53.fa
+ln -sf builds/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e/cosmic-NCI-H522_cbio-NCIH522_LUNG-ee22028e.fa $output_dir/PXD005946-Sample-1.fa
+
+mkdir -p runs/cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b && (cd runs/cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name NCI-H69 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NCIH69_LUNG --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b.fa --outdir $output_dir/builds/cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b -resume)
+ln -sf builds/cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b/cosmic-NCI-H69_cbio-NCIH69_LUNG-921b7f9b.fa $output_dir/PXD015270-Sample-4.fa
+
+mkdir -p runs/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28 && (cd runs/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values NIHOVCAR3_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28.fa --outdir $output_dir/builds/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28 -resume)
+ln -sf builds/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28.fa $output_dir/PXD005942-Sample-29.fa
+ln -sf builds/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28/cosmic-OVCAR-3_cbio-NIHOVCAR3_OVARY-ba41ad28.fa $output_dir/PXD005946-Sample-25.fa
+
+mkdir -p runs/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11 && (cd runs/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-4 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR4_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11.fa --outdir $output_dir/builds/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11 -resume)
+ln -sf builds/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11.fa $output_dir/PXD005942-Sample-56.fa
+ln -sf builds/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11/cosmic-OVCAR-4_cbio-OVCAR4_OVARY-77eb5a11.fa $output_dir/PXD005946-Sample-29.fa
+
+mkdir -p runs/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f && (cd runs/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR5_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f.fa --outdir $output_dir/builds/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f -resume)
+ln -sf builds/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f.fa $output_dir/PXD005942-Sample-18.fa
+ln -sf builds/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f/cosmic-OVCAR-5_cbio-OVCAR5_OVARY-eb12e25f.fa $output_dir/PXD005946-Sample-55.fa
+
+mkdir -p runs/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff && (cd runs/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name OVCAR-8 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values OVCAR8_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff.fa --outdir $output_dir/builds/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff -resume)
+ln -sf builds/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff.fa $output_dir/PXD005942-Sample-52.fa
+ln -sf builds/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff/cosmic-OVCAR-8_cbio-OVCAR8_OVARY-08cc9eff.fa $output_dir/PXD005946-Sample-59.fa
+
+mkdir -p runs/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c && (cd runs/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name PC-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values PC3_PROSTATE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c.fa --outdir $output_dir/builds/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c -resume)
+ln -sf builds/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c.fa $output_dir/PXD005940-Sample-3.fa
+ln -sf builds/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c.fa $output_dir/PXD005942-Sample-25.fa
+ln -sf builds/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c/cosmic-PC-3_cbio-PC3_PROSTATE-feb1661c.fa $output_dir/PXD005946-Sample-60.fa
+
+mkdir -p runs/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157 && (cd runs/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RPMI-8226 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157.fa --outdir $output_dir/builds/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157 -resume)
+ln -sf builds/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157.fa $output_dir/PXD005942-Sample-35.fa
+ln -sf builds/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157/cosmic-RPMI-8226_cbio-RPMI8226_HAEMATOPOIETIC_AND_LYMPHOID_TISSUE-c698d157.fa $output_dir/PXD005946-Sample-51.fa
+
+mkdir -p runs/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6 && (cd runs/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name RXF393 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values RXF393_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6.fa --outdir $output_dir/builds/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6 -resume)
+ln -sf builds/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6.fa $output_dir/PXD005940-Sample-2.fa
+ln -sf builds/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6.fa $output_dir/PXD005942-Sample-40.fa
+ln -sf builds/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6/cosmic-RXF393_cbio-RXF393_KIDNEY-ecc030a6.fa $output_dir/PXD005946-Sample-20.fa
+
+mkdir -p runs/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752 && (cd runs/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF268 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF268_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752.fa --outdir $output_dir/builds/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752 -resume)
+ln -sf builds/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752.fa $output_dir/PXD005942-Sample-5.fa
+ln -sf builds/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752/cosmic-SF268_cbio-SF268_CENTRAL_NERVOUS_SYSTEM-e7e83752.fa $output_dir/PXD005946-Sample-57.fa
+
+mkdir -p runs/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65 && (cd runs/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF295 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF295_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65.fa --outdir $output_dir/builds/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65 -resume)
+ln -sf builds/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65.fa $output_dir/PXD005942-Sample-26.fa
+ln -sf builds/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65/cosmic-SF295_cbio-SF295_CENTRAL_NERVOUS_SYSTEM-ac018c65.fa $output_dir/PXD005946-Sample-52.fa
+
+mkdir -p runs/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089 && (cd runs/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SF539 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SF539_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089.fa --outdir $output_dir/builds/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089 -resume)
+ln -sf builds/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089.fa $output_dir/PXD005942-Sample-57.fa
+ln -sf builds/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089/cosmic-SF539_cbio-SF539_CENTRAL_NERVOUS_SYSTEM-69373089.fa $output_dir/PXD005946-Sample-50.fa
+
+mkdir -p runs/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc && (cd runs/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-28 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL28_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc.fa --outdir $output_dir/builds/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc -resume)
+ln -sf builds/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc.fa $output_dir/PXD005942-Sample-12.fa
+ln -sf builds/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc/cosmic-SK-MEL-28_cbio-SKMEL28_SKIN-b7206bdc.fa $output_dir/PXD005946-Sample-9.fa
+
+mkdir -p runs/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f && (cd runs/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-2 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL2_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f.fa --outdir $output_dir/builds/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f -resume)
+ln -sf builds/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f.fa $output_dir/PXD005942-Sample-28.fa
+ln -sf builds/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f/cosmic-SK-MEL-2_cbio-SKMEL2_SKIN-e827f71f.fa $output_dir/PXD005946-Sample-27.fa
+
+mkdir -p runs/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e && (cd runs/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-MEL-5 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKMEL5_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e.fa --outdir $output_dir/builds/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e -resume)
+ln -sf builds/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e.fa $output_dir/PXD005942-Sample-59.fa
+ln -sf builds/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e/cosmic-SK-MEL-5_cbio-SKMEL5_SKIN-99b5b66e.fa $output_dir/PXD005946-Sample-22.fa
+
+mkdir -p runs/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145 && (cd runs/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SK-OV-3 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SKOV3_OVARY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145.fa --outdir $output_dir/builds/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145 -resume)
+ln -sf builds/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145.fa $output_dir/PXD005940-Sample-6.fa
+ln -sf builds/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145.fa $output_dir/PXD005942-Sample-32.fa
+ln -sf builds/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145/cosmic-SK-OV-3_cbio-SKOV3_OVARY-709b9145.fa $output_dir/PXD005946-Sample-23.fa
+
+mkdir -p runs/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7 && (cd runs/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SN12C --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SN12C_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7.fa --outdir $output_dir/builds/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7 -resume)
+ln -sf builds/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7.fa $output_dir/PXD005942-Sample-22.fa
+ln -sf builds/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7/cosmic-SN12C_cbio-SN12C_KIDNEY-738d29e7.fa $output_dir/PXD005946-Sample-3.fa
+
+mkdir -p runs/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4 && (cd runs/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SNB75 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SNB75_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4.fa --outdir $output_dir/builds/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4 -resume)
+ln -sf builds/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4.fa $output_dir/PXD005942-Sample-51.fa
+ln -sf builds/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4/cosmic-SNB75_cbio-SNB75_CENTRAL_NERVOUS_SYSTEM-504c88b4.fa $output_dir/PXD005946-Sample-15.fa
+
+mkdir -p runs/cosmic-SR-86bcf3ea && (cd runs/cosmic-SR-86bcf3ea && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SR --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SR-86bcf3ea.fa --outdir $output_dir/builds/cosmic-SR-86bcf3ea -resume)
+ln -sf builds/cosmic-SR-86bcf3ea/cosmic-SR-86bcf3ea.fa $output_dir/PXD005942-Sample-27.fa
+ln -sf builds/cosmic-SR-86bcf3ea/cosmic-SR-86bcf3ea.fa $output_dir/PXD005946-Sample-12.fa
+ln -sf builds/cosmic-SR-86bcf3ea/cosmic-SR-86bcf3ea.fa $output_dir/PXD005946-Sample-28.fa
+
+mkdir -p runs/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089 && (cd runs/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name SW620 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values SW620_LARGE_INTESTINE --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089.fa --outdir $output_dir/builds/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089 -resume)
+ln -sf builds/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089.fa $output_dir/PXD005942-Sample-14.fa
+ln -sf builds/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089/cosmic-SW620_cbio-SW620_LARGE_INTESTINE-14de6089.fa $output_dir/PXD005946-Sample-36.fa
+
+mkdir -p runs/cosmic-T47D_cbio-T47D_BREAST-977f4a02 && (cd runs/cosmic-T47D_cbio-T47D_BREAST-977f4a02 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name T47D --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values T47D_BREAST --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-T47D_cbio-T47D_BREAST-977f4a02.fa --outdir $output_dir/builds/cosmic-T47D_cbio-T47D_BREAST-977f4a02 -resume)
+ln -sf builds/cosmic-T47D_cbio-T47D_BREAST-977f4a02/cosmic-T47D_cbio-T47D_BREAST-977f4a02.fa $output_dir/PXD005942-Sample-7.fa
+ln -sf builds/cosmic-T47D_cbio-T47D_BREAST-977f4a02/cosmic-T47D_cbio-T47D_BREAST-977f4a02.fa $output_dir/PXD005946-Sample-10.fa
+
+mkdir -p runs/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e && (cd runs/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name TK10 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values TK10_KIDNEY --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-TK10_cbio-TK10_KIDNEY-cb14790e.fa --outdir $output_dir/builds/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e -resume)
+ln -sf builds/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e.fa $output_dir/PXD005942-Sample-37.fa
+ln -sf builds/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e/cosmic-TK10_cbio-TK10_KIDNEY-cb14790e.fa $output_dir/PXD005946-Sample-43.fa
+
+mkdir -p runs/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba && (cd runs/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name U251 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values U251MG_CENTRAL_NERVOUS_SYSTEM --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba.fa --outdir $output_dir/builds/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba -resume)
+ln -sf builds/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba.fa $output_dir/PXD005940-Sample-5.fa
+ln -sf builds/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba.fa $output_dir/PXD005942-Sample-49.fa
+ln -sf builds/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba/cosmic-U251_cbio-U251MG_CENTRAL_NERVOUS_SYSTEM-940ec7ba.fa $output_dir/PXD005946-Sample-21.fa
+
+mkdir -p runs/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008 && (cd runs/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-257 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC257_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-UACC-257_cbio-UACC257_SKIN-227c4008.fa --outdir $output_dir/builds/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008 -resume)
+ln -sf builds/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008.fa $output_dir/PXD005942-Sample-15.fa
+ln -sf builds/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008/cosmic-UACC-257_cbio-UACC257_SKIN-227c4008.fa $output_dir/PXD005946-Sample-32.fa
+
+mkdir -p runs/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3 && (cd runs/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3 && nextflow run $pipeline -profile lsf,conda --cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name UACC-62 --cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values UACC62_SKIN --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --add_reference true --decoy true --final_database_protein cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3.fa --outdir $output_dir/builds/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3 -resume)
+ln -sf builds/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3.fa $output_dir/PXD005942-Sample-20.fa
+ln -sf builds/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3/cosmic-UACC-62_cbio-UACC62_SKIN-53a7a5b3.fa $output_dir/PXD005946-Sample-30.fa
+
+mkdir -p runs/refprot_altorfs_ncrna_pesudogenes && (cd runs/refprot_altorfs_ncrna_pesudogenes && nextflow run $pipeline -profile lsf,conda --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --final_database_protein refprot_altorfs_ncrna_pesudogenes.fa --outdir $output_dir/builds/refprot_altorfs_ncrna_pesudogenes -resume)
+ln -sf builds/refprot_altorfs_ncrna_pesudogenes/refprot_altorfs_ncrna_pesudogenes.fa $output_dir/refprot_altorfs_ncrna_pesudogenes.fa
+
@@ -3,9 +3,16 @@ Created on 10 Feb 2021
 
 @author: husen
 '''
+import os
+import re
 import sys
 import glob
+import json
+import pickle
+import shlex
+import hashlib
 import argparse
+from collections import Counter
 
 def parse_commandline_args():
     """
@@ -16,20 +23,71 @@ def parse_commandline_args():
                         help= "File containing all COSMIC cell line names, single column")
     parser.add_argument('-p', '--path_to_datasets', default = 'multiomics-configs/datasets/cancer-celllines-samples/sample-specific/', 
                         help= "Path to directory containing tsv files, each for a sample dataset")
-    parser.add_argument('-cl', '--clinical_samples_file', default = 'ccle_broad_2019_data_clinical_sample.txt', 
-                        help= "File containing all cBiportal clinical samples metadata")
+    parser.add_argument('-cl', '--clinical_samples_file', nargs='+', default = ['ccle_broad_2019_data_clinical_sample.txt'], 
+                        help= "Files containing all cBiportal clinical samples metadata, one per study (<study>_data_clinical_sample.txt)")
+    parser.add_argument('--cache_dir', default = '.pgdb_cache', 
+                        help= "Directory of the parsed clinical samples snapshots")
+    parser.add_argument('--pipeline', default = 'main.nf', 
+                        help= "pgdb pipeline run by the jobs")
+    parser.add_argument('--profile', default = 'docker', 
+                        help= "Nextflow profile of the jobs")
+    parser.add_argument('--output_dir', default = 'sample_specific_dbs', 
+                        help= "Directory of the sample databases")
+    parser.add_argument('--jobs_plan', default = 'pgdb_jobs.json', 
+                        help= "Job plan written for run_pgdb_jobs.py")
+    parser.add_argument('--mappings', default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cell_line_mappings.json'), 
+                        help= "Store of the cell line names resolved (or not) in previous runs")
+    parser.add_argument('--overrides', default = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cell_line_overrides.json'), 
+                        help= "Curated cell line name mappings, applied before any matching")
+    parser.add_argument('--rematch', action='store_true', 
+                        help= "Ignore the mappings store and match all cell line names again")
+    parser.add_argument('--extra_params', default = '--add_reference false', 
+                        help= "pgdb options added to every sample database job, e.g. "
+                              "--extra_params='--add_reference true --decoy true' (default: %(default)s)")
     
     return parser.parse_args(sys.argv[1:])
     
+def normalize_cell_name(cell_name):
+    """
+    Normalised form of a cell line name: case-folded, without ' cell', NCI- prefix, dashes, spaces and underscores
+    """
+    name = cell_name.casefold().replace(' cell', '')
+    name = name.replace('-', '').replace(' ', '').replace('_', '')
+    if name.startswith('nci'):
+        name = name[3:]
+    return name
+
+class CosmicNameIndex:
+    """
+    COSMIC cell line names indexed once for update_cell_name_cosmic: the names, their lower-case forms and
+    their normalised forms (only those shared by a single name)
+    """
+    def __init__(self, cosmic_cell_names):
+        self.names = set(cosmic_cell_names)
+        self.lower = {}
+        normalized = {}
+        for name in cosmic_cell_names:
+            self.lower.setdefault(name.lower(), name)
+            normalized.setdefault(normalize_cell_name(name), set()).add(name)
+        self.normalized = {key: names.pop() for key, names in normalized.items() if len(names) == 1}
+
+    def __contains__(self, cell_name):
+        return cell_name in self.names
+
+    def __len__(self):
+        return len(self.names)
+
 def update_cell_name_cosmic(cell_name, cosmic_cell_names):
+    if not isinstance(cosmic_cell_names, CosmicNameIndex):
+        cosmic_cell_names = CosmicNameIndex(cosmic_cell_names)
     if cell_name in cosmic_cell_names:
         return cell_name
     elif cell_name.upper() in cosmic_cell_names:
         return cell_name.upper()
     elif cell_name.lower() in cosmic_cell_names:
         return cell_name.lower()
-    elif cell_name.lower() in [x.lower() for x in cosmic_cell_names]:
-        return cosmic_cell_names[list([x.lower() for x in cosmic_cell_names]).index(cell_name.lower())]
+    elif cell_name.lower() in cosmic_cell_names.lower:
+        return cosmic_cell_names.lower[cell_name.lower()]
     elif cell_name.replace(' cell', '') in cosmic_cell_names:
         return cell_name.replace(' cell', '')
     elif 'NCI-'+cell_name in cosmic_cell_names:
@@ -49,10 +107,12 @@ def update_cell_name_cosmic(cell_name, cosmic_cell_names):
     elif cell_name == 'HTC116' and 'HCT-116' in cosmic_cell_names:
         return 'HTC116'
     else:
-        return None
+        return cosmic_cell_names.normalized.get(normalize_cell_name(cell_name))
     
-def get_sample_cellline_matches_cosmic(datasets, cosmic_cell_names, cosmic_cell_name_matches):
+def get_sample_cellline_matches_cosmic(datasets, cosmic_cell_names, cosmic_cell_name_matches, unresolved=None):
     
+    if unresolved is None:
+        unresolved = set()
     samples_celllines = {}
     cell_lines_not_in_cosmic = {}
     for dataset in datasets:
@@ -72,8 +132,12 @@ def get_sample_cellline_matches_cosmic(datasets, cosmic_cell_names, cosmic_cell_
                 try:
                     cell_name = cosmic_cell_name_matches[sl[cell_line_index]]
                 except KeyError:
-                    cell_name = update_cell_name_cosmic(cell_name, cosmic_cell_names)
+                    if cell_name in unresolved:
+                        cell_name = None
+                    else:
+                        cell_name = update_cell_name_cosmic(cell_name, cosmic_cell_names)
                 if not cell_name:
+                    unresolved.add(sl[cell_line_index])
                     try:
                         cell_lines_not_in_cosmic[sl[cell_line_index]].append(sl[id_index])
                     except KeyError:
@@ -86,37 +150,145 @@ def get_sample_cellline_matches_cosmic(datasets, cosmic_cell_names, cosmic_cell_
     
     return samples_celllines, cosmic_cell_name_matches, cell_lines_not_in_cosmic
 
-def get_sample_info_from_cbioportal(clinical_samples_file):
-    
-    output_file = clinical_samples_file.replace('.txt', '_info.tsv')
+def clinical_study_id(clinical_samples_file):
+    """
+    cBioPortal study id of a clinical samples file: <study>_data_clinical_sample.txt or <study>/data_clinical_sample.txt
+    """
+    name = os.path.basename(clinical_samples_file)
+    if name.endswith('_data_clinical_sample.txt'):
+        return name[:-len('_data_clinical_sample.txt')]
+    return os.path.basename(os.path.dirname(os.path.abspath(clinical_samples_file)))
+
+def parse_clinical_samples(clinical_samples_file):
+    """
+    {sample id: cancer type} of a cBioPortal clinical samples file; the cancer type is the sample id
+    when the file has no CANCER_TYPE column and empty when a line has no cancer type
+    """
     sample_ids_info = {}
+    cancer_types = {}
+    sample_id_index = None
+    cancer_type_index = 0
     with open(clinical_samples_file, 'r') as input_file:
-        sample_id_index = 0
-        cancer_type_index = 0
         for line in input_file:
             if 'STRING' in line or line.startswith('#'):
                 continue
             sl = line.strip().split('\t')
-            try:
+            if sample_id_index is None and 'SAMPLE_ID' in sl:
                 sample_id_index = sl.index('SAMPLE_ID')
-                if 'CANCER_TYPE' in sl:
-                    cancer_type_index = sl.index('CANCER_TYPE')
-                else:
-                    cancer_type_index = sample_id_index
-            except ValueError:
-                try:
-                    sample_ids_info[sl[sample_id_index]] = sl[cancer_type_index]
-                except IndexError:
-                    #some lines have no cancer type column
-                    sample_ids_info[sl[sample_id_index]] = ''
-            
+                cancer_type_index = sl.index('CANCER_TYPE') if 'CANCER_TYPE' in sl else sample_id_index
+                continue
+            try:
+                cancer_type = sl[cancer_type_index]
+            except IndexError:
+                #some lines have no cancer type column
+                cancer_type = ''
+            #a single string per cancer type keeps the cache small
+            sample_ids_info[sl[sample_id_index or 0]] = cancer_types.setdefault(cancer_type, cancer_type)
+    return sample_ids_info
+
+def clinical_cache_path(clinical_samples_file, cache_dir):
+    digest = hashlib.sha1(os.path.abspath(clinical_samples_file).encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, '{}.{}.pickle'.format(os.path.basename(clinical_samples_file), digest))
+
+def get_sample_info_from_cbioportal(clinical_samples_file, cache_dir=None):
+    """
+    {sample id: cancer type} of a clinical samples file, loaded from its snapshot in cache_dir when the
+    file has the same path, size and modification time; otherwise the file is parsed, the snapshot
+    and the _info.tsv table are written
+    """
+    stat = os.stat(clinical_samples_file)
+    key = {'source': os.path.abspath(clinical_samples_file), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    cache_file = clinical_cache_path(clinical_samples_file, cache_dir) if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as cache:
+                snapshot = pickle.load(cache)
+            if snapshot['key'] == key:
+                return snapshot['samples']
+        except (OSError, EOFError, KeyError, TypeError, pickle.UnpicklingError):
+            pass
+    
+    sample_ids_info = parse_clinical_samples(clinical_samples_file)
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file + '.tmp', 'wb') as cache:
+            pickle.dump({'key': key, 'samples': sample_ids_info}, cache, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_file + '.tmp', cache_file)
+    
+    output_file = clinical_samples_file.replace('.txt', '_info.tsv')
     with open(output_file, 'w') as output:
         for sample, info in sample_ids_info.items():
             output.write('{}\t{}\n'.format(sample, info))
             
     return sample_ids_info
 
+def load_cbioportal_samples(clinical_samples_files, cache_dir=None):
+    """
+    Merged {sample id: cancer type} and {sample id: study id} of several clinical samples files;
+    a sample id found in several studies is taken from the first one
+    """
+    sample_ids_info = {}
+    sample_studies = {}
+    for clinical_samples_file in clinical_samples_files:
+        study_id = clinical_study_id(clinical_samples_file)
+        for sample_id, info in get_sample_info_from_cbioportal(clinical_samples_file, cache_dir).items():
+            if sample_id not in sample_ids_info:
+                sample_ids_info[sample_id] = info
+                sample_studies[sample_id] = study_id
+    return sample_ids_info, sample_studies
+
+def trigrams(name):
+    name = '  ' + name + ' '
+    return {name[i:i+3] for i in range(len(name) - 2)}
+
+class CbioNameIndex:
+    """
+    cBioPortal sample ids (CCLE names such as HCT116_LARGE_INTESTINE) indexed once for update_cell_name_cbio:
+    the ids, their dash-stripped, underscore-stripped and NCI- forms, the prefix before the tissue
+    and a trigram index of the normalised prefixes to propose near matches. The ids are expected in
+    clinical samples file order: a prefix shared by several ids resolves to the first one read
+    """
+    def __init__(self, cbio_cell_names):
+        self.names = set(cbio_cell_names)
+        self.dash_stripped = {x.replace('-', '') for x in cbio_cell_names}
+        self.underscore_stripped = {x.replace('_', '') for x in cbio_cell_names}
+        self.nci = {'NCI-' + x for x in cbio_cell_names}
+        self.prefixes = {}
+        self.trigram_index = {}
+        self.trigram_counts = {}
+        for name in cbio_cell_names:
+            prefix = name.split('_')[0]
+            self.prefixes.setdefault(prefix, name)
+            name_trigrams = trigrams(normalize_cell_name(prefix))
+            self.trigram_counts[name] = len(name_trigrams)
+            for trigram in name_trigrams:
+                self.trigram_index.setdefault(trigram, set()).add(name)
+
+    def __contains__(self, cell_name):
+        return cell_name in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+    def suggest(self, cell_name, limit=3, min_score=0.5):
+        """
+        Near matches of a cell line name as (sample id, score) pairs, best first; the score is the Dice
+        coefficient of the trigrams of the normalised names
+        """
+        query = trigrams(normalize_cell_name(cell_name))
+        common = Counter()
+        for trigram in query:
+            common.update(self.trigram_index.get(trigram, ()))
+        scores = []
+        for name, count in common.items():
+            score = 2 * count / (len(query) + self.trigram_counts[name])
+            if score >= min_score:
+                scores.append((name, round(score, 2)))
+        return sorted(scores, key=lambda x: (-x[1], x[0]))[:limit]
+
 def update_cell_name_cbio(cell_name, cbio_cell_names):
+    if not isinstance(cbio_cell_names, CbioNameIndex):
+        cbio_cell_names = CbioNameIndex(cbio_cell_names)
     
     if cell_name in cbio_cell_names:
         return cell_name
@@ -130,25 +302,19 @@ def update_cell_name_cbio(cell_name, cbio_cell_names):
         return cell_name.upper().replace('-', '')
     elif 'NCI-'+cell_name in cbio_cell_names:
         return 'NCI-'+cell_name
-    elif cell_name in [x.replace('-', '') for x in cbio_cell_names]:
-        for x in cbio_cell_names:
-            if cell_name == x.replace('-',''):
-                return x.replace('-','')
-    elif cell_name in [x.replace('_', '') for x in cbio_cell_names]:
-        for x in cbio_cell_names:
-            if cell_name == x.replace('_',''):
-                return x.replace('_','')
-    elif cell_name in ['NCI-'+x for x in cbio_cell_names]:
-        for x in cbio_cell_names:
-            if cell_name == 'NCI-'+x:
-                return 'NCI-'+x
+    elif cell_name in cbio_cell_names.dash_stripped:
+        return cell_name
+    elif cell_name in cbio_cell_names.underscore_stripped:
+        return cell_name
+    elif cell_name in cbio_cell_names.nci:
+        return cell_name
     if cell_name.upper()+'_CERVIX' in cbio_cell_names:
         return cell_name.upper()+'_CERVIX'
-    elif cell_name.upper() in [x.split('_')[0] for x in cbio_cell_names]:
-        return cbio_cell_names[list([x.split('_')[0] for x in cbio_cell_names]).index(cell_name.upper())]
+    elif cell_name.upper() in cbio_cell_names.prefixes:
+        return cbio_cell_names.prefixes[cell_name.upper()]
     
-    elif cell_name.upper().replace('-','') in [x.split('_')[0] for x in cbio_cell_names]:
-        return cbio_cell_names[list([x.split('_')[0] for x in cbio_cell_names]).index(cell_name.upper().replace('-',''))]
+    elif cell_name.upper().replace('-','') in cbio_cell_names.prefixes:
+        return cbio_cell_names.prefixes[cell_name.upper().replace('-','')]
     
     elif cell_name == 'OVCAR-3' and 'NIHOVCAR3_OVARY' in cbio_cell_names:
         return 'NIHOVCAR3_OVARY'
@@ -163,8 +329,20 @@ def update_cell_name_cbio(cell_name, cbio_cell_names):
     else:
         return None
     
-def get_sample_cellline_matches_cbio(sample_ids_cbioportal, samples_celllines_cosmic):
-    
+def get_sample_cellline_matches_cbio(sample_ids_cbioportal, samples_celllines_cosmic, cbio_cell_name_matches=None,
+                                     unresolved=None, matched_from_cosmic=None):
+    """
+    matched_from_cosmic records, for each cell line name matched (or not) here, the COSMIC name it was
+    matched with: a cached match or unresolved name is matched again when its COSMIC name has changed
+    """
+    if not isinstance(sample_ids_cbioportal, CbioNameIndex):
+        sample_ids_cbioportal = CbioNameIndex(sample_ids_cbioportal.keys())
+    if cbio_cell_name_matches is None:
+        cbio_cell_name_matches = {}
+    if unresolved is None:
+        unresolved = set()
+    if matched_from_cosmic is None:
+        matched_from_cosmic = {}
     not_found_in_cbio = {}
     for sample, info in samples_celllines_cosmic.items():
         original_cell_name = info['original']
@@ -174,14 +352,23 @@ def get_sample_cellline_matches_cbio(sample_ids_cbioportal, samples_celllines_co
         except KeyError:
             cosmic_cell_name = None
             #continue
-        if cosmic_cell_name:
-            cell_name = update_cell_name_cbio(cosmic_cell_name, list(sample_ids_cbioportal.keys()))
-        if not cell_name:
-            cell_name = update_cell_name_cbio(original_cell_name, list(sample_ids_cbioportal.keys()))
+        if matched_from_cosmic.get(original_cell_name, cosmic_cell_name) != cosmic_cell_name:
+            cbio_cell_name_matches.pop(original_cell_name, None)
+            unresolved.discard(original_cell_name)
+        if original_cell_name in cbio_cell_name_matches:
+            cell_name = cbio_cell_name_matches[original_cell_name]
+        elif original_cell_name not in unresolved:
+            matched_from_cosmic[original_cell_name] = cosmic_cell_name
+            if cosmic_cell_name:
+                cell_name = update_cell_name_cbio(cosmic_cell_name, sample_ids_cbioportal)
+            if not cell_name:
+                cell_name = update_cell_name_cbio(original_cell_name, sample_ids_cbioportal)
         
         if cell_name:
             samples_celllines_cosmic[sample]['cbio'] = cell_name
+            cbio_cell_name_matches[original_cell_name] = cell_name
         else:
+            unresolved.add(original_cell_name)
             try:
                 not_found_in_cbio[original_cell_name].append(sample)
             except KeyError:
@@ -191,65 +378,172 @@ def get_sample_cellline_matches_cbio(sample_ids_cbioportal, samples_celllines_co
     
     
 
+def names_digest(names):
+    return hashlib.sha1('\n'.join(sorted(names)).encode()).hexdigest()
+
+def load_cell_line_mappings(mappings_file, overrides_file, cosmic_cell_names, cbio_cell_names):
+    """
+    Cell line name mappings for get_sample_cellline_matches_*: the curated overrides, then the mappings
+    learned in previous runs (original name -> COSMIC / cBioportal name) and the names that could not be
+    resolved, plus the COSMIC names the cBioportal names were matched with. When the COSMIC or cBioportal
+    names have changed since they were stored, the unresolved names are matched again and mappings to
+    names that no longer exist are dropped
+    """
+    store = {'cosmic': {}, 'cbio': {}, 'unresolved_cosmic': [], 'unresolved_cbio': [], 'cbio_matched_from_cosmic': {}}
+    if mappings_file and os.path.exists(mappings_file):
+        with open(mappings_file) as f:
+            store.update(json.load(f))
+    #cBioportal names learned without their COSMIC name are matched again
+    matched_from_cosmic = store['cbio_matched_from_cosmic']
+    store['cbio'] = {x: y for x, y in store['cbio'].items() if x in matched_from_cosmic}
+    store['unresolved_cbio'] = [x for x in store['unresolved_cbio'] if x in matched_from_cosmic]
+    if (store.get('cosmic_names_digest') != names_digest(cosmic_cell_names.names) or
+            store.get('cbio_names_digest') != names_digest(cbio_cell_names.names)):
+        store['unresolved_cosmic'] = []
+        store['unresolved_cbio'] = []
+        store['cosmic'] = {x: y for x, y in store['cosmic'].items() if y in cosmic_cell_names}
+        store['cbio'] = {x: y for x, y in store['cbio'].items() if y in cbio_cell_names}
+    
+    overrides = {'cosmic': {}, 'cbio': {}}
+    if overrides_file and os.path.exists(overrides_file):
+        with open(overrides_file) as f:
+            overrides.update(json.load(f))
+    mappings = {}
+    for kind in ('cosmic', 'cbio'):
+        matches = dict(store[kind])
+        matches.update(overrides[kind])
+        unresolved = set(store['unresolved_' + kind]) - set(overrides[kind])
+        mappings[kind] = (matches, unresolved)
+    mappings['cbio_matched_from_cosmic'] = {x: y for x, y in matched_from_cosmic.items() if x not in overrides['cbio']}
+    return mappings, overrides
+
+def save_cell_line_mappings(mappings_file, mappings, overrides, cosmic_cell_names, cbio_cell_names):
+    """
+    Store the mappings learned in this run (the curated overrides are kept in their own file)
+    """
+    store = {'cosmic_names_digest': names_digest(cosmic_cell_names.names),
+             'cbio_names_digest': names_digest(cbio_cell_names.names)}
+    for kind in ('cosmic', 'cbio'):
+        matches, unresolved = mappings[kind]
+        store[kind] = {x: y for x, y in sorted(matches.items()) if x not in overrides[kind]}
+        store['unresolved_' + kind] = sorted(unresolved)
+    store['cbio_matched_from_cosmic'] = {x: y for x, y in sorted(mappings['cbio_matched_from_cosmic'].items())
+                                         if x not in overrides['cbio']}
+    with open(mappings_file, 'w') as f:
+        json.dump(store, f, indent=2)
+
+def job_name(cosmic_cell_name, cbio_cell_name):
+    """
+    File name safe name of a job; different pairs can give the same sanitised name (e.g. 'A B' and 'A_B'),
+    so it ends with a short hash of the pair
+    """
+    parts = []
+    if cosmic_cell_name:
+        parts.append('cosmic-' + cosmic_cell_name)
+    if cbio_cell_name:
+        parts.append('cbio-' + cbio_cell_name)
+    digest = hashlib.sha1('{}\t{}'.format(cosmic_cell_name or '', cbio_cell_name or '').encode()).hexdigest()[:8]
+    return re.sub(r'[^A-Za-z0-9.+-]+', '_', '__'.join(parts)) + '-' + digest
+
+def plan_pgdb_jobs(samples_celllines_cosmic_cbio, cbio_studies=None, common_params=('--add_reference', 'false')):
+    """
+    Group the samples by their (COSMIC, cBioportal) cell lines and return one pgdb job per group: the
+    database is built once and shared by all the samples of the group. Parameters in braces are
+    filled in when the jobs are run (credentials are not written in the plan); cbio_studies gives the
+    study of the cBioportal samples that are not in the default study of the plan, and common_params
+    the pgdb options of every sample database (reference proteome, ncRNA, decoys...)
+    """
+    groups = {}
+    for sample_id in sorted(samples_celllines_cosmic_cbio.keys()):
+        info = samples_celllines_cosmic_cbio[sample_id]
+        key = (info.get('cosmic'), info.get('cbio'))
+        if key != (None, None):
+            groups.setdefault(key, []).append(sample_id)
+    
+    jobs = []
+    for (cosmic_cell_name, cbio_cell_name), samples in sorted(groups.items(), key=lambda x: job_name(*x[0])):
+        name = job_name(cosmic_cell_name, cbio_cell_name)
+        params = []
+        if cosmic_cell_name:
+            params += ['--cosmic_celllines', 'true', '--cosmic_user_name', '{cosmic_user_name}',
+                       '--cosmic_password', '{cosmic_password}', '--cosmic_cellline_name', cosmic_cell_name]
+        if cbio_cell_name:
+            params += ['--cbioportal', 'true', '--cbioportal_filter_column', 'SAMPLE_ID',
+                       '--cbioportal_study_id', (cbio_studies or {}).get(cbio_cell_name, '{cbio_study_id}'),
+                       '--cbioportal_accepted_values', cbio_cell_name]
+        params += list(common_params) + ['--final_database_protein', name + '.fa']
+        jobs.append({'name': name, 'cosmic': cosmic_cell_name, 'cbio': cbio_cell_name, 'params': params,
+                     'database': name + '.fa', 'samples': samples})
+    
+    #Final database: refprot + ncrna
+    name = 'refprot_altorfs_ncrna_pesudogenes'
+    jobs.append({'name': name, 'cosmic': None, 'cbio': None,
+                 'params': ['--ensembl_name', 'homo_sapiens', '--ncrna', 'true', '--pseudogenes', 'true',
+                            '--altorfs', 'true', '--final_database_protein', name + '.fa'],
+                 'database': name + '.fa', 'samples': [name]})
+    return jobs
+
+def write_job_plan(path, jobs, pipeline, profile, output_dir, cbio_study_id='ccle_broad_2019'):
+    with open(path, 'w') as plan:
+        json.dump({'pipeline': pipeline, 'profile': profile, 'output_dir': output_dir,
+                   'cbio_study_id': cbio_study_id, 'jobs': jobs}, plan, indent=2)
+
+def write_commands_script(path, jobs, pipeline, profile, output_dir, cbio_study_id='ccle_broad_2019'):
+    """
+    Shell version of the job plan: every job runs in its own launch directory and output directory
+    (builds/<job>), then the database is linked for each of its samples
+    """
+    with open(path, 'w') as cmds:
+        cmds.write('#set global variables' + '\n')
+        cmds.write('cosmic_user_name=""' + '\n')
+        cmds.write('cosmic_password=""' + '\n')
+        cmds.write('cbio_study_id="{}"'.format(cbio_study_id) + '\n')
+        cmds.write('output_dir="{}"'.format(output_dir if os.path.isabs(output_dir) else '$PWD/' + output_dir) + '\n')
+        cmds.write('pipeline="{}"'.format(pipeline if os.path.isabs(pipeline) else '$PWD/' + pipeline) + '\n\n')
+        
+        for job in jobs:
+            params = ' '.join('$' + x[1:-1] if x.startswith('{') and x.endswith('}') else x for x in job['params'])
+            cmds.write('mkdir -p runs/{name} && (cd runs/{name} && nextflow run $pipeline -profile {profile} {params} '
+                       '--outdir $output_dir/builds/{name} -resume)\n'.format(name=job['name'], profile=profile,
+                                                                                params=params))
+            for sample_id in job['samples']:
+                cmds.write('ln -sf builds/{}/{} $output_dir/{}.fa\n'.format(job['name'], job['database'], sample_id))
+            cmds.write('\n')
+
 if __name__ == '__main__':
     args = parse_commandline_args()
     
     datasets = glob.glob(args.path_to_datasets + '/*.tsv')
-    cosmic_cell_names = list(set([x.strip() for x in open(args.cosmic_cell_names, 'r').readlines()]))
+    cosmic_cell_names = CosmicNameIndex(sorted(set([x.strip() for x in open(args.cosmic_cell_names, 'r').readlines()])))
     
-    cell_names_mapped_to_cosmic = {'MCF7AdrR': 'MCF7',  'MCF7/AdrR': 'MCF7', 'U-251 MG': 'U251', 
-                                'SKOV3': 'SK-OV-3', 'Caki1': 'CAKI-1', 'K562': 'K-562',
-                                'RPMI8226': 'RPMI-8226', 'COLO205': 'COLO-205', 'HCT116': 'HCT-116',
-                                 'A-549 cell': 'A549', 'HS578T': 'Hs-578-T', 'BT549': 'BT-549',
-                                 'CCRFCEM': 'CCRF-CEM', 'HCT15': 'HCT-15', 
-                                 'MDAMB231': 'MDA-MB-231', 'MDAMB453': 'MDA-MB-453'}
+    "get info from all cBioportal studies"
+    sample_ids_cbioportal, sample_studies = load_cbioportal_samples(args.clinical_samples_file, args.cache_dir)
+    cbio_study_id = clinical_study_id(args.clinical_samples_file[0])
+    other_studies = {x: y for x, y in sample_studies.items() if y != cbio_study_id}
+    cbio_cell_names = CbioNameIndex(sample_ids_cbioportal.keys())
     
-    samples_celllines_cosmic, cell_names_mapped_to_cosmic, cell_lines_not_in_cosmic = get_sample_cellline_matches_cosmic(
-                            datasets, cosmic_cell_names, cell_names_mapped_to_cosmic)
+    mappings, overrides = load_cell_line_mappings(None if args.rematch else args.mappings, args.overrides,
+                                                  cosmic_cell_names, cbio_cell_names)
+    cell_names_mapped_to_cosmic, unresolved_cosmic = mappings['cosmic']
+    cell_names_mapped_to_cbio, unresolved_cbio = mappings['cbio']
     
-    "get info from all cBioportal studies"
-    sample_ids_cbioportal = get_sample_info_from_cbioportal(args.clinical_samples_file)
+    samples_celllines_cosmic, cell_names_mapped_to_cosmic, cell_lines_not_in_cosmic = get_sample_cellline_matches_cosmic(
+                            datasets, cosmic_cell_names, cell_names_mapped_to_cosmic, unresolved_cosmic)
     
     samples_celllines_cosmic_cbio, not_found_in_cbio  = get_sample_cellline_matches_cbio(
-                            sample_ids_cbioportal, samples_celllines_cosmic)
+                            cbio_cell_names, samples_celllines_cosmic, cell_names_mapped_to_cbio, unresolved_cbio,
+                            mappings['cbio_matched_from_cosmic'])
+    save_cell_line_mappings(args.mappings, mappings, overrides, cosmic_cell_names, cbio_cell_names)
     
-    with open('generate_db_commands.sh', 'w') as cmds:
-        cmds.write('#set global variables' + '\n')
-        cmds.write('cosmic_user_name=""' + '\n')
-        cmds.write('cosmic_password=""' + '\n')
-        cmds.write('cbio_study_id="ccle_broad_2019"' + '\n')
-        cmds.write('output_dir="sample_specific_dbs"' + '\n\n')
-        
-        for sample_id in sorted(samples_celllines_cosmic_cbio.keys()):
-            cosmic = ''
-            try:
-                cosmic_cell_name = samples_celllines_cosmic_cbio[sample_id]['cosmic']
-                cosmic = '--cosmic_celllines true --cosmic_user_name $cosmic_user_name --cosmic_password $cosmic_password --cosmic_cellline_name {}'.format(cosmic_cell_name)
-            except KeyError:
-                pass
-            
-            cbio = ''
-            try:
-                cbio_cell_name = samples_celllines_cosmic_cbio[sample_id]['cbio']
-                cbio = '--cbioportal true --cbioportal_filter_column SAMPLE_ID --cbioportal_study_id $cbio_study_id --cbioportal_accepted_values {}'.format(cbio_cell_name)
-            except KeyError:
-                pass
-            
-            if cosmic or cbio:
-                cmd = '''nextflow main.nf -profile docker {cosmic} {cbio} --add_reference false --final_database_protein {sample_id}.fa --outdir $output_dir -resume
-                '''.format(cosmic= cosmic, cbio = cbio, sample_id  = sample_id)
-                cmds.write(cmd + '\n')
-        
-        cmds.write('#Final database: refprot + ncrna' + '\n')
-        cmd = '''nextflow main.nf -profile docker --ensembl_name homo_sapiens --ncrna true --pseudogenes true --altorfs true --final_database_protein {out}.fa --outdir $output_dir -resume'''.format(
-            out='refprot_altorfs_ncrna_pesudogenes.fa')
-        cmds.write(cmd + '\n')
+    jobs = plan_pgdb_jobs(samples_celllines_cosmic_cbio, other_studies, shlex.split(args.extra_params))
+    write_job_plan(args.jobs_plan, jobs, args.pipeline, args.profile, args.output_dir, cbio_study_id)
+    write_commands_script('generate_db_commands.sh', jobs, args.pipeline, args.profile, args.output_dir, cbio_study_id)
         
     print('No cell lines are found in COSMICCLP for these cell line datasets:\n{}'.format(
         '\n'.join([x+': '+','.join(set(y)) for x,y in cell_lines_not_in_cosmic.items()])))
-    print('No cell lines are found in cBioportal for these cell line datasets:\n{}'.format(
-        '\n'.join([x for x,y in not_found_in_cbio.items()])))
-    print('Please run generate_db_commands.sh to generate the databases using pgdb')
-    
-    
-    
\ No newline at end of file
+    print('No cell lines are found in cBioportal for these cell line datasets (near matches in brackets):\n{}'.format(
+        '\n'.join([x + ' ({})'.format(', '.join('{} {}'.format(name, score) for name, score in cbio_cell_names.suggest(x)))
+                   for x,y in not_found_in_cbio.items()])))
+    print('{} databases to build for {} samples'.format(
+        len(jobs), sum(len(job['samples']) for job in jobs) - 1))
+    print('Please run run_pgdb_jobs.py (or generate_db_commands.sh) to generate the databases using pgdb')
@@ -0,0 +1,94 @@
+'''
+Run the pgdb job plan written by generate_pgdbs.py (pgdb_jobs.json) on the local machine.
+
+Every job builds one database, shared by all the samples mapped to the same COSMIC and cBioportal cell
+lines: it runs nextflow in its own launch directory (runs/<job>) with its own output directory
+(<output_dir>/builds/<job>), and the database is then linked (or copied) as <output_dir>/<sample>.fa
+for each of its samples. Independent jobs run concurrently, up to --jobs at a time.
+
+The COSMIC credentials are read from the COSMIC_USER_NAME and COSMIC_PASSWORD environment variables.
+'''
+import os
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+def parse_commandline_args():
+    parser = argparse.ArgumentParser(description='Run the pgdb jobs of a plan written by generate_pgdbs.py')
+    parser.add_argument('plan', nargs='?', default='pgdb_jobs.json', help="Job plan")
+    parser.add_argument('-j', '--jobs', type=int, default=2, help="Number of jobs run at the same time")
+    parser.add_argument('--copy', action='store_true', help="Copy the databases for every sample instead of linking them")
+    parser.add_argument('--only', nargs='+', help="Names of the jobs to run")
+    parser.add_argument('--dry_run', action='store_true', help="Print the commands without running them")
+    return parser.parse_args(sys.argv[1:])
+
+def fill_params(params, values):
+    """Replace the {placeholder} parameters of a job by their values"""
+    return [values.get(x[1:-1], x) if x.startswith('{') and x.endswith('}') else x for x in params]
+
+def job_command(plan, job, values):
+    output_dir = os.path.abspath(plan['output_dir'])
+    return (['nextflow', 'run', os.path.abspath(plan['pipeline']), '-profile', plan['profile']]
+            + fill_params(job['params'], values)
+            + ['--outdir', os.path.join(output_dir, 'builds', job['name']), '-resume'])
+
+def masked(command, values):
+    secrets = {values[x] for x in ('cosmic_password',) if values.get(x)}
+    return ' '.join('***' if x in secrets else x for x in command)
+
+def run_job(plan, job, values, dry_run=False):
+    """Run the nextflow command of a job in its launch directory, returning its exit code"""
+    command = job_command(plan, job, values)
+    if dry_run:
+        print(masked(command, values))
+        return 0
+    launch_dir = os.path.join('runs', job['name'])
+    os.makedirs(launch_dir, exist_ok=True)
+    with open(os.path.join(launch_dir, 'pgdb.log'), 'w') as log:
+        return subprocess.run(command, cwd=launch_dir, stdout=log, stderr=subprocess.STDOUT).returncode
+
+def link_samples(plan, job, copy=False):
+    """Make the database of a job available as <output_dir>/<sample>.fa for each of its samples"""
+    output_dir = os.path.abspath(plan['output_dir'])
+    database = os.path.join(output_dir, 'builds', job['name'], job['database'])
+    for sample_id in job['samples']:
+        target = os.path.join(output_dir, sample_id + '.fa')
+        if os.path.lexists(target):
+            os.remove(target)
+        if copy:
+            shutil.copyfile(database, target)
+        else:
+            os.symlink(os.path.relpath(database, output_dir), target)
+
+if __name__ == '__main__':
+    args = parse_commandline_args()
+    with open(args.plan) as f:
+        plan = json.load(f)
+    jobs = [job for job in plan['jobs'] if not args.only or job['name'] in args.only]
+    values = {'cosmic_user_name': os.environ.get('COSMIC_USER_NAME', ''),
+              'cosmic_password': os.environ.get('COSMIC_PASSWORD', ''),
+              'cbio_study_id': plan['cbio_study_id']}
+    
+    failed = []
+    with ThreadPoolExecutor(max_workers=1 if args.dry_run else args.jobs) as executor:
+        futures = {executor.submit(run_job, plan, job, values, args.dry_run): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            returncode = future.result()
+            if returncode != 0:
+                failed.append(job['name'])
+                print('Failed: {} (exit code {}, see runs/{}/pgdb.log)'.format(job['name'], returncode, job['name']))
+                continue
+            if not args.dry_run:
+                link_samples(plan, job, args.copy)
+                print('Done: {} ({} samples)'.format(job['name'], len(job['samples'])))
+    
+    if args.dry_run:
+        print('Dry run: {} jobs for {} samples, nothing was run'.format(
+            len(jobs), sum(len(job['samples']) for job in jobs)))
+    else:
+        print('{} of {} jobs succeeded'.format(len(jobs) - len(failed), len(jobs)))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,100 @@
+"""
+Assembly of a search database from several FASTA sources, e.g. the UniProt reference proteome and the
+contaminant databases:
+
+    python fasta_assemble.py -o database.fasta uniprot-human.fasta.gz \
+        contaminants-202105-uniprot.fasta contaminants-mq-202105.fasta.gz=CONTAM_ crap-202105.fasta.gz=CONTAM_
+
+Sources are plain or gzip files, read one record at a time. A source given as PATH=PREFIX has PREFIX added
+to the accession (and to the entry name of UniProt headers db|accession|name) of its records, unless it is
+already there. A record is skipped when its accession or its sequence was already written by a previous
+record, so sources listed first take precedence. Only the accessions and 128-bit sequence digests written so far are kept in memory.
+
+A manifest with the records read, written and skipped per source is written next to the database
+({output}.manifest.json).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from fasta_duplicates import sequence_digest
+from fasta_index import header_accession
+from fasta_scan import format_record, iter_fasta, open_fasta
+
+
+def parse_source(source):
+    """(path, prefix) of a PATH or PATH=PREFIX source argument."""
+    path, _, prefix = source.partition('=')
+    return path, prefix
+
+
+def prefix_accession(header, prefix):
+    """Header (bytes, without '>') with prefix added to the accession and entry name, or to the identifier."""
+    if not prefix or header.startswith(prefix) or b'|' + prefix in header:
+        return header
+    fields = header.split(b'|', 2)
+    if len(fields) == 3:
+        return b'|'.join([fields[0], prefix + fields[1], (prefix + fields[2]) if fields[2] else b''])
+    return prefix + header
+
+
+def assemble(sources, output_file, dedup_accession=True, dedup_sequence=True):
+    """Write the records of the (path, prefix) sources to output_file. Returns the per-source counts."""
+    accessions = set()
+    digests = set()
+    manifest = []
+    with open_fasta(output_file, 'wb') as out:
+        for path, prefix in sources:
+            counts = {'source': path, 'prefix': prefix, 'read': 0, 'written': 0, 'duplicate_accession': 0,
+                      'duplicate_sequence': 0, 'residues': 0}
+            prefix = prefix.encode()
+            for header, sequence in iter_fasta(path):
+                counts['read'] += 1
+                header = prefix_accession(header, prefix)
+                accession = header_accession(header)
+                if dedup_accession and accession in accessions:
+                    counts['duplicate_accession'] += 1
+                    continue
+                digest = sequence_digest(sequence)
+                if dedup_sequence and digest in digests:
+                    counts['duplicate_sequence'] += 1
+                    continue
+                accessions.add(accession)
+                digests.add(digest)
+                out.write(format_record(header, sequence))
+                counts['written'] += 1
+                counts['residues'] += len(sequence)
+            manifest.append(counts)
+    return manifest
+
+
+def write_manifest(path, output_file, sources, elapsed):
+    totals = {key: sum(source[key] for source in sources)
+              for key in ['read', 'written', 'duplicate_accession', 'duplicate_sequence', 'residues']}
+    with open(path, 'w') as f:
+        json.dump({'database': os.path.basename(output_file), 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'seconds': round(elapsed, 2), 'sources': sources, 'total': totals}, f, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Assemble a protein database from plain and gzip FASTA sources.")
+    parser.add_argument('sources', nargs='+', help="FASTA sources, as PATH or PATH=ACCESSION_PREFIX.")
+    parser.add_argument('-o', '--output', required=True, help="Output database (plain or .gz).")
+    parser.add_argument('--manifest', help="Manifest file (default: {output}.manifest.json).")
+    parser.add_argument('--keep-duplicate-accessions', action='store_true',
+                        help="Write records whose accession was already written.")
+    parser.add_argument('--keep-duplicate-sequences', action='store_true',
+                        help="Write records whose sequence was already written.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sources = assemble([parse_source(source) for source in args.sources], args.output,
+                       not args.keep_duplicate_accessions, not args.keep_duplicate_sequences)
+    elapsed = time.perf_counter() - start
+    write_manifest(args.manifest or args.output + '.manifest.json', args.output, sources, elapsed)
+    for source in sources:
+        print('{source}: {written} of {read} records written ({duplicate_accession} duplicate accessions, '
+              '{duplicate_sequence} duplicate sequences)'.format(**source), file=sys.stderr)
@@ -0,0 +1,219 @@
+"""
+Builder of target/entrapment/decoy databases from target FASTA files, as an alternative to running
+fdrbench and fixing its accessions with fdrbench_accessions.py.
+
+For every target protein the output holds, in this order, the target, its entrapment (ENTRAP_), the decoy
+of the target (DECOY_) and the decoy of the entrapment (DECOY_ENTRAP_), with the prefix added to the
+database, accession and entry name fields of the header:
+
+    >sp|A0A087X1C5|CP2D7_HUMAN ...
+    >ENTRAP_sp|ENTRAP_A0A087X1C5|ENTRAP_CP2D7_HUMAN ...
+    >DECOY_sp|DECOY_A0A087X1C5|DECOY_CP2D7_HUMAN ...
+    >DECOY_ENTRAP_sp|DECOY_ENTRAP_A0A087X1C5|DECOY_ENTRAP_CP2D7_HUMAN ...
+
+Entrapments are shuffled targets and decoys are reversed (or shuffled) sequences. As with fdrbench
+-level protein -fix_nc c, every protein is cut into its peptides (trypsin/p by default) and each peptide
+is shuffled or reversed on its own, keeping its C-terminal residue, i.e. the cleavage site, in place;
+with --enzyme none the whole protein is transformed with only its C-terminal residue fixed. --i2l
+replaces I by L in all the sequences, as fdrbench -I2L. The random shuffles differ from those of
+fdrbench, which also shuffles again peptides that happen to be target peptides (-check); this is not done.
+
+Sequences are transformed by batches of proteins with NumPy, batches being processed by a pool of worker
+processes while the inputs are streamed. Shuffles are seeded by the seed and the accession of each
+protein, so a database is rebuilt identically whatever the number of workers, and a protein keeps its
+entrapment and decoy across releases.
+
+    python fasta_decoy.py uniprot-human.fasta contaminants-202105-uniprot.fasta -o database.fasta.gz -j 8
+"""
+
+import argparse
+import functools
+import hashlib
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from fasta_digest import ENZYMES, cleavage_sites, mix
+from fasta_index import header_accession
+from fasta_scan import format_record, iter_fasta, open_fasta
+
+METHODS = ['reverse', 'shuffle']
+BATCH_RECORDS = 2000
+# below this number of units, the sort keys of a shuffle are packed in one integer for a single argsort
+PACKED_UNITS = 1 << 22
+DEFAULT_ENZYME = 'trypsin/p'
+
+
+def prefix_header(header, prefix):
+    """Header (bytes, without '>') with prefix added to the database, accession and entry name fields."""
+    fields = header.split(b'|', 2)
+    if len(fields) != 3:
+        return prefix + header
+    return b'|'.join(prefix + field for field in fields)
+
+
+def protein_seeds(headers, seed, purpose):
+    """64-bit seed of every protein, from the global seed, the accession and the purpose of the shuffle."""
+    key = str(seed).encode()
+    return np.array([int.from_bytes(hashlib.blake2b(header_accession(header), digest_size=8, key=key,
+                                                    person=purpose).digest(), 'little') for header in headers],
+                    dtype=np.uint64)
+
+
+def transform(sequences, method, seeds=None, fix_terminus='c', enzyme=None):
+    """Reverse or shuffle every sequence of a list (bytes), keeping the fixed terminus in place.
+
+    With an enzyme, every peptide of the sequences is reversed or shuffled on its own and the fixed
+    terminus is that of each peptide. All residues are reordered at once by computing, for every residue
+    of the output, the index of the residue it takes in the concatenated input. Shuffles sort the
+    residues of every peptide (or protein) by a pseudo-random key derived from the seed of the protein
+    and the position in the protein.
+    """
+    lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+    codes = np.frombuffer(b''.join(sequences), dtype=np.uint8)
+    if codes.size == 0:
+        return list(sequences)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    # the units transformed on their own: proteins, or the peptides between cleavage sites and protein ends
+    unit_starts = starts
+    if enzyme:
+        unit_starts = np.concatenate((starts[lengths > 0], cleavage_sites(codes, enzyme)))
+        unit_starts.sort()
+        unit_starts = unit_starts[np.concatenate(([True], unit_starts[1:] != unit_starts[:-1]))]
+    unit_lengths = np.diff(np.append(unit_starts, codes.size))
+    base = np.repeat(unit_starts, unit_lengths)
+    length = np.repeat(unit_lengths, unit_lengths)
+    position = np.arange(codes.size) - base
+    if fix_terminus == 'n':
+        fixed = position == 0
+    elif fix_terminus == 'c':
+        fixed = position == length - 1
+    else:
+        fixed = None
+    if method == 'reverse':
+        if fix_terminus == 'n':
+            source = np.where(fixed, base, base + length - position)
+        elif fix_terminus == 'c':
+            source = np.where(fixed, base + position, base + length - 2 - position)
+        else:
+            source = base + length - 1 - position
+    else:
+        # sort key: unit number, then 0 / 1 / 2 for a fixed N-terminus / other residues / fixed
+        # C-terminus, then 40 random bits
+        unit = np.repeat(np.arange(len(unit_starts), dtype=np.uint64), unit_lengths)
+        group = np.ones(codes.size, dtype=np.uint64)
+        if fixed is not None:
+            group[fixed] = 0 if fix_terminus == 'n' else 2
+        protein_position = np.arange(codes.size) - np.repeat(starts, lengths)
+        key = mix(np.repeat(seeds, lengths), protein_position) >> np.uint64(24)
+        if len(unit_starts) < PACKED_UNITS:
+            source = np.argsort((unit << np.uint64(42)) | (group << np.uint64(40)) | key)
+        else:
+            source = np.lexsort((key, group, unit))
+    shuffled = codes[source].tobytes()
+    bounds = np.concatenate((starts, [codes.size])).tolist()
+    return [shuffled[bounds[i]:bounds[i + 1]] for i in range(len(sequences))]
+
+
+def build_batch(records, seed=42, decoy_method='reverse', entrap_method='shuffle', fix_terminus='c',
+                entrapment=True, enzyme=DEFAULT_ENZYME, i2l=False):
+    """Output records (bytes) of a batch of (header, sequence) targets, with their entrapments and decoys."""
+    headers = [header for header, _ in records]
+    targets = [sequence for _, sequence in records]
+    if i2l:
+        targets = [sequence.replace(b'I', b'L') for sequence in targets]
+    decoy_seeds = protein_seeds(headers, seed, b'decoy') if decoy_method == 'shuffle' else None
+    decoys = transform(targets, decoy_method, decoy_seeds, fix_terminus, enzyme)
+    if entrapment:
+        entraps = transform(targets, entrap_method, protein_seeds(headers, seed, b'entrap'), fix_terminus, enzyme)
+        entrap_decoy_seeds = protein_seeds(headers, seed, b'decoy_entrap') if decoy_method == 'shuffle' else None
+        entrap_decoys = transform(entraps, decoy_method, entrap_decoy_seeds, fix_terminus, enzyme)
+    out = []
+    for i, header in enumerate(headers):
+        out.append(format_record(header, targets[i]))
+        if entrapment:
+            out.append(format_record(prefix_header(header, b'ENTRAP_'), entraps[i]))
+        out.append(format_record(prefix_header(header, b'DECOY_'), decoys[i]))
+        if entrapment:
+            out.append(format_record(prefix_header(header, b'DECOY_ENTRAP_'), entrap_decoys[i]))
+    return b''.join(out)
+
+
+def iter_batches(fasta_files, batch_records=BATCH_RECORDS):
+    """Batches of (header, sequence) records streamed from the input files."""
+    batch = []
+    for fasta_file in fasta_files:
+        for record in iter_fasta(fasta_file):
+            batch.append(record)
+            if len(batch) >= batch_records:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def bounded_map(executor, func, iterable, window):
+    """Ordered executor.map that submits at most `window` items ahead, so the input is not read at once."""
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def build_database(fasta_files, output_file, jobs=1, batch_records=BATCH_RECORDS, **options):
+    """Write the database built from the targets of fasta_files. Returns the number of target proteins."""
+    func = functools.partial(build_batch, **options)
+    targets = 0
+
+    def batches():
+        nonlocal targets
+        for batch in iter_batches(fasta_files, batch_records):
+            targets += len(batch)
+            yield batch
+
+    with open_fasta(output_file, 'wb') as out:
+        if jobs <= 1:
+            for result in map(func, batches()):
+                out.write(result)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for result in bounded_map(executor, func, batches(), 2 * jobs):
+                    out.write(result)
+    return targets
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build a target/entrapment/decoy database from target FASTA files.")
+    parser.add_argument('fasta_files', nargs='+', help="Target FASTA files (plain or .gz).")
+    parser.add_argument('-o', '--output', required=True, help="Output database (plain or .gz).")
+    parser.add_argument('--decoy', choices=METHODS, default='reverse', help="Decoy method (default: %(default)s).")
+    parser.add_argument('--entrapment', choices=METHODS, default='shuffle',
+                        help="Entrapment method (default: %(default)s).")
+    parser.add_argument('--no-entrapment', action='store_true', help="Only add decoys.")
+    parser.add_argument('--fix-terminus', choices=['c', 'n', 'none'], default='c',
+                        help="Terminal residue of every peptide (or protein) kept in place (default: %(default)s).")
+    parser.add_argument('--enzyme', choices=sorted(ENZYMES) + ['none'], default=DEFAULT_ENZYME,
+                        help="Enzyme cutting the proteins into the peptides transformed on their own, or none to "
+                             "transform whole proteins (default: %(default)s).")
+    parser.add_argument('--i2l', action='store_true', help="Replace I by L in all the sequences.")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: number of CPUs).")
+    args = parser.parse_args()
+    if not args.no_entrapment and args.decoy == args.entrapment == 'reverse':
+        parser.error("Entrapments and decoys cannot both be reversed sequences")
+
+    start = time.perf_counter()
+    targets = build_database(args.fasta_files, args.output, args.jobs, seed=args.seed, decoy_method=args.decoy,
+                   entrap_method=args.entrapment, fix_terminus=args.fix_terminus,
+                   entrapment=not args.no_entrapment, enzyme=None if args.enzyme == 'none' else args.enzyme,
+                   i2l=args.i2l)
+    print('{} target proteins written to {} with their decoys in {:.1f} s'.format(
+        targets, args.output, time.perf_counter() - start), file=sys.stderr)
@@ -0,0 +1,246 @@
+"""
+In-silico digestion of a target/decoy/entrapment database and peptide-level overlap between the categories.
+
+Every protein is digested with the given enzyme, missed cleavages and peptide length range, and every
+peptide is reduced to a 64-bit fingerprint. The distinct fingerprints of each category are kept as sorted
+NumPy arrays, so a peptide costs 8 bytes whatever its length, and the overlaps are computed with set
+operations on these arrays.
+
+Fingerprints are computed for batches of proteins at once: a polynomial hash modulo 2**64 of every
+peptide is derived from prefix sums over the concatenated sequences, then mixed with the peptide length
+(splitmix64 finalizer). fingerprint() computes the same value for a single peptide.
+
+To stay within a memory budget the fingerprint space is split into partitions (by fingerprint modulo the
+number of partitions) that are processed in successive passes over the database; the counts of the
+partitions simply add up. Two different peptides sharing a fingerprint is possible in theory but
+negligible for databases of a few million peptides.
+"""
+
+import functools
+import math
+import os
+from collections import namedtuple
+
+import numpy as np
+
+import fasta_scan
+from fasta_scan import CATEGORIES, DEFAULT_CHUNK_SIZE, header_category
+
+# Cleavage rules: cut after ('C') or before ('N') the residues, except next to the exception residues
+Enzyme = namedtuple('Enzyme', ['residues', 'side', 'exceptions'])
+
+ENZYMES = {
+    'trypsin': Enzyme('KR', 'C', 'P'),
+    'trypsin/p': Enzyme('KR', 'C', ''),
+    'lys-c': Enzyme('K', 'C', 'P'),
+    'lys-n': Enzyme('K', 'N', ''),
+    'arg-c': Enzyme('R', 'C', 'P'),
+    'asp-n': Enzyme('D', 'N', ''),
+    'glu-c': Enzyme('E', 'C', 'P'),
+    'chymotrypsin': Enzyme('FYWL', 'C', 'P'),
+}
+
+DEFAULT_MEMORY_MB = 1024
+# residues digested at once by fingerprint_batch()
+BATCH_RESIDUES = 1 << 20
+
+BASE = 0x100000001B3
+BASE_INVERSE = pow(BASE, -1, 1 << 64)
+_powers = {}
+
+
+def residue_mask(residues):
+    mask = np.zeros(256, dtype=bool)
+    mask[list(residues.encode())] = True
+    return mask
+
+
+def cleavage_sites(codes, enzyme='trypsin'):
+    """Positions 0 < i < len(codes) before which the enzyme cuts a sequence given as a uint8 array."""
+    rule = ENZYMES[enzyme]
+    cut = residue_mask(rule.residues)[codes]
+    if rule.side == 'C':
+        # a cut after codes[i] is a cut before i + 1, unless codes[i + 1] is an exception
+        sites = cut[:-1] & ~residue_mask(rule.exceptions)[codes[1:]]
+        return np.flatnonzero(sites) + 1
+    sites = cut[1:] & ~residue_mask(rule.exceptions)[codes[:-1]]
+    return np.flatnonzero(sites) + 1
+
+
+def digest(sequence, enzyme='trypsin', missed_cleavages=2, min_length=7, max_length=30):
+    """Yield the peptides (bytes) of a protein sequence (bytes)."""
+    sites = [0]
+    sites.extend(cleavage_sites(np.frombuffer(sequence, dtype=np.uint8), enzyme).tolist())
+    sites.append(len(sequence))
+    for i in range(len(sites) - 1):
+        for j in range(i + 1, min(i + 2 + missed_cleavages, len(sites))):
+            length = sites[j] - sites[i]
+            if length > max_length:
+                break
+            if length >= min_length:
+                yield sequence[sites[i]:sites[j]]
+
+
+def powers(base, n):
+    """base**0 ... base**n modulo 2**64, cached and grown as needed."""
+    cached = _powers.get(base)
+    if cached is None or len(cached) <= n:
+        cached = np.empty(max(n + 1, BATCH_RESIDUES + 1), dtype=np.uint64)
+        cached[0] = 1
+        cached[1:] = np.full(len(cached) - 1, base, dtype=np.uint64).cumprod()
+        _powers[base] = cached
+    return cached
+
+
+def mix(values, lengths):
+    """splitmix64 finalizer of polynomial hashes combined with the peptide lengths."""
+    z = values ^ (lengths.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15))
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def fingerprint(peptide):
+    """64-bit fingerprint of a single peptide (bytes), as computed by fingerprint_batch()."""
+    value = 0
+    for residue in peptide:
+        value = (value * BASE + residue) & 0xFFFFFFFFFFFFFFFF
+    return int(mix(np.array([value], dtype=np.uint64), np.array([len(peptide)]))[0])
+
+
+def fingerprint_batch(sequences, enzyme='trypsin', missed_cleavages=2, min_length=7, max_length=30):
+    """Fingerprints (uint64 array, with repeats) of the peptides of a list of protein sequences."""
+    buf = b''.join(sequences)
+    n = len(buf)
+    if n == 0:
+        return np.zeros(0, dtype=np.uint64)
+    codes = np.frombuffer(buf, dtype=np.uint8)
+    bounds = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(sequence) for sequence in sequences], out=bounds[1:])
+    # cleavage sites and protein ends; a site found across two proteins is a protein boundary anyway
+    sites = np.concatenate((cleavage_sites(codes, enzyme), bounds))
+    sites.sort()
+    sites = sites[np.concatenate(([True], sites[1:] != sites[:-1]))]
+    site_protein = np.searchsorted(bounds, sites, 'right') - 1
+    previous_protein = np.searchsorted(bounds, sites - 1, 'right') - 1
+
+    # prefix[i] = sum(buf[k] * BASE**-k for k < i), so that the hash of buf[a:b] is
+    # (prefix[b] - prefix[a]) * BASE**(b - 1)
+    prefix = np.zeros(n + 1, dtype=np.uint64)
+    np.cumsum(codes * powers(BASE_INVERSE, n)[:n], out=prefix[1:])
+    base_powers = powers(BASE, n)
+
+    fingerprints = []
+    for missed in range(missed_cleavages + 1):
+        if len(sites) <= missed + 1:
+            break
+        start = sites[:-(missed + 1)]
+        end = sites[missed + 1:]
+        length = end - start
+        keep = ((site_protein[:-(missed + 1)] == previous_protein[missed + 1:])
+                & (length >= min_length) & (length <= max_length))
+        start, end, length = start[keep], end[keep], length[keep]
+        fingerprints.append(mix((prefix[end] - prefix[start]) * base_powers[end - 1], length))
+    return np.concatenate(fingerprints) if fingerprints else np.zeros(0, dtype=np.uint64)
+
+
+def sorted_unique(values):
+    """Sorted distinct values of a uint64 array (sorting is faster than np.unique on fingerprints)."""
+    values = np.sort(values)
+    if values.size:
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+    return values
+
+
+def empty_peptides():
+    return {category: np.zeros(0, dtype=np.uint64) for category in CATEGORIES}
+
+
+def chunk_peptides(records, enzyme='trypsin', missed_cleavages=2, min_length=7, max_length=30, i2l=False,
+                   partition=0, partitions=1):
+    """Sorted distinct fingerprints, per category, of the peptides of one chunk that fall in a partition."""
+    batches = {category: [] for category in CATEGORIES}
+    batch_sizes = dict.fromkeys(CATEGORIES, 0)
+    fingerprints = {category: [] for category in CATEGORIES}
+
+    def flush(category):
+        values = fingerprint_batch(batches[category], enzyme, missed_cleavages, min_length, max_length)
+        if partitions > 1:
+            values = values[values % np.uint64(partitions) == partition]
+        fingerprints[category].append(sorted_unique(values))
+        batches[category] = []
+        batch_sizes[category] = 0
+
+    for header, sequence in records:
+        if i2l:
+            sequence = sequence.replace(b'I', b'L')
+        category = header_category(header)
+        batches[category].append(sequence)
+        batch_sizes[category] += len(sequence)
+        if batch_sizes[category] >= BATCH_RESIDUES:
+            flush(category)
+    for category in CATEGORIES:
+        if batches[category]:
+            flush(category)
+    return {category: sorted_unique(np.concatenate(values)) if values else np.zeros(0, dtype=np.uint64)
+            for category, values in fingerprints.items()}
+
+
+def merge_peptides(a, b):
+    return {category: sorted_unique(np.concatenate((a[category], b[category]))) for category in CATEGORIES}
+
+
+def overlap_counts(peptides):
+    """Distinct, exclusive and shared peptide counts of the per-category fingerprint sets."""
+    target, decoy, entrap = (peptides[category] for category in CATEGORIES)
+    target_decoy = np.intersect1d(target, decoy, assume_unique=True)
+    target_entrap = np.intersect1d(target, entrap, assume_unique=True)
+    decoy_entrap = np.intersect1d(decoy, entrap, assume_unique=True)
+    all_three = np.intersect1d(target_decoy, entrap, assume_unique=True).size
+    counts = {'distinct_' + category: peptides[category].size for category in CATEGORIES}
+    counts.update({
+        'shared_target_decoy': target_decoy.size,
+        'shared_target_entrap': target_entrap.size,
+        'shared_decoy_entrap': decoy_entrap.size,
+        'shared_all': all_three,
+        'unique_target': target.size - target_decoy.size - target_entrap.size + all_three,
+        'unique_decoy': decoy.size - target_decoy.size - decoy_entrap.size + all_three,
+        'unique_entrap': entrap.size - target_entrap.size - decoy_entrap.size + all_three,
+    })
+    return counts
+
+
+def estimate_partitions(fasta_file, missed_cleavages, memory_mb=DEFAULT_MEMORY_MB):
+    """Number of partitions keeping the fingerprint arrays within about memory_mb.
+
+    A tryptic peptide is about 10 residues long, and every residue of the file contributes to up to
+    missed_cleavages + 1 peptides; fingerprints take 8 bytes and set operations need about twice that.
+    """
+    estimate = os.path.getsize(fasta_file) / 10 * (missed_cleavages + 1) * 8 * 2
+    return max(1, math.ceil(estimate / (memory_mb << 20)))
+
+
+def peptide_stats(fasta_file, enzyme='trypsin', missed_cleavages=2, min_length=7, max_length=30, i2l=False,
+                  jobs=1, chunk_size=DEFAULT_CHUNK_SIZE, memory_mb=DEFAULT_MEMORY_MB):
+    """Digest a database and return the peptide counts of overlap_counts(), summed over the partitions."""
+    partitions = estimate_partitions(fasta_file, missed_cleavages, memory_mb)
+    totals = {}
+    for partition in range(partitions):
+        func = functools.partial(chunk_peptides, enzyme=enzyme, missed_cleavages=missed_cleavages,
+                                 min_length=min_length, max_length=max_length, i2l=i2l, partition=partition,
+                                 partitions=partitions)
+        peptides = fasta_scan.scan(fasta_file, func, merge_peptides, empty_peptides(), jobs, chunk_size)
+        for key, count in overlap_counts(peptides).items():
+            totals[key] = totals.get(key, 0) + int(count)
+    totals['partitions'] = partitions
+    return totals
+
+
+def print_peptide_stats(counts):
+    print("Peptides (distinct / unique to the category):")
+    for category in CATEGORIES:
+        print(f"  {category}: {counts['distinct_' + category]} / {counts['unique_' + category]}")
+    print(f"Shared target-decoy peptides: {counts['shared_target_decoy']}")
+    print(f"Shared target-entrapment peptides: {counts['shared_target_entrap']}")
+    print(f"Shared decoy-entrapment peptides: {counts['shared_decoy_entrap']}")
+    print(f"Peptides shared by all categories: {counts['shared_all']}")
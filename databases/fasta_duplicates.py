@@ -0,0 +1,149 @@
+"""
+Detection of identical protein sequences in a database, within and across the target, decoy (DECOY_),
+entrapment (ENTRAP_) and contaminant (CONTAM_) categories.
+
+The first pass reduces every record to a 128-bit digest of its sequence (blake2b), its category and its
+record number, kept in a NumPy structured array of 21 bytes per record; the array is sorted by digest and
+runs of equal digests are the groups of identical sequences. A second streaming pass collects the
+accessions of the duplicated records and can write a deduplicated database, keeping the first record of
+every group.
+
+    python fasta_duplicates.py database.fasta --groups duplicates.tsv --deduplicated database-dedup.fasta
+"""
+
+import argparse
+import csv
+import hashlib
+import sys
+from collections import Counter
+
+import numpy as np
+
+import fasta_scan
+from fasta_index import header_accession
+from fasta_scan import DEFAULT_CHUNK_SIZE, format_record, iter_fasta, open_fasta
+
+# the categories of fasta_scan, and contaminants among the targets
+SEQUENCE_CATEGORIES = fasta_scan.CATEGORIES + ['contam']
+DIGEST_DTYPE = np.dtype([('hi', '<u8'), ('lo', '<u8'), ('category', 'u1'), ('record', '<u4')])
+
+
+def sequence_category(header):
+    """Index in SEQUENCE_CATEGORIES of the category of a FASTA header (bytes).
+
+    Decoy and entrapment contaminants count as decoys and entrapments.
+    """
+    category = fasta_scan.header_category(header)
+    if category == 'target' and b'CONTAM_' in header:
+        category = 'contam'
+    return SEQUENCE_CATEGORIES.index(category)
+
+
+def sequence_digest(sequence):
+    return hashlib.blake2b(sequence, digest_size=16).digest()
+
+
+def chunk_digests(records):
+    """Digest, category and record number (within the chunk) of every record of a chunk."""
+    digests = []
+    categories = []
+    for header, sequence in records:
+        digests.append(sequence_digest(sequence))
+        categories.append(sequence_category(header))
+    result = np.zeros(len(digests), dtype=DIGEST_DTYPE)
+    if digests:
+        halves = np.frombuffer(b''.join(digests), dtype='<u8').reshape(-1, 2)
+        result['hi'] = halves[:, 0]
+        result['lo'] = halves[:, 1]
+        result['category'] = categories
+        result['record'] = np.arange(len(digests))
+    return result
+
+
+def merge_digests(a, b):
+    """Concatenate the digests of consecutive chunks, numbering the records of b after those of a."""
+    b = b.copy()
+    b['record'] += len(a)
+    return np.concatenate((a, b))
+
+
+def digest_index(fasta_file, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Digest array of all the records of a database, sorted by digest."""
+    if str(fasta_file).endswith('.gz'):
+        # compressed files cannot be split into chunks
+        digests = chunk_digests(iter_fasta(fasta_file))
+    else:
+        digests = fasta_scan.scan(fasta_file, chunk_digests, merge_digests, np.zeros(0, dtype=DIGEST_DTYPE), jobs,
+                                  chunk_size)
+    return digests[np.lexsort((digests['record'], digests['lo'], digests['hi']))]
+
+
+def duplicate_groups(digests):
+    """Groups of identical sequences: a list of digest arrays (record order) of two records or more."""
+    if len(digests) < 2:
+        return []
+    same = (digests['hi'][1:] == digests['hi'][:-1]) & (digests['lo'][1:] == digests['lo'][:-1])
+    starts = np.flatnonzero(np.concatenate(([True], ~same)))
+    ends = np.append(starts[1:], len(digests))
+    return [digests[start:end] for start, end in zip(starts, ends) if end - start > 1]
+
+
+def group_categories(group):
+    return '+'.join(SEQUENCE_CATEGORIES[code] for code in sorted(set(group['category'].tolist())))
+
+
+def record_accessions(fasta_file, records):
+    """{record number: accession} of the given records, in a streaming pass."""
+    records = set(records)
+    accessions = {}
+    for number, (header, _) in enumerate(iter_fasta(fasta_file)):
+        if number in records:
+            accessions[number] = header_accession(header).decode(errors='replace')
+    return accessions
+
+
+def write_deduplicated(fasta_file, output_file, drop):
+    """Copy the database without the records whose number is in drop. Returns the number of records written."""
+    written = 0
+    with open_fasta(output_file, 'wb') as out:
+        for number, (header, sequence) in enumerate(iter_fasta(fasta_file)):
+            if number in drop:
+                continue
+            out.write(format_record(header, sequence))
+            written += 1
+    return written
+
+
+def write_groups(path, groups, accessions):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerow(['group', 'digest', 'size', 'categories', 'accessions'])
+        for number, group in enumerate(groups, 1):
+            digest = '{:016x}{:016x}'.format(int(group['hi'][0]), int(group['lo'][0]))
+            writer.writerow([number, digest, len(group), group_categories(group),
+                             ';'.join(accessions[record] for record in group['record'].tolist())])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Find identical sequences within and across the categories of a "
+                                                 "protein database.")
+    parser.add_argument('fasta_file', help="Protein database in FASTA format (plain or .gz).")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of worker processes (default: %(default)s).")
+    parser.add_argument('--groups', help="TSV file listing every group of identical sequences.")
+    parser.add_argument('--deduplicated', help="Write the database keeping only the first record of every group.")
+    args = parser.parse_args()
+
+    digests = digest_index(args.fasta_file, args.jobs)
+    groups = duplicate_groups(digests)
+    duplicated = sum(len(group) for group in groups)
+    print(f"{len(digests)} sequences, {len(groups)} groups of identical sequences covering {duplicated} records")
+    for categories, count in sorted(Counter(group_categories(group) for group in groups).items()):
+        print(f"  {categories}: {count} groups")
+
+    if args.groups:
+        records = [record for group in groups for record in group['record'].tolist()]
+        write_groups(args.groups, groups, record_accessions(args.fasta_file, records))
+    if args.deduplicated:
+        drop = {record for group in groups for record in group['record'][1:].tolist()}
+        written = write_deduplicated(args.fasta_file, args.deduplicated, drop)
+        print(f"{written} records written to {args.deduplicated} ({len(drop)} duplicates removed)", file=sys.stderr)
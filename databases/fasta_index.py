@@ -0,0 +1,204 @@
+"""
+Random-access index for FASTA databases (in the spirit of samtools faidx), to fetch single proteins or
+subsets by accession without scanning the whole file.
+
+The index is an open-addressing hash table stored in a binary file next to the database
+({fasta}.fidx): for every slot the 64-bit hash of an accession and the byte offset and length of its
+record. The reader memory-maps both the index and the database, so a lookup costs a hash, a few probes
+and one read of the record, whatever the size of the database.
+
+    python fasta_index.py build contaminants-202105-uniprot.fasta
+    python fasta_index.py get contaminants-202105-uniprot.fasta CONTAM_P00761 CONTAM_P02768
+    python fasta_index.py extract database.fasta accessions.txt -o subset.fasta
+
+The accession is the second field of UniProt-style headers (db|accession|name) or else the first word.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from fasta_scan import first_record, iter_record_offsets
+
+MAGIC = b'FIDX0001'
+# magic, number of records, capacity, size and mtime (ns) of the indexed database
+HEADER = struct.Struct('<8sQQQQ')
+
+
+def header_accession(header):
+    """Accession of a header (bytes, without '>')."""
+    identifier = header.split(None, 1)[0] if header.strip() else b''
+    fields = identifier.split(b'|')
+    return fields[1] if len(fields) >= 3 else identifier
+
+
+def key_hash(accession):
+    """Non-zero 64-bit hash of an accession (bytes); zero marks empty slots."""
+    value = int.from_bytes(hashlib.blake2b(accession, digest_size=8).digest(), 'little')
+    return value or 1
+
+
+def index_path(fasta_file):
+    return fasta_file + '.fidx'
+
+
+def build_index(fasta_file, output=None):
+    """Build the index of a plain FASTA file and return the number of indexed records."""
+    if fasta_file.endswith('.gz'):
+        raise ValueError('Compressed FASTA files cannot be indexed for random access: {}'.format(fasta_file))
+    st = os.stat(fasta_file)
+    offsets = []
+    seen = set()
+    duplicates = 0
+    with open(fasta_file, 'rb') as f:
+        if st.st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                start = first_record(buf)
+                records = iter_record_offsets(buf, start, len(buf)) if start != -1 else ()
+                for offset, header_end, end in records:
+                    accession = header_accession(buf[offset + 1:header_end].rstrip(b'\r'))
+                    if accession in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(accession)
+                    offsets.append((key_hash(accession), offset, end - offset))
+    if duplicates:
+        print('{} records with a duplicate accession not indexed (only the first one is)'.format(duplicates),
+              file=sys.stderr)
+    capacity = 1
+    while capacity < 2 * len(offsets):
+        capacity *= 2
+    keys = [0] * capacity
+    slots_offset = [0] * capacity
+    slots_length = [0] * capacity
+    mask = capacity - 1
+    for key, offset, length in offsets:
+        slot = key & mask
+        while keys[slot]:
+            slot = (slot + 1) & mask
+        keys[slot] = key
+        slots_offset[slot] = offset
+        slots_length[slot] = length
+    with open(output or index_path(fasta_file), 'wb') as out:
+        out.write(HEADER.pack(MAGIC, len(offsets), capacity, st.st_size, st.st_mtime_ns))
+        out.write(np.array(keys, dtype='<u8').tobytes())
+        out.write(np.array(slots_offset, dtype='<u8').tobytes())
+        out.write(np.array(slots_length, dtype='<u8').tobytes())
+    return len(offsets)
+
+
+class FastaIndex:
+    """Memory-mapped reader of a FASTA database through its index."""
+
+    def __init__(self, fasta_file, index_file=None):
+        index_file = index_file or index_path(fasta_file)
+        with open(index_file, 'rb') as f:
+            magic, self.records, self.capacity, size, mtime_ns = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError('Not a FASTA index: {}'.format(index_file))
+        st = os.stat(fasta_file)
+        if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+            raise ValueError('Index {} is out of date, rebuild it'.format(index_file))
+        arrays = np.memmap(index_file, dtype='<u8', mode='r', offset=HEADER.size, shape=(3, self.capacity))
+        self.keys, self.offsets, self.lengths = arrays
+        self.mask = self.capacity - 1
+        self.file = open(fasta_file, 'rb')
+        self.buf = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def record(self, accession):
+        """Raw bytes of the record of an accession (header and sequence lines), or None."""
+        if isinstance(accession, str):
+            accession = accession.encode()
+        key = key_hash(accession)
+        slot = key & self.mask
+        while True:
+            slot_key = int(self.keys[slot])
+            if slot_key == 0:
+                return None
+            if slot_key == key:
+                offset, length = int(self.offsets[slot]), int(self.lengths[slot])
+                data = self.buf[offset:offset + length]
+                # the hash could collide: check the accession of the record found
+                if header_accession(data[1:data.find(b'\n')] if b'\n' in data else data[1:]) == accession:
+                    return data
+            slot = (slot + 1) & self.mask
+
+    def get(self, accession):
+        """(header, sequence) of an accession as bytes, or None if it is not in the database."""
+        data = self.record(accession)
+        if data is None:
+            return None
+        header, _, sequence = data.partition(b'\n')
+        return header[1:].rstrip(b'\r'), sequence.replace(b'\n', b'').replace(b'\r', b'')
+
+    def get_many(self, accessions):
+        """{accession: (header, sequence)} for the accessions found in the database."""
+        records = {}
+        for accession in accessions:
+            record = self.get(accession)
+            if record is not None:
+                records[accession] = record
+        return records
+
+    def close(self):
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_index(fasta_file):
+    """Open the index of a FASTA file, building it first if it is missing or out of date."""
+    try:
+        return FastaIndex(fasta_file)
+    except (OSError, ValueError):
+        build_index(fasta_file)
+        return FastaIndex(fasta_file)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build and query random-access indexes of FASTA files')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='Index a FASTA file')
+    build_parser.add_argument('fasta_file')
+    get_parser = subparsers.add_parser('get', help='Print the records of accessions')
+    get_parser.add_argument('fasta_file')
+    get_parser.add_argument('accessions', nargs='+')
+    extract_parser = subparsers.add_parser('extract', help='Write the records of the accessions listed in a file')
+    extract_parser.add_argument('fasta_file')
+    extract_parser.add_argument('accession_file', help='One accession per line')
+    extract_parser.add_argument('-o', '--output', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        n = build_index(args.fasta_file)
+        print('{} records indexed in {}'.format(n, index_path(args.fasta_file)), file=sys.stderr)
+    elif args.command == 'get':
+        with open_index(args.fasta_file) as index:
+            for accession in args.accessions:
+                data = index.record(accession)
+                if data is None:
+                    print('Accession not found: {}'.format(accession), file=sys.stderr)
+                else:
+                    sys.stdout.buffer.write(data if data.endswith(b'\n') else data + b'\n')
+    else:
+        with open(args.accession_file) as f:
+            accessions = [line.strip() for line in f if line.strip()]
+        found = 0
+        with open_index(args.fasta_file) as index, open(args.output, 'wb') as out:
+            for accession in accessions:
+                data = index.record(accession)
+                if data is not None:
+                    found += 1
+                    out.write(data if data.endswith(b'\n') else data + b'\n')
+        print('{} of {} accessions written to {}'.format(found, len(accessions), args.output), file=sys.stderr)
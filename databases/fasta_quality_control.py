@@ -1,39 +1,114 @@
-import re
+"""
+Quality control of a target/decoy/entrapment protein database.
 
+The statistics are collected in a single streaming pass (split across worker processes) into fixed-size
+accumulators: counts, sequence length histograms with fixed bins and residue counts. The accumulators of
+the chunks are merged by addition, so memory does not grow with the size of the database.
+
+The report is written to an output directory without any display: summary.json, lengths.tsv and
+composition.tsv, and every figure as PNG and SVG.
+
+    python fasta_quality_control.py database.fasta -o qc-report --digest
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
 import pandas as pd
-from Bio import SeqIO
-import matplotlib.pyplot as plt
-from collections import Counter
-
-
-def analyze_protein_database(fasta_file):
-    # Initialize counters and variables
-    target_count = 0
-    decoy_count = 0
-    entrap_count = 0
-    sequence_lengths = []
-
-    # Patterns for identifying tags
-    decoy_pattern = re.compile(r"DECOY_")
-    entrap_pattern = re.compile(r"ENTRAP_")
-
-    # Parse the FASTA file
-    for record in SeqIO.parse(fasta_file, "fasta"):
-        header = record.description
-        sequence_lengths.append(len(record.seq))
-
-        # Count categories based on header tags
-        if decoy_pattern.search(header):
-            decoy_count += 1
-        elif entrap_pattern.search(header):
-            entrap_count += 1
-        else:
-            target_count += 1
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+
+import fasta_digest  # noqa: E402
+import fasta_scan  # noqa: E402
+from fasta_scan import CATEGORIES, DEFAULT_CHUNK_SIZE, header_category  # noqa: E402
+
+# Sequence lengths are counted in bins of LENGTH_BIN_WIDTH residues; the last bin also counts all
+# sequences longer than its start.
+LENGTH_BIN_WIDTH = 10
+LENGTH_BINS = 1000
+FIGURE_FORMATS = ['png', 'svg']
+
+
+def empty_stats():
+    return {'counts': dict.fromkeys(CATEGORIES, 0),
+            'lengths': {category: np.zeros(LENGTH_BINS, dtype=np.int64) for category in CATEGORIES},
+            'composition': {category: np.zeros(256, dtype=np.int64) for category in CATEGORIES}}
+
+
+def length_histogram(lengths):
+    """Fixed-bin histogram of an array of sequence lengths."""
+    bins = np.minimum(np.asarray(lengths, dtype=np.int64) // LENGTH_BIN_WIDTH, LENGTH_BINS - 1)
+    return np.bincount(bins, minlength=LENGTH_BINS)
+
+
+def chunk_stats(records):
+    """Statistics of the (header, sequence) records of one chunk of the database."""
+    stats = empty_stats()
+    sequences = {category: [] for category in CATEGORIES}
+    for header, sequence in records:
+        sequences[header_category(header)].append(sequence)
+    for category in CATEGORIES:
+        stats['counts'][category] = len(sequences[category])
+        stats['lengths'][category] += length_histogram([len(sequence) for sequence in sequences[category]])
+        residues = np.frombuffer(b''.join(sequences[category]), dtype=np.uint8)
+        stats['composition'][category] += np.bincount(residues, minlength=256)
+    return stats
+
+
+def merge_stats(a, b):
+    for category in CATEGORIES:
+        a['counts'][category] += b['counts'][category]
+        a['lengths'][category] += b['lengths'][category]
+        a['composition'][category] += b['composition'][category]
+    return a
+
+
+def scan_fasta(fasta_file, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compute all the statistics of a protein database in a single pass, split into chunks processed by
+    `jobs` worker processes. Returns a dict with, per category, the number of sequences, the histogram
+    of sequence lengths and the residue counts as an array indexed by byte value.
+    """
+    return fasta_scan.scan(fasta_file, chunk_stats, merge_stats, empty_stats(), jobs, chunk_size)
+
+
+def composition_percent(residue_counts):
+    """Amino acid composition in percent from residue counts indexed by byte value."""
+    total = residue_counts.sum()
+    return {chr(code): residue_counts[code] / total * 100 for code in np.flatnonzero(residue_counts)}
+
+
+def histogram_summary(histogram):
+    """Count, approximate mean and median of a length histogram (bin centers)."""
+    total = int(histogram.sum())
+    if total == 0:
+        return {'sequences': 0, 'mean_length': None, 'median_length': None}
+    centers = np.arange(LENGTH_BINS) * LENGTH_BIN_WIDTH + LENGTH_BIN_WIDTH / 2
+    median_bin = int(np.searchsorted(np.cumsum(histogram), (total + 1) / 2))
+    return {'sequences': total, 'mean_length': round(float((histogram * centers).sum() / total), 1),
+            'median_length': float(centers[median_bin])}
+
+
+def save_figure(fig, output_dir, name):
+    for figure_format in FIGURE_FORMATS:
+        fig.savefig(os.path.join(output_dir, '{}.{}'.format(name, figure_format)), bbox_inches='tight')
+    plt.close(fig)
+
+
+def analyze_protein_database(fasta_file, stats=None, output_dir='.'):
+    if stats is None:
+        stats = scan_fasta(fasta_file)
+    target_count = stats['counts']['target']
+    decoy_count = stats['counts']['decoy']
+    entrap_count = stats['counts']['entrap']
 
     # Calculate metrics
     total_sequences = target_count + decoy_count + entrap_count
     target_decoy_ratio = (target_count + entrap_count )/ max(decoy_count, 1)  # Avoid division by zero
-    sequence_length_distribution = Counter(sequence_lengths)
 
     print(f"Total sequences: {total_sequences}")
     print(f"Target proteins: {target_count}")
@@ -41,56 +116,36 @@ def analyze_protein_database(fasta_file):
     print(f"Entrapment proteins: {entrap_count}")
     print(f"Target-to-Decoy Ratio: {target_decoy_ratio:.2f}")
 
-    # Plot sequence length distribution
-
     labels = ["Target", "Decoy", "Entrapment"]
     counts = [target_count, decoy_count, entrap_count]
     colors = ['blue', 'green', 'red']
 
-    # 2. Pie chart for proportions of each category, independent plot
-    plt.figure(figsize=(6, 6))
+    # Pie chart for proportions of each category
+    fig = plt.figure(figsize=(6, 6))
     plt.pie(counts, labels=labels, autopct='%1.1f%%', colors=colors, startangle=140)
     plt.title("Proportion of Protein Types")
-    plt.show()
-
-    # 4. Target-to-Decoy Ratio
+    save_figure(fig, output_dir, 'protein_types')
 
-    plt.figure(figsize=(4, 6))
+    # Target-to-Decoy Ratio
+    fig = plt.figure(figsize=(4, 6))
     plt.bar(["Target-to-Decoy Ratio"], [target_decoy_ratio], color='cyan')
     plt.ylim(0, max(target_decoy_ratio + 1, 5))
     plt.title("Target-to-Decoy Ratio")
     plt.tight_layout()
-    plt.show()
-
-
-def analyze_decoy_quality(fasta_file):
-    # Initialize variables for length and amino acid composition
-    target_lengths = []
-    decoy_lengths = []
-    target_aa_counts = Counter()
-    decoy_aa_counts = Counter()
+    save_figure(fig, output_dir, 'target_decoy_ratio')
 
-    # Patterns for identifying target and decoy
-    decoy_pattern = re.compile(r"DECOY_")
+    return {'total_sequences': total_sequences, 'counts': dict(stats['counts']),
+            'target_decoy_ratio': round(target_decoy_ratio, 4)}
 
-    # Parse the FASTA file
-    for record in SeqIO.parse(fasta_file, "fasta"):
-        sequence = str(record.seq)
-        length = len(sequence)
 
-        if decoy_pattern.search(record.description):
-            decoy_lengths.append(length)
-            decoy_aa_counts.update(sequence)
-        else:
-            target_lengths.append(length)
-            target_aa_counts.update(sequence)
-
-    # Calculate amino acid composition as percentage
-    total_target_aa = sum(target_aa_counts.values())
-    total_decoy_aa = sum(decoy_aa_counts.values())
-
-    target_aa_composition = {aa: count / total_target_aa * 100 for aa, count in target_aa_counts.items()}
-    decoy_aa_composition = {aa: count / total_decoy_aa * 100 for aa, count in decoy_aa_counts.items()}
+def analyze_decoy_quality(fasta_file, stats=None, output_dir='.'):
+    if stats is None:
+        stats = scan_fasta(fasta_file)
+    # Entrapment sequences are compared as targets
+    target_lengths = stats['lengths']['target'] + stats['lengths']['entrap']
+    decoy_lengths = stats['lengths']['decoy']
+    target_aa_composition = composition_percent(stats['composition']['target'] + stats['composition']['entrap'])
+    decoy_aa_composition = composition_percent(stats['composition']['decoy'])
 
     # Prepare data for amino acid comparison plot
     aa_df = pd.DataFrame({
@@ -99,31 +154,86 @@ def analyze_decoy_quality(fasta_file):
         'Decoy Composition (%)': [decoy_aa_composition.get(aa, 0) for aa in target_aa_composition.keys()]
     })
 
-    plt.figure(figsize=(8, 6))
-    plt.hist(target_lengths, bins=200, alpha=0.5, label='Target', color='blue')
-    plt.hist(decoy_lengths, bins=200, alpha=0.5, label='Decoy', color='orange')
+    # Sequence length distribution, up to the last non-empty bin
+    used = np.flatnonzero(target_lengths + decoy_lengths)
+    last_bin = used[-1] + 1 if used.size else 1
+    edges = np.arange(last_bin + 1) * LENGTH_BIN_WIDTH
+    fig = plt.figure(figsize=(8, 6))
+    plt.stairs(target_lengths[:last_bin], edges, fill=True, alpha=0.5, label='Target', color='blue')
+    plt.stairs(decoy_lengths[:last_bin], edges, fill=True, alpha=0.5, label='Decoy', color='orange')
     plt.title("Sequence Length Distribution")
     plt.xlabel("Sequence Length")
     plt.ylabel("Frequency")
     plt.legend()
-    plt.show()
+    save_figure(fig, output_dir, 'sequence_lengths')
 
-    # 2. Amino Acid Composition Comparison
-    plt.figure(figsize=(10, 6))
-    aa_df.plot(
+    # Amino Acid Composition Comparison
+    ax = aa_df.plot(
         x='Amino Acid',
         y=['Target Composition (%)', 'Decoy Composition (%)'],
         kind='bar',
-        color=['blue', 'orange']
+        color=['blue', 'orange'],
+        figsize=(10, 6)
     )
-    plt.title("Amino Acid Composition: Target vs. Decoy")
-    plt.xlabel("Amino Acid")
-    plt.ylabel("Composition (%)")
-    plt.legend(["Target", "Decoy"])
-    plt.tight_layout()
-    plt.show()
-
-# Example usage
-fasta_file = 'Homo-sapiens-uniprot-reviewed-contam-entrap-decoy-20241105.fasta'
-analyze_protein_database(fasta_file)
-analyze_decoy_quality(fasta_file)
\ No newline at end of file
+    ax.set_title("Amino Acid Composition: Target vs. Decoy")
+    ax.set_xlabel("Amino Acid")
+    ax.set_ylabel("Composition (%)")
+    ax.legend(["Target", "Decoy"])
+    ax.figure.tight_layout()
+    save_figure(ax.figure, output_dir, 'aa_composition')
+
+    return {'lengths': {category: histogram_summary(stats['lengths'][category]) for category in CATEGORIES},
+            'composition': {'target': {aa: round(value, 4) for aa, value in target_aa_composition.items()},
+                            'decoy': {aa: round(value, 4) for aa, value in decoy_aa_composition.items()}}}
+
+
+def write_tables(stats, output_dir):
+    """Length histograms and residue counts of every category as TSV files."""
+    lengths = pd.DataFrame({category: stats['lengths'][category] for category in CATEGORIES})
+    lengths.insert(0, 'length_from', np.arange(LENGTH_BINS) * LENGTH_BIN_WIDTH)
+    lengths.insert(1, 'length_to', (lengths['length_from'] + LENGTH_BIN_WIDTH - 1).astype('Int64'))
+    lengths.loc[LENGTH_BINS - 1, 'length_to'] = pd.NA
+    lengths = lengths[lengths[CATEGORIES].sum(axis=1) > 0]
+    lengths.to_csv(os.path.join(output_dir, 'lengths.tsv'), sep='\t', index=False)
+
+    residues = sorted(set().union(*(np.flatnonzero(stats['composition'][category]) for category in CATEGORIES)))
+    composition = pd.DataFrame({category: stats['composition'][category][residues] for category in CATEGORIES})
+    composition.insert(0, 'residue', [chr(code) for code in residues])
+    composition.to_csv(os.path.join(output_dir, 'composition.tsv'), sep='\t', index=False)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Quality control of a target/decoy/entrapment protein database.")
+    parser.add_argument('fasta_file', nargs='?', default='Homo-sapiens-uniprot-reviewed-contam-entrap-decoy-20241105.fasta',
+                        help="Protein database in FASTA format.")
+    parser.add_argument('-o', '--output-dir', default='qc-report',
+                        help="Directory of the summary, tables and figures (default: %(default)s).")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="Number of worker processes scanning the database (default: number of CPUs).")
+    parser.add_argument('--digest', action='store_true',
+                        help="Also digest the database in silico and report peptide overlaps between categories.")
+    parser.add_argument('--enzyme', choices=sorted(fasta_digest.ENZYMES), default='trypsin')
+    parser.add_argument('--missed-cleavages', type=int, default=2)
+    parser.add_argument('--min-length', type=int, default=7, help="Minimum peptide length (default: %(default)s).")
+    parser.add_argument('--max-length', type=int, default=30, help="Maximum peptide length (default: %(default)s).")
+    parser.add_argument('--i2l', action='store_true', help="Consider I and L as the same residue.")
+    parser.add_argument('--memory-mb', type=int, default=fasta_digest.DEFAULT_MEMORY_MB,
+                        help="Approximate memory budget of the peptide sets (default: %(default)s).")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    # both analyses share a single pass over the database
+    stats = scan_fasta(args.fasta_file, args.jobs)
+    summary = {'database': os.path.basename(args.fasta_file)}
+    summary.update(analyze_protein_database(args.fasta_file, stats, args.output_dir))
+    summary.update(analyze_decoy_quality(args.fasta_file, stats, args.output_dir))
+    if args.digest:
+        peptides = fasta_digest.peptide_stats(args.fasta_file, args.enzyme, args.missed_cleavages, args.min_length,
+                                              args.max_length, args.i2l, args.jobs, memory_mb=args.memory_mb)
+        fasta_digest.print_peptide_stats(peptides)
+        summary['peptides'] = dict(peptides, enzyme=args.enzyme, missed_cleavages=args.missed_cleavages,
+                                   min_length=args.min_length, max_length=args.max_length, i2l=args.i2l)
+    write_tables(stats, args.output_dir)
+    with open(os.path.join(args.output_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+    print(f"Report written to {args.output_dir}")
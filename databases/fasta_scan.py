@@ -0,0 +1,151 @@
+"""
+Multi-core scanning engine for large FASTA files.
+
+The file is memory-mapped and split into chunks of about chunk_size bytes that always start at a
+record header ('>'). Every chunk is handed to a worker process, which applies a function to the
+(header, sequence) records of its chunk and returns an aggregate (counts, histograms, composition
+vectors...). The aggregates of all chunks are then merged into the result.
+
+    result = scan('database.fasta', count_records, operator.add, initial=0, jobs=8)
+
+Functions passed to scan() must be picklable, i.e. defined at module level. Compressed files cannot
+be memory-mapped; open_fasta() and iter_fasta() read plain and gzip files sequentially.
+"""
+
+import gzip
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import repeat
+
+DEFAULT_CHUNK_SIZE = 64 << 20
+LINE_WIDTH = 60
+# level of the gzip files written: the default of gzip(1) rather than the slow maximum of gzip.open
+GZIP_LEVEL = 6
+
+CATEGORIES = ['target', 'decoy', 'entrap']
+
+
+def header_category(header):
+    """Category of a FASTA header (bytes): decoy, entrap or target. Decoy entrapments count as decoys."""
+    if b'DECOY_' in header:
+        return 'decoy'
+    if b'ENTRAP_' in header:
+        return 'entrap'
+    return 'target'
+
+
+def first_record(buf):
+    """Offset of the first record header ('>') of buf, or -1 if there is none."""
+    if buf[:1] == b'>':
+        return 0
+    start = buf.find(b'\n>')
+    return -1 if start == -1 else start + 1
+
+
+def chunk_boundaries(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """(start, end) byte offsets of chunks of about chunk_size bytes, each starting at a record header."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = first_record(buf)
+        if start == -1:
+            return []
+        while start < size:
+            target = start + chunk_size
+            if target >= size:
+                end = size
+            else:
+                following = buf.find(b'\n>', target - 1)
+                end = size if following == -1 else following + 1
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def iter_record_offsets(buf, start, end):
+    """Yield the (start, header end, end) byte offsets of the records between the offsets start and end of buf.
+
+    start must be at a record header. The header end is the offset of the line break ending the header,
+    or the end of the record if it has none.
+    """
+    pos = start
+    while pos < end:
+        header_end = buf.find(b'\n', pos, end)
+        if header_end == -1:
+            yield pos, end, end
+            return
+        following = buf.find(b'\n>', header_end, end)
+        record_end = end if following == -1 else following + 1
+        yield pos, header_end, record_end
+        pos = record_end
+
+
+def iter_records(buf, start, end):
+    """Yield the (header, sequence) records between the offsets start and end of buf.
+
+    The header is returned without the leading '>' and the sequence without line breaks, both as bytes.
+    """
+    for pos, header_end, record_end in iter_record_offsets(buf, start, end):
+        sequence = buf[header_end + 1:record_end].replace(b'\n', b'').replace(b'\r', b'')
+        yield buf[pos + 1:header_end].rstrip(b'\r'), sequence
+
+
+def scan_chunk(path, func, start, end):
+    """Apply func to the records of one chunk of the file at path."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return func(iter_records(buf, start, end))
+
+
+def scan(path, func, merge, initial, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Apply func to the records of every chunk of a FASTA file and merge the results, starting from initial.
+
+    With jobs > 1 the chunks are processed by a pool of worker processes.
+    """
+    bounds = chunk_boundaries(path, chunk_size)
+    starts = [start for start, _ in bounds]
+    ends = [end for _, end in bounds]
+    if jobs <= 1 or len(bounds) <= 1:
+        results = map(scan_chunk, repeat(path), repeat(func), starts, ends)
+        return reduce(merge, results, initial)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(scan_chunk, repeat(path), repeat(func), starts, ends)
+        return reduce(merge, results, initial)
+
+
+def open_fasta(path, mode='rb', compresslevel=GZIP_LEVEL):
+    """Open a plain or gzip-compressed FASTA file in binary mode; gzip is detected from the .gz extension.
+
+    compresslevel is the gzip compression level of files opened for writing.
+    """
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode, compresslevel=compresslevel)
+    return open(path, mode)
+
+
+def iter_fasta(path):
+    """Yield the (header, sequence) records of a plain or gzip FASTA file, streaming it line by line."""
+    header = None
+    sequence = []
+    with open_fasta(path) as f:
+        for line in f:
+            line = line.rstrip()
+            if line.startswith(b'>'):
+                if header is not None:
+                    yield header, b''.join(sequence)
+                header = line[1:]
+                sequence = []
+            elif header is not None and line:
+                sequence.append(line)
+    if header is not None:
+        yield header, b''.join(sequence)
+
+
+def format_record(header, sequence, line_width=LINE_WIDTH):
+    """FASTA record (bytes) of a header without '>' and a sequence, wrapped at line_width residues."""
+    lines = [b'>' + header]
+    lines.extend(sequence[i:i + line_width] for i in range(0, len(sequence), line_width))
+    return b'\n'.join(lines) + b'\n'
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the UniProt REST endpoint /uniprotkb/accessions?accessions=...&format=fasta, to run
+contaminants_uniprot_description.py without network access:
+
+    python uniprot_standin.py --port 8766 --fasta some-uniprot-entries.fasta
+    python contaminants_uniprot_description.py --url http://127.0.0.1:8766 --no-cache
+
+Header lines are served from the given FASTA file; accessions not in it get a synthetic header, except
+those listed with --missing. Accessions given as --secondary SECONDARY=PRIMARY are answered with the entry
+of their primary accession, and /uniprotkb/search answers sec_acc:ACCESSION queries. Responses are split
+into pages of `size` entries (25 by default, at most --page-size, 500 like the real API), linked with
+Link: rel="next" headers. Isoforms listed with --isoforms are answered with their canonical entry. A
+fraction of the requests can be answered with HTTP 503, and requests including one of the --broken
+accessions are answered with HTTP 400, as UniProt answers invalid accessions.
+"""
+
+import argparse
+import random
+import re
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def read_headers(fasta_file):
+    headers = {}
+    with open(fasta_file) as f:
+        for line in f:
+            if line.startswith('>') and '|' in line:
+                headers[line.split('|')[1]] = line.strip()
+    return headers
+
+
+def synthetic_header(accession):
+    return '>sp|{0}|{0}_STANDIN Stand-in protein {0} OS=Homo sapiens OX=9606 GN=G{0} PE=1 SV=1'.format(accession)
+
+
+class UniProtHandler(BaseHTTPRequestHandler):
+    headers_by_accession = {}
+    missing = set()
+    secondary = {}
+    isoforms = set()
+    broken = set()
+    fail_rate = 0.0
+    page_size = 500
+    counts = {'requests': 0, 'accessions': 0, 'failed': 0}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = urllib.parse.parse_qs(url.query)
+        if url.path.rstrip('/') == '/uniprotkb/accessions':
+            accessions = [a for a in params.get('accessions', [''])[0].split(',') if a]
+        elif url.path.rstrip('/') == '/uniprotkb/search':
+            accessions = re.findall(r'sec_acc:([\w-]+)', params.get('query', [''])[0])
+        else:
+            self.send_error(404)
+            return
+        if random.random() < self.fail_rate or self.broken.intersection(accessions):
+            with self.lock:
+                self.counts['failed'] += 1
+            self.send_error(400 if self.broken.intersection(accessions) else 503)
+            return
+        with self.lock:
+            self.counts['requests'] += 1
+            self.counts['accessions'] += len(accessions)
+        if url.path.rstrip('/') == '/uniprotkb/search':
+            entries = sorted({self.secondary[a] for a in accessions if a in self.secondary})
+            lines = ['Entry\tSecondary accession']
+            for primary in self.page(entries, params):
+                secondaries = sorted(s for s, p in self.secondary.items() if p == primary)
+                lines.append('{}\t{}'.format(primary, '; '.join(secondaries)))
+        else:
+            entries = []
+            for accession in accessions:
+                accession = self.secondary.get(accession, accession)
+                if accession in self.isoforms:
+                    accession = accession.split('-')[0]
+                if accession not in self.missing and accession not in entries:
+                    entries.append(accession)
+            lines = []
+            for accession in self.page(entries, params):
+                lines.append(self.headers_by_accession.get(accession) or synthetic_header(accession))
+                lines.append('MSTANDINSEQ')
+        body = ('\n'.join(lines) + '\n').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        if self.next_link:
+            self.send_header('Link', '<{}>; rel="next"'.format(self.next_link))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def page(self, entries, params):
+        """Entries of the page asked for by the cursor and size parameters; sets the link to the next page."""
+        # the REST API caps the page size at 500 (page_size)
+        size = min(int(params.get('size', [25])[0]), self.page_size)
+        start = int(params.get('cursor', ['0'])[0])
+        self.next_link = None
+        if start + size < len(entries):
+            query = dict((key, values[0]) for key, values in params.items())
+            query['cursor'] = start + size
+            self.next_link = 'http://{}:{}{}?{}'.format(self.server.server_address[0], self.server.server_address[1],
+                                                       urllib.parse.urlsplit(self.path).path,
+                                                       urllib.parse.urlencode(query))
+        return entries[start:start + size]
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port=0, headers=None, missing=(), fail_rate=0.0, secondary=None, broken=(), page_size=500,
+                 isoforms=()):
+    """Start the stand-in in a background thread and return (server, base_url)."""
+    handler = type('Handler', (UniProtHandler,), {'headers_by_accession': headers or {}, 'missing': set(missing),
+                                                  'secondary': dict(secondary or {}), 'broken': set(broken),
+                                                  'isoforms': set(isoforms),
+                                                  'fail_rate': fail_rate, 'page_size': page_size,
+                                                  'counts': {'requests': 0, 'accessions': 0, 'failed': 0}})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for the UniProt accessions endpoint')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--fasta', help='FASTA file whose header lines are served')
+    parser.add_argument('--missing', nargs='*', default=[], help='Accessions answered as not found')
+    parser.add_argument('--secondary', nargs='*', default=[],
+                        help='Secondary accessions, as SECONDARY=PRIMARY, answered with their primary entry')
+    parser.add_argument('--isoforms', nargs='*', default=[], help='Isoforms answered with their canonical entry')
+    parser.add_argument('--broken', nargs='*', default=[], help='Accessions whose requests always fail with HTTP 400')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 503')
+    parser.add_argument('--page-size', type=int, default=500, help='Maximum number of entries per page')
+    args = parser.parse_args()
+    server, url = start_server(args.port, read_headers(args.fasta) if args.fasta else None, args.missing,
+                               args.fail_rate, dict(s.split('=', 1) for s in args.secondary), args.broken,
+                               args.page_size, args.isoforms)
+    print('UniProt stand-in listening on {}'.format(url))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,97 @@
+"""
+Asyncio-based OLS client used by validate.py to resolve organisms, concurrently before validation or
+file by file.
+
+Requests go through a single pooled requests.Session and run in a thread pool, at most `concurrency`
+at a time. Failed requests are retried with exponential backoff and full jitter, and an OlsError is
+raised once all attempts have failed, instead of silently returning None.
+"""
+
+import asyncio
+import random
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OLS_URL = 'https://www.ebi.ac.uk/ols4/api'
+
+
+class OlsError(Exception):
+    """Raised when an OLS request fails after all retries."""
+
+
+class AsyncOlsClient:
+
+    def __init__(self, base_url=OLS_URL, concurrency=8, retries=5, backoff=0.5, max_backoff=30, timeout=30):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._semaphore = None
+        self._loop = None
+
+    def delay(self, attempt):
+        """Seconds to wait before retry number `attempt` (exponential backoff with full jitter)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _get(self, url, params):
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_json(self, path, params=None):
+        loop = asyncio.get_running_loop()
+        # created for each event loop it is used from (asyncio.run starts a new one every time)
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        url = self.base_url + path
+        error = None
+        for attempt in range(self.retries):
+            if attempt:
+                await asyncio.sleep(self.delay(attempt - 1))
+            async with self._semaphore:
+                try:
+                    return await loop.run_in_executor(self.executor, self._get, url, params)
+                except requests.HTTPError as e:
+                    error = e
+                    status = e.response.status_code if e.response is not None else None
+                    # client errors other than rate limiting will not go away by retrying
+                    if status is not None and 400 <= status < 500 and status != 429:
+                        break
+                except (requests.RequestException, ValueError) as e:
+                    error = e
+        raise OlsError('OLS request {} failed: {}'.format(url, error)) from error
+
+    async def besthit(self, name, ontology='ncbitaxon'):
+        """First search hit for a class in an ontology, or None if there is none (as OlsClient.besthit)."""
+        data = await self.get_json('/search', {'q': name, 'type': 'class', 'ontology': ontology})
+        docs = data.get('response', {}).get('docs', [])
+        return docs[0] if docs else None
+
+    async def get_ancestors(self, ontology, iri):
+        """All ancestor terms of a term, following the pages of the OLS response."""
+        # OLS expects the IRI to be URL-encoded twice in the path
+        term = urllib.parse.quote(urllib.parse.quote(iri, safe=''), safe='')
+        path = '/ontologies/{}/terms/{}/ancestors'.format(ontology, term)
+        ancestors = []
+        page = 0
+        while True:
+            data = await self.get_json(path, {'page': page, 'size': 500})
+            ancestors.extend(data.get('_embedded', {}).get('terms', []))
+            page += 1
+            if page >= data.get('page', {}).get('totalPages', 1):
+                return ancestors
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
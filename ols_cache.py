@@ -0,0 +1,89 @@
+"""
+Persistent on-disk cache for OLS lookups used by validate.py.
+
+Results are stored in a small SQLite database so that they are shared between runs and between the
+worker processes of a parallel validation. Every entry is keyed by the kind of lookup (e.g. 'besthit'
+or 'ancestors') and its key (organism name or term IRI), and expires after a configurable TTL.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                                 'multiomics-configs')
+DEFAULT_TTL_DAYS = 30
+
+
+class OlsCache:
+    """SQLite-backed key/value store for OLS responses with hit/miss statistics."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_days=DEFAULT_TTL_DAYS):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, 'ols.sqlite')
+        self.ttl = ttl_days * 24 * 3600
+        self.hits = 0
+        self.misses = 0
+        # lookups are made from the event loop thread, while the OLS requests run in the client's own
+        # threads; the lock keeps the connection safe should it be used from several threads
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS lookups ('
+                          'kind TEXT, key TEXT, value TEXT, created REAL, PRIMARY KEY (kind, key))')
+        self.conn.commit()
+
+    def get(self, kind, key):
+        """Return (found, fresh, value) for a cached lookup."""
+        with self.lock:
+            row = self.conn.execute('SELECT value, created FROM lookups WHERE kind = ? AND key = ?',
+                                    (kind, key)).fetchone()
+        if row is None:
+            return False, False, None
+        value, created = row
+        return True, time.time() - created < self.ttl, json.loads(value)
+
+    def set(self, kind, key, value):
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO lookups (kind, key, value, created) VALUES (?, ?, ?, ?)',
+                              (kind, key, json.dumps(value), time.time()))
+            self.conn.commit()
+
+    async def lookup_async(self, kind, key, fetch):
+        """Return the cached value for (kind, key), awaiting the coroutine function fetch on a miss or an
+        expired entry.
+
+        A fetch returning None is treated as a failed lookup: it is not stored, and a stale entry is
+        returned instead if there is one. Exceptions raised by fetch are propagated unless there is a
+        stale entry to fall back to.
+        """
+        found, fresh, value = self._get_counted(kind, key)
+        if fresh:
+            return value
+        try:
+            fetched = await fetch()
+        except Exception:
+            if found:
+                return value
+            raise
+        if fetched is None:
+            return value if found else None
+        self.set(kind, key, fetched)
+        return fetched
+
+    def _get_counted(self, kind, key):
+        found, fresh, value = self.get(kind, key)
+        with self.lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found, fresh, value
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the OLS search and ancestors endpoints, to exercise the OLS clients of validate.py
+without network access.
+
+    python ols_standin.py --port 8765 --fail-rate 0.2 --latency 0.05
+    python validate.py --ols-url http://localhost:8765 ...
+
+Only the NCBITaxon terms in TAXA and the terms of other ontologies in TERMS are known; the search also
+serves the ontology term validations of sdrf-pipelines when its OlsClient is pointed at the stand-in. A
+fraction of the requests can be answered with HTTP 500 to exercise retries and backoff.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+VERTEBRATES = ['cellular organisms', 'Eukaryota', 'Opisthokonta', 'Metazoa', 'Chordata',
+               'Gnathostomata <vertebrates>']
+INVERTEBRATES = ['cellular organisms', 'Eukaryota', 'Opisthokonta', 'Metazoa', 'Ecdysozoa']
+PLANTS = ['cellular organisms', 'Eukaryota', 'Viridiplantae', 'Streptophyta']
+FUNGI = ['cellular organisms', 'Eukaryota', 'Opisthokonta', 'Fungi']
+BACTERIA = ['cellular organisms', 'Bacteria']
+
+# label -> (NCBITaxon id, ancestor labels)
+TAXA = {
+    'homo sapiens': (9606, VERTEBRATES),
+    'mus musculus': (10090, VERTEBRATES),
+    'rattus norvegicus': (10116, VERTEBRATES),
+    'bos taurus': (9913, VERTEBRATES),
+    'sus scrofa': (9823, VERTEBRATES),
+    'danio rerio': (7955, VERTEBRATES),
+    'gallus gallus': (9031, VERTEBRATES),
+    'drosophila melanogaster': (7227, INVERTEBRATES),
+    'caenorhabditis elegans': (6239, INVERTEBRATES),
+    'arabidopsis thaliana': (3702, PLANTS),
+    'oryza sativa': (4530, PLANTS),
+    'saccharomyces cerevisiae': (4932, FUNGI),
+    'escherichia coli': (562, BACTERIA),
+}
+
+# ontology -> labels of the terms used in the SDRF columns validated against that ontology
+TERMS = {
+    'pride': ['label free sample', 'tmt126', 'tmt127n', 'tmt127c', 'tmt128n', 'tmt128c', 'tmt129n', 'tmt129c',
+              'tmt130n', 'tmt130c', 'tmt131'],
+    'ms': ['q exactive hf', 'orbitrap fusion lumos', 'trypsin', 'lys-c'],
+    'unimod': ['oxidation', 'carbamidomethyl', 'acetyl', 'phospho', 'tmt6plex'],
+}
+
+IRI_PREFIX = 'http://purl.obolibrary.org/obo/NCBITaxon_'
+
+
+def term(label, taxon_id):
+    return {'iri': IRI_PREFIX + str(taxon_id), 'label': label, 'ontology_name': 'ncbitaxon',
+            'obo_id': 'NCBITaxon:{}'.format(taxon_id), 'short_form': 'NCBITaxon_{}'.format(taxon_id)}
+
+
+class OlsHandler(BaseHTTPRequestHandler):
+    taxa = TAXA
+    fail_rate = 0.0
+    latency = 0.0
+    counts = {'search': 0, 'ancestors': 0, 'failed': 0}
+    lock = threading.Lock()
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = urllib.parse.parse_qs(url.query)
+        if self.latency:
+            time.sleep(self.latency)
+        if random.random() < self.fail_rate:
+            with self.lock:
+                self.counts['failed'] += 1
+            return self.send_json(500, {'error': 'injected failure'})
+        parts = url.path.rstrip('/').split('/')
+        if parts[-1] == 'search':
+            with self.lock:
+                self.counts['search'] += 1
+            q = params.get('q', [''])[0].lower()
+            ontology = params.get('ontology', ['ncbitaxon'])[0].lower()
+            if ontology == 'ncbitaxon':
+                docs = [term(q, self.taxa[q][0])] if q in self.taxa else []
+            else:
+                docs = [{'iri': 'standin:' + q, 'label': q, 'ontology_name': ontology}] \
+                    if q in TERMS.get(ontology, ()) else []
+            return self.send_json(200, {'response': {'numFound': len(docs), 'start': 0, 'docs': docs}})
+        if len(parts) >= 3 and parts[-1] == 'ancestors' and parts[-3] == 'terms':
+            with self.lock:
+                self.counts['ancestors'] += 1
+            iri = urllib.parse.unquote(urllib.parse.unquote(parts[-2]))
+            for label, (taxon_id, ancestors) in self.taxa.items():
+                if iri == IRI_PREFIX + str(taxon_id):
+                    terms = [{'iri': 'standin:' + a, 'label': a} for a in ancestors]
+                    return self.send_json(200, {'_embedded': {'terms': terms},
+                                                'page': {'size': 500, 'totalElements': len(terms),
+                                                         'totalPages': 1, 'number': 0}})
+        return self.send_json(404, {'error': 'not found'})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port=0, fail_rate=0.0, latency=0.0, taxa=None):
+    """Start the stand-in in a background thread and return (server, base_url)."""
+    handler = type('Handler', (OlsHandler,), {'fail_rate': fail_rate, 'latency': latency,
+                                              'taxa': taxa if taxa is not None else TAXA,
+                                              'counts': {'search': 0, 'ancestors': 0, 'failed': 0}})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for the OLS search and ancestors API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before answering')
+    args = parser.parse_args()
+    server, url = start_server(args.port, args.fail_rate, args.latency)
+    print('OLS stand-in listening on {}'.format(url))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
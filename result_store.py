@@ -0,0 +1,64 @@
+"""
+Persistent store of per-file validation outcomes used by the incremental mode of validate.py.
+
+Each SDRF path has at most one entry, tagged with a key derived from the file content and the
+validation environment. An entry is only returned if the key still matches, so any change to the
+file, the sdrf-pipelines version, the validation templates or the validation code triggers a new validation.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 hex digest of the content of a file."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def result_key(path, environment):
+    """Key of a validation outcome: content digest of the file plus the validation environment."""
+    h = hashlib.sha256(file_digest(path).encode())
+    h.update(json.dumps(environment, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+class ResultStore:
+    """SQLite-backed store of validation results with hit/miss statistics."""
+
+    def __init__(self, cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, 'results.sqlite')
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS results ('
+                          'path TEXT PRIMARY KEY, key TEXT, value TEXT, created REAL)')
+        self.conn.commit()
+
+    def get(self, path, key):
+        """Return the stored result for path if it was stored under key, otherwise None."""
+        row = self.conn.execute('SELECT key, value FROM results WHERE path = ?', (path,)).fetchone()
+        if row is None or row[0] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[1])
+
+    def set(self, path, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO results (path, key, value, created) VALUES (?, ?, ?, ?)',
+                          (path, key, json.dumps(value), time.time()))
+        self.conn.commit()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        self.conn.close()
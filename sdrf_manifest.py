@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Manifest index of all SDRF files in the repository.
+
+The manifest is built by scanning projects/ once and records, for every *.sdrf.tsv file, its path,
+size, mtime, content hash, row count, organisms, label type and acquisition method. It is written next
+to the tree (sdrf-manifest.json beside projects/). Tools such as validate.py select files by querying
+it instead of walking the tree.
+
+    python sdrf_manifest.py build
+    python sdrf_manifest.py query --organism 'mus musculus' --label TMT
+    python sdrf_manifest.py --refresh query --under projects/tumor --acquisition 'data-independent acquisition'
+
+A stored manifest is used as is. With --refresh, projects/ is walked and every file is stat'ed: entries
+of files whose size and mtime did not change are reused without re-reading them, new files are scanned
+and entries of deleted files are dropped; the manifest is only written back if an entry changed.
+validate.py refreshes the manifest on every run unless --no-refresh-manifest is given.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+
+from result_store import file_digest
+
+PROJECTS_DIR = 'projects'
+MANIFEST_FILE = 'sdrf-manifest.json'
+MANIFEST_VERSION = 1
+
+ORGANISM = 'characteristics[organism]'
+LABEL = 'comment[label]'
+ACQUISITION = 'comment[proteomics data acquisition method]'
+
+
+def term_name(value):
+    """Name of an ontology term annotated as 'NT=name;AC=accession', or the value itself.
+
+    Also used by validate.py to key organisms, so that manifest entries and lookups agree.
+    """
+    m = re.search(r'nt=([^;]*)', value, re.IGNORECASE)
+    return (m.group(1) if m else value).strip().lower()
+
+
+def label_type(labels):
+    """Summarise the values of the label column as one of TMT, iTRAQ, SILAC, label free, mixed or unknown."""
+    types = set()
+    for label in labels:
+        if 'tmt' in label:
+            types.add('TMT')
+        elif 'itraq' in label:
+            types.add('iTRAQ')
+        elif 'silac' in label:
+            types.add('SILAC')
+        elif 'label free' in label:
+            types.add('label free')
+        else:
+            types.add('unknown')
+    if len(types) > 1:
+        return 'mixed'
+    return types.pop() if types else 'unknown'
+
+
+def scan_sdrf(path):
+    """Manifest entry of a single SDRF file."""
+    st = os.stat(path)
+    organisms = set()
+    labels = set()
+    acquisitions = set()
+    rows = 0
+    with open(path, newline='', encoding='utf-8', errors='replace') as f:
+        reader = csv.reader(f, delimiter='\t')
+        header = [h.strip().lower() for h in next(reader, [])]
+        org_idx = [i for i, h in enumerate(header) if h == ORGANISM]
+        label_idx = [i for i, h in enumerate(header) if h == LABEL]
+        acq_idx = [i for i, h in enumerate(header) if h == ACQUISITION]
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            rows += 1
+            for indices, values in ((org_idx, organisms), (label_idx, labels), (acq_idx, acquisitions)):
+                for i in indices:
+                    if i < len(row) and row[i].strip():
+                        values.add(term_name(row[i]))
+    return {
+        'path': path,
+        'size': st.st_size,
+        'mtime': st.st_mtime,
+        'sha256': file_digest(path),
+        'rows': rows,
+        'organisms': sorted(organisms),
+        'label': label_type(labels),
+        'acquisition': ', '.join(sorted(acquisitions)) if acquisitions else 'not available',
+    }
+
+
+def find_sdrfs(root=PROJECTS_DIR):
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        paths.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith('.sdrf.tsv'))
+    return paths
+
+
+def build_manifest(root=PROJECTS_DIR, previous=None):
+    """Scan root for SDRF files, reusing entries of `previous` for files with unchanged size and mtime."""
+    known = {e['path']: e for e in previous['files']} if previous else {}
+    files = []
+    for path in find_sdrfs(root):
+        try:
+            st = os.stat(path)
+            entry = known.get(path)
+            if entry is None or entry['size'] != st.st_size or entry['mtime'] != st.st_mtime:
+                entry = scan_sdrf(path)
+        except OSError:
+            # deleted while scanning
+            continue
+        files.append(entry)
+    return {'version': MANIFEST_VERSION, 'root': root, 'files': files}
+
+
+def manifest_path(root=PROJECTS_DIR):
+    """Default location of the manifest of the files under root: next to root."""
+    return os.path.join(os.path.dirname(os.path.abspath(root)), MANIFEST_FILE)
+
+
+def write_manifest(manifest, path=MANIFEST_FILE):
+    with open(path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+
+def read_manifest(path=MANIFEST_FILE):
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError('Unsupported manifest version in {}: {}'.format(path, manifest.get('version')))
+    return manifest
+
+
+def load_manifest(path=None, root=PROJECTS_DIR, refresh=False, rebuild=False):
+    """Read the manifest of the files under root, building it if there is none (path defaults to manifest_path).
+
+    With refresh, the manifest is checked against the files under root and written back if it changed.
+    With rebuild, every file is scanned again instead of reusing the entries of unchanged files.
+    """
+    path = path or manifest_path(root)
+    previous = None
+    if os.path.exists(path) and not rebuild:
+        try:
+            previous = read_manifest(path)
+        except ValueError:
+            previous = None
+    if previous is not None and previous.get('root') == root and not refresh:
+        return previous
+    manifest = build_manifest(root, previous)
+    if previous is None or manifest != previous:
+        write_manifest(manifest, path)
+    return manifest
+
+
+def drop_missing(manifest):
+    """Remove the entries of files that no longer exist from the manifest and return their paths."""
+    files = []
+    missing = []
+    for entry in manifest['files']:
+        (files if os.path.exists(entry['path']) else missing).append(entry)
+    manifest['files'] = files
+    return [entry['path'] for entry in missing]
+
+
+def query(manifest, organism=None, label=None, acquisition=None, under=None):
+    """Manifest entries matching all given filters (case-insensitive; under is a path prefix)."""
+    entries = []
+    for entry in manifest['files']:
+        if organism and organism.lower() not in entry['organisms']:
+            continue
+        if label and label.lower() != entry['label'].lower():
+            continue
+        if acquisition and acquisition.lower() not in entry['acquisition'].lower():
+            continue
+        if under and not entry['path'].startswith(under.rstrip('/') + '/'):
+            continue
+        entries.append(entry)
+    return entries
+
+
+def add_filter_arguments(parser):
+    parser.add_argument('--organism', help='Only files with this organism')
+    parser.add_argument('--label', help='Only files with this label type (TMT, iTRAQ, SILAC, label free, mixed)')
+    parser.add_argument('--acquisition', help='Only files whose acquisition method contains this text')
+    parser.add_argument('--under', help='Only files below this directory')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build or query the manifest of SDRF files')
+    parser.add_argument('-m', '--manifest', help='Manifest file (default: {} next to the root)'.format(MANIFEST_FILE))
+    parser.add_argument('-r', '--root', default=PROJECTS_DIR, help='Directory to scan (default: %(default)s)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Check the root for new, changed and deleted SDRF files before querying')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Scan all the SDRF files again and write the manifest')
+    query_parser = subparsers.add_parser('query', help='Print the paths of the SDRF files matching the filters')
+    add_filter_arguments(query_parser)
+    query_parser.add_argument('--long', action='store_true', help='Also print rows, organisms, label and acquisition')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        manifest = load_manifest(args.manifest, args.root, rebuild=True)
+        print('{} SDRF files written to {}'.format(len(manifest['files']), args.manifest or manifest_path(args.root)),
+              file=sys.stderr)
+    else:
+        manifest = load_manifest(args.manifest, args.root, refresh=args.refresh)
+        for entry in query(manifest, args.organism, args.label, args.acquisition, args.under):
+            if args.long:
+                print(entry['path'], entry['rows'], ','.join(entry['organisms']), entry['label'],
+                      entry['acquisition'], sep='\t')
+            else:
+                print(entry['path'])
@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'databases'))
+
+import contaminants_uniprot_description as cud
+from uniprot_standin import start_server, synthetic_header
+
+ACCESSIONS = ['P{:05d}'.format(i) for i in range(40)]
+
+
+@pytest.fixture
+def standin():
+    random.seed(0)
+    server, url = start_server(missing=['P00003'], secondary={'Q11111': 'P00001', 'Q22222': 'P00050'},
+                               isoforms=['P00002-2'], broken=['P00007'], fail_rate=0.1, page_size=3)
+    yield server, url
+    server.shutdown()
+
+
+def test_fetch_descriptions(standin):
+    server, url = standin
+    accessions = ['Q11111', 'P00002-2'] + ACCESSIONS + ['Q22222']
+    headers, failed = cud.fetch_descriptions(accessions, url, batch_size=16, concurrency=3)
+    # a batch with the broken accession is split down to that accession alone
+    assert failed == ['P00007']
+    assert set(headers) == set(accessions) - {'P00007'}
+    assert headers['P00000'] == synthetic_header('P00000')
+    assert headers['P00003'] == cud.NOT_FOUND
+    # secondary accessions, also with their primary accession in the same batch, and isoforms
+    assert headers['Q11111'] == synthetic_header('P00001')
+    assert headers['Q22222'] == synthetic_header('P00050')
+    assert headers['P00002-2'] == synthetic_header('P00002')
+    # entries come in pages of 3 and were retried after the injected 503s
+    assert server.RequestHandlerClass.counts['requests'] > len(accessions) / 3
+
+
+def write_contaminants(path, accessions):
+    with open(path, 'w') as f:
+        for accession in accessions:
+            f.write('>sp|CONTAM_{}|\nMSEQ\n'.format(accession))
+
+
+def test_add_descriptions_reuses_cache(standin, tmp_path):
+    server, url = standin
+    counts = server.RequestHandlerClass.counts
+    fasta = str(tmp_path / 'contaminants.fasta')
+    output = str(tmp_path / 'described.fasta')
+    cache = str(tmp_path / 'cache' / 'headers.tsv')
+    write_contaminants(fasta, ACCESSIONS[:10])
+    assert cud.add_descriptions(fasta, output, cache, url, batch_size=4) == 1
+    with open(output) as f:
+        described = f.read()
+    assert 'Stand-in protein P00000' in described
+    assert 'not found for accession P00003' in described
+    assert 'could not be fetched for accession P00007' in described
+
+    # only the accession that failed is requested again, and fails again
+    served, failed = counts['accessions'], counts['failed']
+    assert cud.add_descriptions(fasta, output, cache, url, batch_size=4) == 1
+    assert counts['accessions'] == served
+    assert counts['failed'] > failed
+    assert set(cud.read_cache(cache)) == set(ACCESSIONS[:10]) - {'P00007'}
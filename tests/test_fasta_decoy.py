@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'databases'))
+
+import fasta_decoy
+from fasta_decoy import build_database, protein_seeds, transform
+from fasta_scan import iter_fasta
+
+CONTAMINANTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'databases',
+                            'contaminants-202105-uniprot.fasta')
+
+
+def random_sequences(n=200, seed=0):
+    rng = random.Random(seed)
+    sequences = [''.join(rng.choice('ACDEFGHIKLMNPQRSTVWYKR') for _ in range(rng.randint(0, 80))).encode()
+                 for _ in range(n)]
+    # empty proteins, single residues and proteins ending or starting with cleavage sites
+    return sequences + [b'', b'K', b'KR', b'RPK', b'MKKK', b'']
+
+
+def seeds_for(sequences):
+    return protein_seeds([b'sp|P%05d|X' % i for i in range(len(sequences))], 42, b'test')
+
+
+def test_reverse_keeps_cleavage_sites():
+    sequences = random_sequences()
+    for decoy, target in zip(transform(sequences, 'reverse', enzyme='trypsin/p'), sequences):
+        assert len(decoy) == len(target)
+        assert [i for i, r in enumerate(target) if r in b'KR'] == [i for i, r in enumerate(decoy) if r in b'KR']
+        assert decoy[-1:] == target[-1:]
+
+
+@pytest.mark.parametrize('method', ['reverse', 'shuffle'])
+@pytest.mark.parametrize('fix_terminus', ['c', 'n', 'none'])
+@pytest.mark.parametrize('enzyme', ['trypsin/p', 'lys-n', None])
+def test_transform_permutes_each_sequence(method, fix_terminus, enzyme):
+    sequences = random_sequences()
+    out = transform(sequences, method, seeds_for(sequences), fix_terminus, enzyme)
+    assert len(out) == len(sequences)
+    for sequence, target in zip(out, sequences):
+        assert sorted(sequence) == sorted(target)
+        if fix_terminus == 'c':
+            assert sequence[-1:] == target[-1:]
+        elif fix_terminus == 'n':
+            assert sequence[:1] == target[:1]
+
+
+def test_transform_without_residues():
+    assert transform([b'', b''], 'shuffle', seeds_for([b'', b''])) == [b'', b'']
+
+
+def test_lexsort_fallback_matches_packed_keys(monkeypatch):
+    sequences = random_sequences()
+    packed = transform(sequences, 'shuffle', seeds_for(sequences), 'c', 'trypsin/p')
+    monkeypatch.setattr(fasta_decoy, 'PACKED_UNITS', 0)
+    assert transform(sequences, 'shuffle', seeds_for(sequences), 'c', 'trypsin/p') == packed
+
+
+def test_build_database_independent_of_jobs(tmp_path):
+    outputs = []
+    for jobs in (1, 2):
+        output = str(tmp_path / 'database-{}.fasta'.format(jobs))
+        targets = build_database([CONTAMINANTS], output, jobs=jobs, batch_records=50)
+        with open(output, 'rb') as f:
+            outputs.append(f.read())
+    assert targets == sum(1 for _ in iter_fasta(CONTAMINANTS))
+    assert outputs[0] == outputs[1]
+    assert outputs[0].count(b'>DECOY_ENTRAP_') == targets
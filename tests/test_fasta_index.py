@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'databases'))
+
+import fasta_scan
+from fasta_duplicates import SEQUENCE_CATEGORIES, sequence_category
+from fasta_index import build_index, header_accession, open_index
+from fasta_scan import iter_fasta
+
+CONTAMINANTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'databases',
+                            'contaminants-202105-uniprot.fasta')
+
+
+def records_of(path, chunk_size):
+    return fasta_scan.scan(path, list, lambda a, b: a + b, [], chunk_size=chunk_size)
+
+
+def test_index_returns_every_record(tmp_path):
+    path = str(tmp_path / 'contaminants.fasta')
+    with open(CONTAMINANTS, 'rb') as f, open(path, 'wb') as out:
+        out.write(f.read())
+    records = list(iter_fasta(path))
+    assert build_index(path) == len(records)
+    with open_index(path) as index:
+        for header, sequence in records:
+            assert index.get(header_accession(header)) == (header, sequence)
+        assert index.get('CONTAM_NOT_THERE') is None
+
+
+def test_index_and_scan_share_record_splitting(tmp_path):
+    path = str(tmp_path / 'test.fasta')
+    # text before the first record, CRLF line breaks, an empty record and no final line break
+    with open(path, 'wb') as f:
+        f.write(b'comment\n>sp|P1|A\r\nMKR\r\nLLK\r\n>sp|P2|B\n>sp|P3|C\nMPEPTIDE')
+    expected = [(b'sp|P1|A', b'MKRLLK'), (b'sp|P2|B', b''), (b'sp|P3|C', b'MPEPTIDE')]
+    assert records_of(path, 1) == expected
+    assert records_of(path, 1 << 20) == expected
+    assert build_index(path) == 3
+    with open_index(path) as index:
+        assert [index.get(accession) for accession in ('P1', 'P2', 'P3')] == expected
+
+
+def test_index_without_records(tmp_path):
+    path = str(tmp_path / 'empty.fasta')
+    with open(path, 'wb') as f:
+        f.write(b'no records\n')
+    assert build_index(path) == 0
+    assert records_of(path, 1) == []
+
+
+def test_duplicates_use_scan_categories():
+    categories = [SEQUENCE_CATEGORIES[sequence_category(header)]
+                  for header in (b'sp|P1|A', b'DECOY_sp|DECOY_P1|A', b'ENTRAP_sp|ENTRAP_P1|A',
+                                 b'sp|CONTAM_P1|A', b'DECOY_sp|DECOY_CONTAM_P1|A')]
+    assert categories == ['target', 'decoy', 'entrap', 'contam', 'decoy']
+    assert SEQUENCE_CATEGORIES[:3] == fasta_scan.CATEGORIES
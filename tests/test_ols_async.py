@@ -0,0 +1,61 @@
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ols_async import AsyncOlsClient, OlsError
+from ols_standin import start_server
+
+ORGANISMS = ['homo sapiens', 'mus musculus', 'danio rerio', 'arabidopsis thaliana', 'escherichia coli']
+
+
+def client_for(fail_rate, **kwargs):
+    random.seed(0)
+    server, url = start_server(fail_rate=fail_rate)
+    return server, AsyncOlsClient(url, concurrency=4, backoff=0.001, **kwargs)
+
+
+def test_transient_errors_are_retried():
+    server, client = client_for(0.5, retries=30)
+
+    async def resolve():
+        return await asyncio.gather(*(client.besthit(org) for org in ORGANISMS))
+
+    try:
+        hits = asyncio.run(resolve())
+        ancestors = asyncio.run(client.get_ancestors('ncbitaxon', hits[1]['iri']))
+    finally:
+        client.close()
+        server.shutdown()
+    assert [hit['label'] for hit in hits] == ORGANISMS
+    assert 'Gnathostomata <vertebrates>' in {a['label'] for a in ancestors}
+    assert server.RequestHandlerClass.counts['failed'] > 0
+
+
+def test_persistent_failure_raises():
+    server, client = client_for(1.0, retries=4)
+    try:
+        with pytest.raises(OlsError):
+            asyncio.run(client.besthit('mus musculus'))
+    finally:
+        client.close()
+        server.shutdown()
+    assert server.RequestHandlerClass.counts['failed'] == 4
+
+
+def test_client_errors_are_not_retried():
+    server, client = client_for(0.0, retries=4)
+    calls = []
+    get = client._get
+    client._get = lambda url, params: calls.append(url) or get(url, params)
+    try:
+        with pytest.raises(OlsError):
+            asyncio.run(client.get_json('/unknown'))
+    finally:
+        client.close()
+        server.shutdown()
+    assert len(calls) == 1
@@ -0,0 +1,43 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ols_cache import OlsCache
+
+
+def lookup(cache, fetch):
+    return asyncio.run(cache.lookup_async('besthit', 'mus musculus', fetch))
+
+
+def test_lookup_async_caches_and_falls_back_to_stale(tmp_path):
+    cache = OlsCache(str(tmp_path), ttl_days=0)
+
+    async def found():
+        return {'hit': 'NCBITaxon_10090'}
+
+    async def failing():
+        raise OSError('OLS unreachable')
+
+    with pytest.raises(OSError):
+        lookup(cache, failing)
+    assert lookup(cache, found) == {'hit': 'NCBITaxon_10090'}
+    # the entry expired at once, so the failure falls back to it
+    assert lookup(cache, failing) == {'hit': 'NCBITaxon_10090'}
+    assert cache.stats() == {'hits': 0, 'misses': 3}
+    cache.close()
+
+
+def test_lookup_async_hit(tmp_path):
+    cache = OlsCache(str(tmp_path))
+
+    async def found():
+        return {'hit': None}
+
+    assert lookup(cache, found) == {'hit': None}
+    assert lookup(cache, None) == {'hit': None}
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+    cache.close()
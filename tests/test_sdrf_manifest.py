@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sdrf_manifest
+
+
+def write_sdrf(path, organism='homo sapiens'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('source name\tcharacteristics[organism]\tcomment[label]\n')
+        f.write('sample 1\t{}\tAC=MS:1002038;NT=label free sample\n'.format(organism))
+
+
+def test_refresh_finds_new_and_drops_deleted_files(tmp_path):
+    root = str(tmp_path / 'projects')
+    first = os.path.join(root, 'PXD000001', 'PXD000001.sdrf.tsv')
+    write_sdrf(first)
+    manifest = sdrf_manifest.load_manifest(root=root)
+    assert [e['path'] for e in manifest['files']] == [first]
+
+    second = os.path.join(root, 'PXD000002', 'PXD000002.sdrf.tsv')
+    write_sdrf(second, 'mus musculus')
+    os.remove(first)
+    # the stored manifest is used as is without refresh
+    assert [e['path'] for e in sdrf_manifest.load_manifest(root=root)['files']] == [first]
+    manifest = sdrf_manifest.load_manifest(root=root, refresh=True)
+    assert [e['path'] for e in manifest['files']] == [second]
+    assert manifest['files'][0]['organisms'] == ['mus musculus']
+
+
+def test_drop_missing(tmp_path):
+    root = str(tmp_path / 'projects')
+    paths = [os.path.join(root, name, name + '.sdrf.tsv') for name in ('PXD000001', 'PXD000002')]
+    for path in paths:
+        write_sdrf(path)
+    manifest = sdrf_manifest.load_manifest(root=root)
+    os.remove(paths[0])
+    manifest = sdrf_manifest.load_manifest(root=root)
+    assert sdrf_manifest.drop_missing(manifest) == [paths[0]]
+    assert [e['path'] for e in manifest['files']] == [paths[1]]
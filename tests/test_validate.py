@@ -0,0 +1,89 @@
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('sdrf_pipelines')
+
+from sdrf_pipelines.sdrf import sdrf, sdrf_schema
+from sdrf_pipelines.zooma import ols
+
+import validate
+from ols_standin import start_server
+from result_store import ResultStore
+
+HEADER = ['source name', 'characteristics[organism]', 'characteristics[organism part]', 'characteristics[disease]',
+          'characteristics[cell type]', 'characteristics[biological replicate]', 'assay name', 'technology type',
+          'comment[data file]', 'comment[technical replicate]', 'comment[fraction identifier]', 'comment[label]',
+          'comment[instrument]', 'comment[modification parameters]', 'comment[cleavage agent details]',
+          'factor value[disease]']
+
+
+@pytest.fixture(scope='module', autouse=True)
+def ols_standin():
+    server, url = start_server()
+    client = sdrf_schema.client
+    sdrf_schema.client = ols.OlsClient(ols_base=url)
+    yield url
+    sdrf_schema.client = client
+    server.shutdown()
+
+
+def write_sdrf(path, rows=60):
+    """SDRF with an all-distinct source name and data file, and a few distinct values in the other columns."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerow(HEADER)
+        for i in range(rows):
+            disease = ['normal', 'not a disease'][i % 2]
+            writer.writerow(['sample {}'.format(i), 'homo sapiens', ['liver', 'brain', 'unknown part'][i % 3], disease,
+                             'not available', '1', 'run {}'.format(i), 'proteomic profiling by mass spectrometry',
+                             'file_{}.raw'.format(i), '1', '1', 'AC=MS:1002038;NT=label free sample',
+                             'NT=Q Exactive HF;AC=MS:1002523', 'NT=Oxidation;MT=Variable;TA=M;AC=UNIMOD:35',
+                             ['AC=MS:1001251;NT=Trypsin', 'NT=unknown enzyme'][i % 4 == 0], disease])
+    return sdrf.SdrfDataFrame.parse(path)
+
+
+def test_unique_value_columns(tmp_path):
+    df = write_sdrf(str(tmp_path / 'test.sdrf.tsv'))
+    columns = validate.unique_value_columns(df)
+    values, rows = columns['source name']
+    assert len(values) == len(df)
+    values, rows = columns['characteristics[organism part]']
+    assert list(values) == ['liver', 'brain', 'unknown part']
+    assert rows[1] == list(range(1, len(df), 3))
+
+
+def test_all_distinct_column_keeps_compression(tmp_path, monkeypatch):
+    df = write_sdrf(str(tmp_path / 'test.sdrf.tsv'))
+    templates = [sdrf_schema.DEFAULT_TEMPLATE, sdrf_schema.HUMAN_TEMPLATE, sdrf_schema.MASS_SPECTROMETRY]
+    full = [[str(e) for e in validate.validate_template(df, t, None)] for t in templates]
+
+    def validate_all_rows(self, template):
+        raise AssertionError('validated every row of {}'.format(template))
+
+    monkeypatch.setattr(sdrf.SdrfDataFrame, 'validate', validate_all_rows)
+    columns = validate.unique_value_columns(df)
+    assert all(validate.compresses(t) for t in templates)
+    compressed = [[str(e) for e in validate.validate_template(df, t, columns)] for t in templates]
+    assert any(full)
+    assert compressed == full
+
+
+def test_incremental_missing_file(tmp_path, monkeypatch):
+    store = ResultStore(str(tmp_path / 'cache'))
+    monkeypatch.setattr(validate, 'store', store)
+    missing = str(tmp_path / 'missing.sdrf.tsv')
+    res = validate.check_sdrf(missing)
+    assert res['crashed']
+    assert not res['stored']
+    assert store.get(missing, None) is None
+    store.close()
+
+
+def test_environment_covers_modules():
+    modules = validate.validation_environment()['modules']
+    assert set(modules) == {'validate.py', 'sdrf_manifest.py', 'ols_async.py', 'ols_cache.py'}
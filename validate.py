@@ -1,59 +1,87 @@
 #!/usr/bin/env python
 
 import os
-import glob
 import sys
 import argparse
 import logging
-import itertools
-import re
+import functools
+import csv
+import copy
+import heapq
+import time
+import importlib.metadata
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 
+import pandas as pd
 from pandas_schema import ValidationWarning
-from sdrf_pipelines.zooma import ols
 from sdrf_pipelines.sdrf import sdrf, sdrf_schema
 
-DIR_LFQ = 'projects/differential-datasets/label-free/'
-DIR_TMT = 'projects/differential-datasets/tmt/'
-DIR_DIA = 'projects/differential-datasets/dia/'
-DIR_ABS = 'projects/absolute-expression/'
+import ols_async
+import ols_cache
+from ols_async import AsyncOlsClient, OlsError, OLS_URL
+from ols_cache import OlsCache, DEFAULT_CACHE_DIR, DEFAULT_TTL_DAYS
+from result_store import ResultStore, file_digest, result_key
+import sdrf_manifest
+from validation_report import timed, peak_rss_kb, file_entry, write_json_report, write_junit_report
 
-def get_files_sdrf():
-  lfq = glob.glob(DIR_LFQ + '**/*.sdrf.tsv')
-  tmt = glob.glob(DIR_TMT + '**/*.sdrf.tsv')
-  dia = glob.glob(DIR_DIA + '**/*.sdrf.tsv')
-  abs = glob.glob(DIR_ABS + '**/**/*.sdrf.tsv')
-  return lfq + tmt + dia + abs
+DEFAULT_MAX_ERRORS = 1000
 
-PROJECTS = os.listdir(DIR_LFQ)
+def get_files_sdrf(manifest):
+  """Paths of the SDRF files in the manifest."""
+  return [entry['path'] for entry in manifest['files']]
 
-client = ols.OlsClient()
+cache = None
+store = None
+# client of the organisms resolved file by file, when there was no prepass or it could not resolve them
+ols_client = None
+# organism name -> template (or None), resolved once for all files before validation
+organism_templates = {}
 
-def retry(func):
-    def wrapper(*args, **kwargs):
-        for i in range(5):
-            try:
-                return func(*args, **kwargs)
-            except Exception:
-                pass
-    return wrapper
 
+def open_caches(cache_dir, ttl_days, use_ols_cache, incremental):
+    """Open the persistent OLS cache and result store. Also used as initializer of the worker processes."""
+    global cache, store
+    if use_ols_cache:
+        cache = OlsCache(cache_dir, ttl_days)
+    if incremental:
+        store = ResultStore(cache_dir)
 
-@retry
-def get_ancestors(iri):
-    return client.get_ancestors('ncbitaxon', iri)
 
+def open_ols_client(ols_url=OLS_URL):
+    global ols_client
+    ols_client = AsyncOlsClient(ols_url, concurrency=1)
 
-def organism_name(s):
-    m = re.search(r'nt=([^;]*)', s)
-    if m:
-        name = m.group(1)
-    else:
-        name = s
-    return name
+
+def init_worker(cache_args, organism_map, ols_url=OLS_URL):
+    """Initializer of the validation worker processes."""
+    global organism_templates
+    open_caches(*cache_args)
+    open_ols_client(ols_url)
+    organism_templates = organism_map
+
+
+@functools.lru_cache(maxsize=None)
+def validation_environment():
+    """Everything besides the file content that a stored validation result depends on."""
+    try:
+        version = importlib.metadata.version('sdrf-pipelines')
+    except importlib.metadata.PackageNotFoundError:
+        version = 'unknown'
+    templates = [sdrf_schema.DEFAULT_TEMPLATE, sdrf_schema.HUMAN_TEMPLATE, sdrf_schema.VERTEBRATES_TEMPLATE,
+                 sdrf_schema.NON_VERTEBRATES_TEMPLATE, sdrf_schema.PLANTS_TEMPLATE,
+                 sdrf_schema.CELL_LINES_TEMPLATE, sdrf_schema.MASS_SPECTROMETRY]
+    # the modules of this repository that pick the templates and produce the results
+    modules = [sys.modules[__name__], sdrf_manifest, ols_async, ols_cache]
+    return {'sdrf-pipelines': version, 'templates': templates,
+            'modules': {os.path.basename(m.__file__): file_digest(m.__file__) for m in modules}}
 
 
-def get_template(df):
-    """Extract organism information and pick a template for validation"""
+def get_template(df, unresolved=None):
+    """Extract organism information and pick a template for validation
+
+    Organisms whose template could not be determined because OLS failed are appended to unresolved.
+    """
     templates = []
     cell = 'characteristics[cell line]'
 
@@ -66,27 +94,121 @@ def get_template(df):
     organisms = df['characteristics[organism]'].unique()
 
     for org in organisms:
-        org = organism_name(org)
-        if org == 'homo sapiens':
-            templates.append(sdrf_schema.HUMAN_TEMPLATE)
+        # the same key as in the manifest and the organism resolution before validation
+        org = sdrf_manifest.term_name(org)
+        if org in organism_templates:
+            template = organism_templates[org]
         else:
-            hit = client.besthit(org, ontology='ncbitaxon')
-            if hit is not None:
-                iri = hit['iri']
-                ancestors = get_ancestors(iri)
-                if ancestors is None:
-                    print('Could not get ancestors for {}!'.format(org))
-                    ancestors = []
-                labels = {a['label'] for a in ancestors}
-                if 'Gnathostomata <vertebrates>' in labels:
-                    templates.append(sdrf_schema.VERTEBRATES_TEMPLATE)
-                elif 'Metazoa' in labels:
-                    templates.append(sdrf_schema.NON_VERTEBRATES_TEMPLATE)
-                elif 'Viridiplantae' in labels:
-                    templates.append(sdrf_schema.PLANTS_TEMPLATE)
+            template = organism_template(org, unresolved)
+        if template is not None:
+            templates.append(template)
     return templates
 
 
+def organism_template(org, unresolved=None):
+    """Pick the organism-specific template for an organism name, or None if there is none.
+
+    Organisms that could not be resolved because OLS failed are appended to unresolved.
+    """
+    if ols_client is None:
+        open_ols_client()
+    try:
+        return asyncio.run(organism_template_async(ols_client, org))
+    except OlsError as e:
+        print('Could not resolve organism {}: {}'.format(org, e))
+        if unresolved is not None:
+            unresolved.append(org)
+        return None
+
+
+def template_from_ancestors(ancestors):
+    labels = {a['label'] for a in ancestors}
+    if 'Gnathostomata <vertebrates>' in labels:
+        return sdrf_schema.VERTEBRATES_TEMPLATE
+    elif 'Metazoa' in labels:
+        return sdrf_schema.NON_VERTEBRATES_TEMPLATE
+    elif 'Viridiplantae' in labels:
+        return sdrf_schema.PLANTS_TEMPLATE
+    return None
+
+
+def collect_organisms(sdrf_files, manifest=None):
+    """Distinct organism names in the 'characteristics[organism]' column of all files.
+
+    Files listed in the manifest with an up-to-date size and mtime are not read again.
+    """
+    organisms = set()
+    known = {e['path']: e for e in manifest['files']} if manifest else {}
+    for sdrf_file in sdrf_files:
+        try:
+            entry = known.get(sdrf_file)
+            if entry is not None:
+                st = os.stat(sdrf_file)
+                if entry['size'] == st.st_size and entry['mtime'] == st.st_mtime:
+                    organisms.update(entry['organisms'])
+                    continue
+            with open(sdrf_file, newline='') as f:
+                reader = csv.reader(f, delimiter='\t')
+                header = [h.strip().lower() for h in next(reader, [])]
+                if 'characteristics[organism]' not in header:
+                    continue
+                index = header.index('characteristics[organism]')
+                for row in reader:
+                    if len(row) > index and row[index].strip():
+                        organisms.add(sdrf_manifest.term_name(row[index]))
+        except (OSError, UnicodeDecodeError):
+            # unreadable files are reported by the per-file validation
+            continue
+    return organisms
+
+
+async def cached_lookup(kind, key, fetch):
+    if cache is None:
+        return await fetch()
+    return await cache.lookup_async(kind, key, fetch)
+
+
+async def organism_template_async(ols_client, org):
+    """Like organism_template(), using the async OLS client. Raises OlsError if OLS cannot be reached."""
+    if org == 'homo sapiens':
+        return sdrf_schema.HUMAN_TEMPLATE
+
+    # wrap the hit so that organisms without a match in NCBITaxon are cached too
+    async def fetch_hit():
+        return {'hit': await ols_client.besthit(org, ontology='ncbitaxon')}
+
+    hit = (await cached_lookup('besthit', org, fetch_hit))['hit']
+    if hit is None:
+        return None
+    iri = hit['iri']
+    ancestors = await cached_lookup('ancestors', iri, lambda: ols_client.get_ancestors('ncbitaxon', iri))
+    return template_from_ancestors(ancestors)
+
+
+async def resolve_organisms_async(organisms, ols_client):
+    results = await asyncio.gather(*(organism_template_async(ols_client, org) for org in organisms),
+                                   return_exceptions=True)
+    resolved = {}
+    for org, template in zip(organisms, results):
+        if isinstance(template, OlsError):
+            # left out of the map, so it is looked up again when validating the files using it
+            print('Could not resolve organism {}: {}'.format(org, template))
+        elif isinstance(template, BaseException):
+            raise template
+        else:
+            resolved[org] = template
+    return resolved
+
+
+def resolve_organisms(organisms, concurrency=8, ols_url=OLS_URL):
+    """Resolve each organism name to its template once, with up to `concurrency` concurrent OLS requests."""
+    ols_client = AsyncOlsClient(ols_url, concurrency=concurrency)
+    try:
+        return asyncio.run(resolve_organisms_async(sorted(organisms), ols_client))
+    finally:
+        ols_client.close()
+
+
 def is_error(err):
     if hasattr(err, '_error_type'):
         return err._error_type == logging.ERROR
@@ -111,87 +233,360 @@ def has_warnings(errors):
     return any(is_warning(err) for err in errors)
 
 
-def collapse_warnings(errors):
-    warnings = [err for err in errors if is_warning(err)]
-    messages = []
-    if warnings:
-        key = lambda w: (w.column, w.message)
-        for keyv, group in itertools.groupby(sorted(warnings, key=key), key=key):
-            col, message = keyv
-            gr = list(group)
-            w = min(gr, key=lambda w: w.row)
+class ErrorAggregator:
+    """Streaming summary of validation errors that uses bounded memory regardless of their number.
+
+    Warnings are collapsed on the fly into a count and the first-row exemplar per (column, message).
+    At most max_errors raw errors and max_errors error messages are retained; the rest are only counted.
+    """
+
+    def __init__(self, max_errors=DEFAULT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.warning_groups = {}
+        self.errors = []
+        self.error_messages = []
+        self.n_errors = 0
+        self.n_warnings = 0
+        self.dropped = 0
+
+    def add(self, err):
+        if len(self.errors) < self.max_errors:
+            self.errors.append(err)
+        else:
+            self.dropped += 1
+        if is_warning(err):
+            self.n_warnings += 1
+            key = (err.column, err.message)
+            group = self.warning_groups.get(key)
+            if group is None:
+                self.warning_groups[key] = [1, err]
+            else:
+                group[0] += 1
+                if err.row < group[1].row:
+                    group[1] = err
+        elif is_error(err):
+            self.n_errors += 1
+            if len(self.error_messages) < self.max_errors:
+                self.error_messages.append(str(err))
+
+    def add_all(self, errors):
+        """Add a batch of errors and return True if any of them is an error (not a warning)."""
+        before = self.n_errors
+        for err in errors:
+            self.add(err)
+        return self.n_errors > before
+
+    def has_errors(self):
+        return self.n_errors > 0
+
+    def has_warnings(self):
+        return self.n_warnings > 0
+
+    def collapsed_warnings(self):
+        messages = []
+        for (col, message), (count, w) in sorted(self.warning_groups.items(), key=lambda kv: kv[0]):
             messages.append('{} validation warnings collapsed on column {} (first row {}, value {}): {}'.format(
-                len(gr), col, w.row, w.value, message))
-    return messages
+                count, col, w.row, w.value, message))
+        return messages
+
+
+def collapse_warnings(errors):
+    aggregator = ErrorAggregator(max_errors=0)
+    aggregator.add_all(errors)
+    return aggregator.collapsed_warnings()
 
 def remove_biological_replicates(errors):
-  err_result = []
-  for err in errors:
-   if 'biological replicate' not in err.message and 'technical replicate' not in err.message:
-     err_result.append(err)
-  return err_result
+  return (err for err in errors
+          if 'biological replicate' not in err.message and 'technical replicate' not in err.message)
+
+def unique_value_columns(df):
+    """The distinct values of every column of df, for the validations of single cells.
+
+    Returns a dict mapping the name of each column (the first one, if several have the same name) to a
+    series of its distinct values, indexed from 0 in order of first appearance, and the list of rows of
+    df carrying each of these values.
+    """
+    columns = {}
+    for j, name in enumerate(df.columns):
+        if name in columns:
+            continue
+        rows_by_value = {}
+        for row, value in zip(df.index, df.iloc[:, j]):
+            rows_by_value.setdefault(value, []).append(row)
+        columns[name] = (pd.Series(list(rows_by_value), name=name, dtype=object), list(rows_by_value.values()))
+    return columns
+
+
+def broadcast_errors(errors, columns):
+    """Map errors found in the distinct values of unique_value_columns() back to every row carrying the value."""
+    streams = []
+    for err in errors:
+        column = columns.get(getattr(err, 'column', None))
+        row = getattr(err, 'row', -1)
+        if column is None or row is None or not 0 <= row < len(column[1]):
+            # not tied to a single cell, e.g. a missing column
+            streams.append([err])
+            continue
+        streams.append(expand_error(err, column[1][row]))
+    # rows of each value are ascending and the merge keeps the order of errors of the same row, so the
+    # errors come as SDRFSchema sorts those of a full validation: by row, then in the order they were found
+    return heapq.merge(*streams, key=lambda e: e.row if e.row is not None else -1)
+
+
+def expand_error(err, rows):
+    for row in rows:
+        e = copy.copy(err)
+        e.row = row
+        yield e
+
+
+# schemas SdrfDataFrame.validate() checks a frame against, per template
+TEMPLATE_SCHEMAS = {
+    sdrf_schema.DEFAULT_TEMPLATE: ['default_schema'],
+    sdrf_schema.HUMAN_TEMPLATE: ['default_schema', 'human_schema'],
+    sdrf_schema.VERTEBRATES_TEMPLATE: ['default_schema', 'vertebrates_chema'],
+    sdrf_schema.NON_VERTEBRATES_TEMPLATE: ['default_schema', 'nonvertebrates_chema'],
+    sdrf_schema.PLANTS_TEMPLATE: ['default_schema', 'plants_chema'],
+    sdrf_schema.CELL_LINES_TEMPLATE: ['default_schema', 'cell_lines_schema'],
+    sdrf_schema.MASS_SPECTROMETRY: ['mass_spectrometry_schema'],
+}
+
+
+def unique_value_schema(name, columns):
+    """Copy of a schema of sdrf_schema whose per-cell validations run on the distinct values of each column.
+
+    Everything that involves several columns or rows (the number of columns, the mandatory columns, the
+    column names and order) is still checked on the frame passed to validate(). The cell errors are
+    mapped back to the rows of that frame and sorted by row like SDRFSchema does, so that validate()
+    returns the errors in the order of a validation of every row.
+    """
+    schema = getattr(sdrf_schema, name)
+
+    def cell_errors(panda_sdrf, validate, missing=True):
+        column_pairs, errors = schema._get_column_pairs(panda_sdrf)
+        # like SDRFSchema, missing columns are only reported by validate_columns
+        if not missing:
+            errors = []
+        found = []
+        for series, column in column_pairs:
+            found.extend(validate(column, columns[column.name][0]))
+        errors.extend(broadcast_errors(found, columns))
+        return sorted(errors, key=lambda e: e.row)
+
+    compressed = copy.copy(schema)
+    compressed.validate_columns = lambda panda_sdrf: cell_errors(panda_sdrf, lambda c, s: c.validate(s))
+    compressed.check_recommendations = lambda panda_sdrf: cell_errors(panda_sdrf, lambda c, s: c.validate_optional(s),
+                                                                      missing=False)
+    return compressed
+
+
+def compresses(template):
+    """Whether the cell validations of a template can run on the distinct values of each column."""
+    names = TEMPLATE_SCHEMAS.get(template)
+    return names is not None and all(hasattr(sdrf_schema, name) for name in names)
+
+
+def validate_template(df, template, columns):
+    """Validate df against a template, using the distinct values of its columns if given.
+
+    Only the per-cell validations of the schema columns run on the distinct values of each column; all
+    other checks run on df itself.
+    """
+    if columns is None or not compresses(template):
+        return df.validate(template)
+    errors = []
+    for name in TEMPLATE_SCHEMAS[template]:
+        errors.extend(unique_value_schema(name, columns).validate(df))
+    return errors
+
+
+def validate_sdrf(sdrf_file, unique_values=True, max_errors=DEFAULT_MAX_ERRORS):
+    """Validate a single SDRF file against the default, organism and mass spectrometry templates.
+
+    Returns a dict with the file name, status (0 = OK, 1 = warnings, 2 = errors), the result line,
+    the templates used, the collapsed warnings, at most max_errors raw validation errors, the error
+    counts per template, the organisms OLS failed to resolve, the wall time per phase and whether every
+    template was validated on the distinct values of each column. This is run in worker processes when
+    validating with several jobs, so everything in the result has to be picklable.
+
+    The peak RSS is that of the process, which validates other files too: peak_rss_kb is only set if
+    validating this file raised it, and peak_rss_increase_kb is by how much.
+    """
+    error_types = set()
+    error_files = set()
+    status = 0
+    templates = []
+    result = 'OK'
+    errors = ErrorAggregator(max_errors)
+    crashed = False
+    timings = {}
+    template_counts = {}
+    unresolved = []
+    # per template validated, whether it ran on the distinct values of each column
+    compressed = []
+    cache_before = cache.stats() if cache is not None else None
+    rss_before = peak_rss_kb()
+
+    def check_template(df, template, columns):
+      compressed.append(columns is not None and compresses(template))
+      n_errors, n_warnings = errors.n_errors, errors.n_warnings
+      failed = errors.add_all(remove_biological_replicates(validate_template(df, template, columns)))
+      template_counts[template] = {'errors': errors.n_errors - n_errors, 'warnings': errors.n_warnings - n_warnings}
+      return failed
+
+    try:
+      with timed(timings, 'parse'):
+        df = sdrf.SdrfDataFrame.parse(sdrf_file)
+      with timed(timings, 'unique values'):
+        columns = unique_value_columns(df) if unique_values else None
+      with timed(timings, 'default'):
+        failed = check_template(df, sdrf_schema.DEFAULT_TEMPLATE, columns)
+      if failed:
+        error_types.add('basic')
+      else:
+        with timed(timings, 'ontology'):
+          templates = get_template(df, unresolved)
+        if templates:
+          for t in templates:
+            with timed(timings, 'organism templates'):
+              failed = check_template(df, t, columns)
+            if failed:
+              error_types.add('{} template'.format(t))
+        with timed(timings, 'mass spectrometry'):
+          failed = check_template(df, sdrf_schema.MASS_SPECTROMETRY, columns)
+        if failed:
+          error_types.add('mass spectrometry')
+      if errors.has_errors():
+        error_files.add(os.path.basename(sdrf_file))
+    except Exception:
+      crashed = True
+    if error_types:
+      result = 'Failed ' + ', '.join(error_types) + ' validation ({})'.format(', '.join(error_files))
+      status = 2
+    elif errors.has_warnings():
+      result = 'OK (with warnings)'
+      status = 1
+    if status < 2:
+      result = '[{} template]\t'.format(', '.join(templates) if templates else 'default') + result
+    cache_stats = None
+    if cache is not None:
+      cache_stats = {k: v - cache_before[k] for k, v in cache.stats().items()}
+    rss_after = peak_rss_kb()
+    rss_increase = rss_after - rss_before if rss_after is not None else None
+    return {'file': sdrf_file, 'status': status, 'result': result, 'templates': templates,
+            'warnings': errors.collapsed_warnings(), 'error_messages': errors.error_messages,
+            'errors': errors.errors, 'dropped': errors.dropped,
+            'dropped_messages': errors.n_errors - len(errors.error_messages), 'crashed': crashed, 'cache': cache_stats,
+            'unresolved_organisms': unresolved, 'stored': False, 'timings': timings, 'template_counts': template_counts,
+            'peak_rss_kb': rss_after if rss_increase else None, 'peak_rss_increase_kb': rss_increase,
+            'compressed': bool(compressed) and all(compressed)}
+
+
+def check_sdrf(sdrf_file, unique_values=True, max_errors=DEFAULT_MAX_ERRORS):
+    """Answer sdrf_file from the result store if it is unchanged since it was last validated, otherwise validate it."""
+    if store is None:
+        return validate_sdrf(sdrf_file, unique_values, max_errors)
+    # the options change the stored messages: truncated to max_errors, and from the distinct values per column
+    try:
+        key = result_key(sdrf_file, dict(validation_environment(), unique_values=unique_values, max_errors=max_errors))
+    except OSError:
+        # a missing or unreadable file is reported as crashed by the validation, and never stored
+        return validate_sdrf(sdrf_file, unique_values, max_errors)
+    res = store.get(sdrf_file, key)
+    if res is not None:
+        res.update({'file': sdrf_file, 'errors': None, 'dropped': 0, 'crashed': False, 'cache': None,
+                    'unresolved_organisms': [], 'stored': True, 'timings': {}, 'peak_rss_kb': None,
+                    'peak_rss_increase_kb': 0, 'compressed': None})
+        return res
+    res = validate_sdrf(sdrf_file, unique_values, max_errors)
+    # without the template of an organism the file was only partially validated: validate it again next time
+    if not res['crashed'] and not res['unresolved_organisms']:
+        store.set(sdrf_file, key, {k: res[k] for k in ('status', 'result', 'templates', 'warnings', 'error_messages',
+                                              'dropped_messages', 'template_counts')})
+    return res
+
+
+def print_result(res, verbose):
+    if res['crashed']:
+      print(res['file'])
+    # results answered from the store only keep collapsed warnings and error messages
+    if verbose == 2 and res['errors'] is not None:
+      for err in res['errors']:
+        print(err)
+      if res['dropped']:
+        print('... {} more validation errors and warnings not shown'.format(res['dropped']))
+    elif verbose:
+      for w in res['warnings']:
+        print(w)
+      for err in res['error_messages']:
+        print(err)
+      if res['dropped_messages']:
+        print('... {} more validation errors not shown'.format(res['dropped_messages']))
+    print(res['file'], res['result'], sep='\t')
+
+
+def iter_results(sdrf_files, jobs, cache_args, check=check_sdrf, ols_url=OLS_URL):
+    """Yield check(sdrf_file) in the order of sdrf_files, using a process pool if jobs > 1."""
+    if jobs <= 1:
+      for sdrf_file in sdrf_files:
+        yield check(sdrf_file)
+      return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(cache_args, organism_templates, ols_url)) as executor:
+      futures = [executor.submit(check, sdrf_file) for sdrf_file in sdrf_files]
+      try:
+        for future in futures:
+          yield future.result()
+      finally:
+        for future in futures:
+          future.cancel()
+
 
 def main(args):
+    start = time.perf_counter()
     statuses = []
-    messages = []
+    entries = []
+    cache_stats = {'hits': 0, 'misses': 0}
+    stored = 0
+    cache_args = (args.cache_dir, args.cache_ttl, not args.no_cache, args.incremental)
+    check = functools.partial(check_sdrf, unique_values=not args.all_rows, max_errors=args.max_errors)
+    manifest = None
     if args.project:
         sdrf_files = [args.project[1]]
     else:
-        sdrf_files = get_files_sdrf()
+        manifest = sdrf_manifest.load_manifest(args.manifest, refresh=not args.no_refresh_manifest,
+                                               rebuild=args.rebuild_manifest)
+        # without the refresh, files deleted since the manifest was written are still listed
+        missing = sdrf_manifest.drop_missing(manifest)
+        if missing:
+            print('{} SDRF files listed in the manifest no longer exist and are not validated:'.format(len(missing)))
+            for path in missing:
+                print(path)
+        if args.organism or args.label or args.acquisition or args.under:
+            sdrf_files = [e['path'] for e in sdrf_manifest.query(manifest, args.organism, args.label,
+                                                                 args.acquisition, args.under)]
+        else:
+            sdrf_files = get_files_sdrf(manifest)
+    open_caches(*cache_args)
+    open_ols_client(args.ols_url)
+    prepass = {}
+    if not args.no_prepass:
+      with timed(prepass, 'organism resolution'):
+        organism_templates.update(resolve_organisms(collect_organisms(sdrf_files, manifest), args.ols_concurrency,
+                                                    args.ols_url))
+      if cache is not None:
+        cache_stats.update(cache.stats())
     i = 0
     try:
-      for sdrf_file in sdrf_files:
-        error_types = set()
-        error_files = set()
-        status = 0
-        templates = []
-        result = 'OK'
-        errors = []
-        try:
-          df = sdrf.SdrfDataFrame.parse(sdrf_file)
-          err = df.validate(sdrf_schema.DEFAULT_TEMPLATE)
-          err = remove_biological_replicates(err)
-          errors.extend(err)
-          if has_errors(err):
-            error_types.add('basic')
-          else:
-            templates = get_template(df)
-            if templates:
-              for t in templates:
-                err = df.validate(t)
-                err = remove_biological_replicates(err)
-                errors.extend(err)
-                if has_errors(err):
-                  error_types.add('{} template'.format(t))
-            err = df.validate(sdrf_schema.MASS_SPECTROMETRY)
-            err = remove_biological_replicates(err)
-            errors.extend(err)
-            if has_errors(err):
-              error_types.add('mass spectrometry')
-          if has_errors(errors):
-            error_files.add(os.path.basename(sdrf_file))
-        except:
-          print(sdrf_file)
-        if error_types:
-          result = 'Failed ' + ', '.join(error_types) + ' validation ({})'.format(', '.join(error_files))
-          status = 2
-        elif has_warnings(errors):
-          result = 'OK (with warnings)'
-          status = 1
-        if status < 2:
-          result = '[{} template]\t'.format(', '.join(templates) if templates else 'default') + result
-        statuses.append(status)
-        messages.append(result)
-        if args.verbose == 2:
-          for err in errors:
-            print(err)
-        elif args.verbose:
-          for w in collapse_warnings(errors):
-            print(w)
-          for err in errors:
-            if is_error(err):
-              print(err)
-        print(sdrf_file, result, sep='\t')
+      for res in iter_results(sdrf_files, args.jobs, cache_args, check, args.ols_url):
+        statuses.append(res['status'])
+        if res['cache']:
+          for k, v in res['cache'].items():
+            cache_stats[k] += v
+        stored += res['stored']
+        if args.report or args.junit:
+          entries.append(file_entry(res))
+        print_result(res, args.verbose)
         i += 1
     except KeyboardInterrupt:
         pass
@@ -201,12 +596,55 @@ def main(args):
         print('Final results:')
         print(f'Total: {i} of {len(sdrf_files)} projects checked, '
               f'{errors} had validation errors, {warnings} had validation warnings.')
+        if not args.no_cache:
+            print(f'OLS cache: {cache_stats["hits"]} hits, {cache_stats["misses"]} misses.')
+        if args.incremental:
+            print(f'Incremental: {stored} unchanged files answered from the result store, {i - stored} validated.')
+        wall_time = time.perf_counter() - start
+        if args.report:
+            write_json_report(args.report, entries, len(sdrf_files), wall_time, args.slowest,
+                              jobs=args.jobs, prepass=prepass, ols_cache=cache_stats, stored=stored)
+        if args.junit:
+            write_junit_report(args.junit, entries, wall_time)
     return errors
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-v', '--verbose', action='count', help='Print all errors. If specified twice, print all warnings.')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes used to validate files in parallel (default: 1).')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help='Directory of the persistent OLS lookup cache and result store (default: %(default)s).')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL_DAYS,
+                        help='Days after which cached OLS lookups are refreshed (default: %(default)s).')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the persistent OLS lookup cache.')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only validate files whose content changed since their last validation; '
+                             'results are kept in the cache directory.')
+    parser.add_argument('--no-prepass', action='store_true',
+                        help='Resolve organisms file by file instead of once for all files before validation.')
+    parser.add_argument('--ols-url', default=OLS_URL,
+                        help='OLS API used to resolve organisms (default: %(default)s).')
+    parser.add_argument('--ols-concurrency', type=int, default=8,
+                        help='Maximum number of concurrent OLS requests when resolving organisms (default: %(default)s).')
+    parser.add_argument('--all-rows', action='store_true',
+                        help='Validate every row instead of each distinct value per column once.')
+    parser.add_argument('--max-errors', type=int, default=DEFAULT_MAX_ERRORS,
+                        help='Maximum number of raw errors kept per file for printing (default: %(default)s).')
+    parser.add_argument('--report', help='Write a JSON report with per-file status, error counts and timings.')
+    parser.add_argument('--junit', help='Write a JUnit XML report with one test case per file.')
+    parser.add_argument('--slowest', type=int, default=10,
+                        help='Number of slowest files listed in the JSON report (default: %(default)s).')
+    parser.add_argument('--manifest',
+                        help='Manifest of the SDRF files to select from; built if missing '
+                             '(default: {} next to projects/).'.format(sdrf_manifest.MANIFEST_FILE))
+    parser.add_argument('--no-refresh-manifest', action='store_true',
+                        help='Select files from the stored manifest as is, without checking projects/ for new and '
+                             'changed SDRF files; files no longer present are still skipped.')
+    parser.add_argument('--rebuild-manifest', action='store_true',
+                        help='Scan every SDRF file again instead of reusing the manifest entries of unchanged files.')
+    sdrf_manifest.add_filter_arguments(parser)
     parser.add_argument('project', nargs='*')
     args = parser.parse_args()
     out = main(args)
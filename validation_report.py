@@ -0,0 +1,101 @@
+"""
+Machine-readable reports of a validate.py run: a JSON report with per-file status, error counts per
+template and wall time per validation phase, and an optional JUnit XML report for CI systems.
+"""
+
+import contextlib
+import datetime
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PHASES = ['parse', 'unique values', 'default', 'ontology', 'organism templates', 'mass spectrometry']
+
+
+@contextlib.contextmanager
+def timed(timings, phase):
+    """Add the wall time spent in the with-block to timings[phase]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+
+
+def peak_rss_kb():
+    """Peak resident set size of the current process in KB, or None if it cannot be determined."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def file_entry(res):
+    """The part of a validation result that goes into the report."""
+    return {
+        'file': res['file'],
+        'status': res['status'],
+        'result': res['result'],
+        'templates': res['templates'],
+        'crashed': res['crashed'],
+        'stored': res['stored'],
+        'time': round(sum(res.get('timings', {}).values()), 6),
+        'phases': {k: round(v, 6) for k, v in res.get('timings', {}).items()},
+        'template_counts': res.get('template_counts', {}),
+        # whether the cells were validated on the distinct values of each column (None if answered from the store)
+        'compressed': res.get('compressed'),
+        # peak RSS of the (worker) process, only for the files that raised it
+        'peak_rss_kb': res.get('peak_rss_kb'),
+        'peak_rss_increase_kb': res.get('peak_rss_increase_kb'),
+    }
+
+
+def write_json_report(path, entries, total, wall_time, slowest=10, **extra):
+    """Write the JSON report for the validated files in entries (from file_entry)."""
+    phase_totals = {phase: 0.0 for phase in PHASES}
+    for entry in entries:
+        for phase, t in entry['phases'].items():
+            phase_totals[phase] = phase_totals.get(phase, 0.0) + t
+    peaks = [e['peak_rss_kb'] for e in entries if e['peak_rss_kb'] is not None] + [peak_rss_kb() or 0]
+    report = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'total': total,
+        'checked': len(entries),
+        'errors': sum(e['status'] == 2 for e in entries),
+        'warnings': sum(e['status'] == 1 for e in entries),
+        'crashed': sum(e['crashed'] for e in entries),
+        'wall_time': round(wall_time, 6),
+        'files_per_second': round(len(entries) / wall_time, 3) if wall_time > 0 else None,
+        'peak_rss_kb': max(peaks),
+        'phase_totals': {k: round(v, 6) for k, v in phase_totals.items()},
+        'slowest': [{'file': e['file'], 'time': e['time']}
+                    for e in sorted(entries, key=lambda e: e['time'], reverse=True)[:slowest]],
+        'files': entries,
+    }
+    report.update(extra)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_junit_report(path, entries, wall_time):
+    """Write a JUnit XML report with one test case per validated file."""
+    suite = ET.Element('testsuite', name='sdrf-validation', tests=str(len(entries)),
+                       failures=str(sum(e['status'] == 2 and not e['crashed'] for e in entries)),
+                       errors=str(sum(e['crashed'] for e in entries)), time='{:.3f}'.format(wall_time))
+    for entry in entries:
+        case = ET.SubElement(suite, 'testcase', classname=os.path.dirname(entry['file']),
+                             name=os.path.basename(entry['file']), time='{:.3f}'.format(entry['time']))
+        if entry['crashed']:
+            ET.SubElement(case, 'error', message='Validation raised an exception')
+        elif entry['status'] == 2:
+            failure = ET.SubElement(case, 'failure', message=entry['result'])
+            failure.text = '\n'.join('{}: {} errors, {} warnings'.format(t, c['errors'], c['warnings'])
+                                     for t, c in entry['template_counts'].items())
+        elif entry['status'] == 1:
+            ET.SubElement(case, 'system-out').text = entry['result']
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)